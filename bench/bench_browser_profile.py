@@ -0,0 +1,80 @@
+"""Page-load time and Chrome memory with the lean browser profile on vs off.
+
+Usage (from the repository root):
+    python -m bench.bench_browser_profile [url ...]
+
+Each profile launches Chrome through ClassCardCore.setup_driver and loads every
+URL three times (default: the set and study pages of bench.replay_server; pass
+real ClassCard URLs to see the effect of image/font/analytics blocking). The
+table shows the median driver.get wall time, DOMContentLoaded and load event
+times from Navigation Timing, and the resident memory of chromedriver plus all
+Chrome processes (needs psutil). "default" is the regular windowed launch and
+needs a display. Needs a local Chrome.
+"""
+import contextlib
+import io
+import statistics
+import sys
+import time
+
+from bench.replay_server import CLASS_ID, ReplayServer, make_sets
+from browser_profile import BrowserProfile, chrome_rss, page_load_time
+from classcard_core import ClassCardCore
+
+PROFILES = [
+    ("default", False),
+    ("headless", BrowserProfile(block_resources=False, window_size=None, page_load_strategy=None)),
+    ("lean", BrowserProfile()),
+]
+REPEAT = 3
+
+
+def bench_profile(browser, urls: list):
+    core = ClassCardCore(word_cache=False, browser=browser, chrome_profile=False, cookie_jar=False)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            driver = core.setup_driver()
+    except Exception as e:
+        return f"launch failed: {str(e).splitlines()[0][:60]}"
+    walls, loaded, finished = [], [], []
+    try:
+        for _ in range(REPEAT):
+            for url in urls:
+                start = time.perf_counter()
+                driver.get(url)
+                walls.append(time.perf_counter() - start)
+                timing = page_load_time(driver)
+                if timing:
+                    loaded.append(timing[0])
+                    finished.append(timing[1])
+        rss = chrome_rss(driver)
+    finally:
+        driver.quit()
+    median = lambda values: statistics.median(values) * 1000 if values else float("nan")
+    memory = f"{rss / 2 ** 20:.0f}" if rss is not None else "n/a"
+    return median(walls), median(loaded), median(finished), memory
+
+
+def main(urls: list):
+    server = None
+    if not urls:
+        server = ReplayServer(make_sets([100])).start()
+        urls = [f"{server.base_url}/set/100/{CLASS_ID}"] + [
+            f"{server.base_url}/study/{mode}/100/{CLASS_ID}" for mode in ("rote", "recall", "spelling")
+        ]
+    try:
+        print(f"{'profile':<10}{'get(ms)':>10}{'DCL(ms)':>10}{'load(ms)':>10}{'RSS(MB)':>10}")
+        for name, browser in PROFILES:
+            result = bench_profile(browser, urls)
+            if isinstance(result, str):
+                print(f"{name:<10}  {result}")
+                continue
+            wall, loaded, finished, memory = result
+            print(f"{name:<10}{wall:>10.1f}{loaded:>10.1f}{finished:>10.1f}{memory:>10}")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
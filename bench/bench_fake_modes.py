@@ -0,0 +1,85 @@
+"""Run every learning mode against the in-process FakeDriver.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_fake_modes [num_cards ...]
+
+For each set size, ClassCardCore.run_* and the handler classes are driven end
+to end on a fake set; the table shows milliseconds and WebDriver commands per
+card, waits that never resolved, and how many answers the fake site graded
+correct. Handler/core logs are silenced.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.fixtures import make_words
+from classcard_core import ClassCardCore
+from handler.recall_learning import RecallLearning
+from handler.rote_learning import RoteLearning
+from handler.spelling_learning import SpellingLearning
+from handler.test_learning import TestLearning
+from selector_registry import SelectorRegistry
+
+SIZES = (20, 100)
+SET_ID, CLASS_ID = "100", "7"
+
+
+def _runners(core: ClassCardCore, registry: SelectorRegistry) -> list:
+    driver = core.driver
+    return [
+        ("core.recall", core.run_recall_learning, "recall"),
+        ("core.spelling", core.run_spelling_learning, "spelling"),
+        ("core.test", core.run_test_learning, "test"),
+        ("handler.rote", lambda num_d, word_d: RoteLearning(driver).run(num_d), "rote"),
+        ("handler.recall", RecallLearning(driver).run, "recall"),
+        ("handler.spelling", SpellingLearning(driver, registry).run, "spelling"),
+        ("handler.test", TestLearning(driver, registry).run, "test"),
+    ]
+
+
+def bench_size(num_cards: int, registry: SelectorRegistry) -> list:
+    rows = []
+    site = ClassCardSite({SET_ID: make_words(num_cards)})
+    driver = FakeDriver(site)
+    core = ClassCardCore(word_cache=False, chrome_profile=False, cookie_jar=False)
+    core.driver = driver
+    with contextlib.redirect_stdout(io.StringIO()):
+        num_d, word_d = core.get_words_for_set(SET_ID, CLASS_ID)
+    for name, run, mode in _runners(core, registry):
+        site.results.pop(mode, None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            core.open_set(SET_ID, CLASS_ID)
+        commands, timeouts = driver.command_count(), driver.wait_timeouts
+        start = time.perf_counter()
+        error = ""
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run(num_d, word_d)
+        except Exception as e:
+            error = str(e)[:40]
+        elapsed = time.perf_counter() - start
+        result = site.results.get(mode, {})
+        rows.append((
+            name, num_cards, elapsed * 1000 / num_cards,
+            (driver.command_count() - commands) / num_cards,
+            driver.wait_timeouts - timeouts,
+            result.get("correct", result.get("known", 0)), error,
+        ))
+    return rows
+
+
+def main(sizes: list):
+    registry = SelectorRegistry(os.path.join(tempfile.mkdtemp(), "selector_stats.json"))
+    print(f"{'runner':<18}{'cards':>6}{'ms/card':>10}{'cmds/card':>11}{'timeouts':>10}{'correct':>9}  error")
+    for num_cards in sizes or SIZES:
+        for name, cards, ms, commands, timeouts, correct, error in bench_size(num_cards, registry):
+            print(f"{name:<18}{cards:>6}{ms:>10.2f}{commands:>11.1f}{timeouts:>10}{correct:>9}  {error}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
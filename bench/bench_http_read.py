@@ -0,0 +1,81 @@
+"""Browser-free HTTP reads of classes, sets and word lists against the replay server.
+
+Usage (from the repository root, needs lxml and cssselect for the browser side):
+    python -m bench.bench_http_read [num_cards ...]
+
+Starts bench.replay_server with require_login=True, logs in through
+http_client.ClassCardClient (checking that a bad password is refused and that
+reads fail before login), then reads every page with http_reader.HttpReader and
+with the ClassCardCore browser path on FakeDriver. The table shows the time per
+read and whether both paths returned the same dicts / word lists.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.replay_server import BAD_PASSWORD, CLASS_ID, SIZES, ReplayServer, make_sets
+from classcard_core import ClassCardCore
+from http_client import ClassCardClient
+from http_reader import HttpReader
+
+
+def _timed(func):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _rows(reader: HttpReader, core: ClassCardCore, set_ids: list) -> list:
+    reads = [
+        ("classes", reader.get_classes, core.get_classes),
+        ("sets", lambda: reader.get_sets(CLASS_ID), lambda: core.get_sets(CLASS_ID)),
+    ]
+    for set_id in set_ids:
+        reads.append((
+            f"words {set_id}",
+            lambda set_id=set_id: reader.get_words(set_id, CLASS_ID),
+            lambda set_id=set_id: core.get_words_for_set(set_id, CLASS_ID),
+        ))
+    rows = []
+    for name, http_read, browser_read in reads:
+        http_result, http_ms = _timed(http_read)
+        browser_result, browser_ms = _timed(browser_read)
+        if name.startswith("words"):  # WordBank 는 (영어, 뜻, 뜻+예문) 리스트로 비교
+            same = http_result is not None and http_result[0] == browser_result[0] and list(http_result[1]) == list(browser_result[1])
+        else:
+            same = http_result == browser_result
+        rows.append((name, http_ms, browser_ms, same))
+    return rows
+
+
+def main(sizes: list):
+    sets = make_sets(sizes or SIZES)
+    with ReplayServer(sets, require_login=True) as server:
+        client = ClassCardClient(server.base_url, os.path.join(tempfile.mkdtemp(), "cookies.json"))
+        reader = HttpReader(client)
+        with contextlib.redirect_stdout(io.StringIO()):
+            anonymous = reader.get_classes()
+            refused = not client.login("bench", BAD_PASSWORD)
+            logged_in = client.login("bench", "bench")
+        print(f"[INFO] 로그인 전 읽기 차단: {anonymous is None}, 잘못된 비밀번호 거부: {refused}, 로그인: {logged_in}")
+        if not logged_in:
+            return
+        reused = ClassCardClient(server.base_url, client.cookie_path)
+        print(f"[INFO] 저장된 쿠키로 인증 유지: {reused.is_authenticated()} (로그인 요청 {server.logins}회)")
+
+        core = ClassCardCore(word_cache=False, chrome_profile=False, cookie_jar=False)
+        core.driver = FakeDriver(ClassCardSite(sets, {CLASS_ID: server.classes[CLASS_ID]}))
+        core.driver.get(f"{core.base_url}/Main")  # 브라우저 경로는 로그인 후 메인 화면에서 시작
+        print(f"{'read':<12}{'http(ms)':>10}{'browser(ms)':>13}  same")
+        for name, http_ms, browser_ms, same in _rows(reader, core, list(sets)):
+            print(f"{name:<12}{http_ms:>10.1f}{browser_ms:>13.1f}  {same}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,85 @@
+"""Compare single-call get_sets/get_classes extraction with the per-element path.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_list_extract [num_sets ...]
+
+For each class size the class page is listed with ClassCardCore's
+per-element fallback (_get_sets_legacy / _get_classes_legacy) and with the
+one-script path (utility.SET_LIST_SCRIPT / CLASS_LIST_SCRIPT). FakeDriver
+gives WebDriver command counts; with a local Chrome the same pages are also
+timed in a real browser through bench.replay_server.
+"""
+import contextlib
+import io
+import sys
+import time
+
+from bench.bench_word_extract import start_chrome
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.replay_server import CLASS_ID, ReplayServer
+from classcard_core import ClassCardCore
+from utility import class_list_script, set_list_script
+
+SIZES = (10, 80, 200)
+NUM_CLASSES = 8
+
+
+def make_listing(num_sets: int) -> tuple:
+    sets = {str(1000 + i): [("word", "뜻", "")] * (10 + i % 20) for i in range(num_sets)}
+    classes = {str(i + 1): f"클래스 {i + 1}" for i in range(NUM_CLASSES)}  # CLASS_ID 는 "1"
+    return sets, classes
+
+
+def _measure(driver, func, commands=None) -> tuple:
+    before = commands() if commands else 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return result, (time.perf_counter() - start) * 1000, (commands() - before) if commands else None
+
+
+def bench_driver(core: ClassCardCore, base_url: str, commands=None) -> list:
+    driver = core.driver
+    rows = []
+    driver.get(f"{base_url}/ClassMain/{CLASS_ID}")
+    legacy = _measure(driver, core._get_sets_legacy, commands)
+    script = _measure(driver, lambda: set_list_script(driver), commands)
+    rows.append(("sets", legacy, script))
+    driver.get(f"{base_url}/Main")
+    legacy = _measure(driver, core._get_classes_legacy, commands)
+    script = _measure(driver, lambda: class_list_script(driver), commands)
+    rows.append(("classes", legacy, script))
+    return rows
+
+
+def _print(label: str, num_sets: int, rows: list):
+    for name, (legacy, legacy_ms, legacy_cmds), (script, script_ms, script_cmds) in rows:
+        cmds = f"{legacy_cmds:>8}{script_cmds:>8}" if legacy_cmds is not None else f"{'-':>8}{'-':>8}"
+        print(f"{label:<8}{num_sets:>6}  {name:<9}{legacy_ms:>11.1f}{script_ms:>11.1f}{cmds}  {legacy == script}")
+
+
+def main(sizes: list):
+    sizes = sizes or SIZES
+    print(f"{'driver':<8}{'sets':>6}  {'list':<9}{'legacy(ms)':>11}{'script(ms)':>11}{'cmds':>8}{'cmds':>8}  same")
+    for num_sets in sizes:
+        sets, classes = make_listing(num_sets)
+        core = ClassCardCore(word_cache=False, chrome_profile=False, cookie_jar=False)
+        core.driver = FakeDriver(ClassCardSite(sets, classes))
+        _print("fake", num_sets, bench_driver(core, core.base_url, core.driver.command_count))
+    driver = start_chrome()
+    if driver is None:
+        return
+    try:
+        for num_sets in sizes:
+            sets, classes = make_listing(num_sets)
+            with ReplayServer(sets, classes) as server:
+                core = ClassCardCore(word_cache=False, base_url=server.base_url, chrome_profile=False, cookie_jar=False)
+                core.driver = driver
+                _print("chrome", num_sets, bench_driver(core, server.base_url))
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
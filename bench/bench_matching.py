@@ -0,0 +1,99 @@
+"""Answer lookup on card text that differs from the scraped word list.
+
+Usage (from the repository root):
+    python -m bench.bench_matching [num_words]
+
+A WordBank is built from bench.fixtures.make_words. Every word's English
+side is looked up as it is and as the variants the site shows in practice:
+extra whitespace, punctuation, a part-of-speech note in parentheses, an
+attached example line, full-width (NFKC) characters, upper case and a one
+letter typo. "exact" is the whitespace-normalised dictionary lookup that
+WordBank used before; "matched" is WordBank.answer_for with canonical and
+fuzzy matching. Each miss used to end the mode with an unknown word (exit,
+reload, re-scrape). Typos are only forgiven on keys of CHARS_PER_EDIT
+characters or more, so the typo row misses the short words. The last row
+looks up words that are not in the set, including other numbers of numbered
+words, and must stay unanswered. check_near_neighbours() asserts that common
+vocabulary pairs one or two edits apart (effect / affect, 먹다 / 먹이다) are
+never taken for each other.
+"""
+import contextlib
+import io
+import sys
+import time
+
+from bench.fixtures import make_words
+from word_bank import CHARS_PER_EDIT, WordBank, normalize_key
+
+VARIANTS = {
+    "as is": lambda word: word,
+    "spaces": lambda word: f"  {word.replace(' ', '  ')} ",
+    "punctuation": lambda word: f"{word}.",
+    "parentheses": lambda word: f"{word} (v.)",
+    "example line": lambda word: f"{word}\nThis is an example sentence.",
+    "full-width": lambda word: "".join(chr(ord(c) + 0xFEE0) if "!" <= c <= "~" else c for c in word),
+    "upper case": lambda word: word.upper(),
+    "typo": lambda word: word[:2] + word[3:] if len(word) > 4 else word,
+}
+
+# (세트에 있는 단어, 뜻, 세트에 없는 비슷한 단어)
+NEAR_NEIGHBOURS = [
+    ("affect", "영향을 미치다", "effect"),
+    ("adopt", "채택하다", "adapt"),
+    ("accept", "받아들이다", "except"),
+    ("desert", "사막", "dessert"),
+    ("lose", "잃다", "loose"),
+    ("later", "나중에", "latter"),
+    ("quiet", "조용한", "quite"),
+    ("quiet", "조용한", "quit"),
+    ("feed", "먹이다", "먹다"),
+    ("teach", "가르치다", "가리키다"),
+]
+
+
+def check_near_neighbours():
+    """Each set word must not answer its near neighbour, on either side of the card."""
+    for english, korean, other in NEAR_NEIGHBOURS:
+        bank = WordBank.from_word_d([[english, "weather"], [korean, "날씨"], ["", ""]])
+        entry, _, score = bank.match(other)
+        assert entry is None, f"{other!r} matched {entry!r} ({score:.2f})"
+        assert bank.answer_for(other) is None, other
+        assert bank.choose(other, [korean, "날씨"]) is None, other
+    print(f"[INFO] 비슷한 단어 {len(NEAR_NEIGHBOURS)}쌍: 오인 없음")
+
+
+def _exact(bank: WordBank, prompt: str):
+    entry = bank._by_english.get(normalize_key(prompt))
+    return entry.korean if entry else None
+
+
+def _measure(lookup, prompts: list) -> tuple:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        answers = [lookup(prompt) for prompt, _ in prompts]
+        elapsed = time.perf_counter() - start
+    right = sum(answer == expected for answer, (_, expected) in zip(answers, prompts))
+    wrong = sum(answer is not None and answer != expected for answer, (_, expected) in zip(answers, prompts))
+    return right, wrong, elapsed * 1e6 / len(prompts)
+
+
+def main(args: list):
+    num_words = int(args[0]) if args else 80
+    words = make_words(num_words)
+    bank = WordBank.from_word_d([[w[0] for w in words], [w[1] for w in words], [w[2] for w in words]])
+    check_near_neighbours()
+    print(f"[INFO] 단어 {num_words}개, 유사 매칭은 {CHARS_PER_EDIT}자당 편집 1회까지")
+    print(f"{'variant':<14}{'exact ok':>9}{'matched ok':>11}{'wrong':>7}{'exact(us)':>11}{'matched(us)':>12}")
+    for name, variant in VARIANTS.items():
+        prompts = [(variant(english), korean) for english, korean, _ in words]
+        exact_ok, _, exact_us = _measure(lambda prompt: _exact(bank, prompt), prompts)
+        matched_ok, wrong, matched_us = _measure(bank.answer_for, prompts)
+        print(f"{name:<14}{exact_ok:>9}{matched_ok:>11}{wrong:>7}{exact_us:>11.1f}{matched_us:>12.1f}")
+    unknown = [("banana", None), ("library card", None), ("날씨 좋은", None)]
+    unknown += [(f"{english.split()[0]} {num_words}", None) for english, _, _ in words[:8]]
+    _, wrong, matched_us = _measure(bank.answer_for, unknown)
+    print(f"{'not in set':<14}{'-':>9}{len(unknown) - wrong:>11}{wrong:>7}{'-':>11}{matched_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
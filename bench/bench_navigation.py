@@ -0,0 +1,56 @@
+"""Page loads in a range run with and without the navigator's page-state tracking.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_navigation [num_sets] [num_cards]
+
+ClassCardCore.run_range_automation_with_stop drives FakeDriver through
+num_sets sets (recall, spelling, test). "always" forces a reload on every
+goto, which is what the core did before the navigator tracked the current
+page. "tracked" skips loads when the browser is already on the target page,
+e.g. back on the set page after a mode's 학습종료. Each row gives page loads
+(driver.get), skipped loads and total WebDriver commands. Every skipped load
+saves one full page load in a real browser (see bench.bench_browser_profile).
+"""
+import contextlib
+import io
+import sys
+
+from selenium.webdriver.remote.command import Command
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.fixtures import make_words
+from classcard_core import ClassCardCore
+
+CLASS_ID = "1"
+MODES = ["recall", "spelling", "test"]
+
+
+def bench_range(sets: dict, tracked: bool) -> tuple:
+    core = ClassCardCore(word_cache=False, trace=False, chrome_profile=False, cookie_jar=False, ledger=False,
+                         prefetch=0, skip_complete=False)
+    core.driver = FakeDriver(ClassCardSite(sets))
+    if not tracked:
+        core.navigator.at = lambda driver, url, page: False
+    set_ids = sorted(int(set_id) for set_id in sets)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = core.run_range_automation_with_stop(CLASS_ID, set_ids[0], set_ids[-1], MODES, None)
+    done = sum(1 for data in results.values() for r in data["results"].values() if r["percentage"] >= 100)
+    commands = core.driver.commands
+    return commands[Command.GET], core.navigator.saved, core.driver.command_count(), done
+
+
+def main(args: list):
+    num_sets = int(args[0]) if args else 5
+    num_cards = int(args[1]) if len(args) > 1 else 10
+    sets = {str(100 + i): make_words(num_cards) for i in range(num_sets)}
+    print(f"[INFO] 세트 {num_sets}개 x 모드 {len(MODES)}개, 세트당 카드 {num_cards}개")
+    print(f"{'goto':<9}{'loads':>7}{'skipped':>9}{'commands':>10}{'modes done':>12}")
+    for tracked in (False, True):
+        loads, saved, commands, done = bench_range(sets, tracked)
+        name = "tracked" if tracked else "always"
+        print(f"{name:<9}{loads:>7}{saved:>9}{commands:>10}{done:>9}/{num_sets * len(MODES)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
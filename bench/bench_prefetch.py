@@ -0,0 +1,80 @@
+"""Range run with and without background word prefetching.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_prefetch [latency_seconds] [study_seconds] [num_sets]
+
+ClassCardCore.run_range_automation_with_stop drives FakeDriver through
+num_sets sets (recall + spelling) while word lists are read over HTTP from
+bench.replay_server, which adds latency_seconds to every response. Each mode
+additionally sleeps study_seconds, standing in for the real learning time the
+prefetch overlaps with. Each row is one lookahead setting (0 = no prefetch):
+total wall time and the time spent waiting for word lists in load_words.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.replay_server import CLASS_ID, ReplayServer, make_sets
+from classcard_core import ClassCardCore
+
+LOOKAHEADS = (0, 1, 2)
+MODES = ["recall", "spelling"]
+
+
+def _slowed(func, seconds: float):
+    def run(*args):
+        time.sleep(seconds)
+        return func(*args)
+    return run
+
+
+def bench_range(server: ReplayServer, sets: dict, lookahead: int, study: float) -> tuple:
+    directory = tempfile.mkdtemp()
+    core = ClassCardCore(word_cache=False, base_url=server.base_url, trace=False,
+                         chrome_profile=os.path.join(directory, "profile"),
+                         cookie_jar=os.path.join(directory, "cookies.json"), prefetch=lookahead,
+                         ledger=False, skip_complete=False)
+    core.driver = FakeDriver(ClassCardSite(sets, server.classes))
+    core.run_recall_learning = _slowed(core.run_recall_learning, study)
+    core.run_spelling_learning = _slowed(core.run_spelling_learning, study)
+    waits = []
+    load_words = core.load_words
+
+    def timed_load_words(set_id, class_id):
+        start = time.perf_counter()
+        try:
+            return load_words(set_id, class_id)
+        finally:
+            waits.append(time.perf_counter() - start)
+
+    core.load_words = timed_load_words
+    set_ids = sorted(int(set_id) for set_id in sets)
+    with contextlib.redirect_stdout(io.StringIO()):
+        core.login("bench", "bench")
+        start = time.perf_counter()
+        results = core.run_range_automation_with_stop(CLASS_ID, set_ids[0], set_ids[-1], MODES, None)
+    elapsed = time.perf_counter() - start
+    done = sum(1 for data in results.values() for r in data["results"].values() if r["percentage"] >= 100)
+    return elapsed, sum(waits), done
+
+
+def main(args: list):
+    latency = float(args[0]) if args else 0.3
+    study = float(args[1]) if len(args) > 1 else 0.5
+    num_sets = int(args[2]) if len(args) > 2 else 5
+    sets = make_sets([20 + i for i in range(num_sets)])
+    with ReplayServer(sets, latency=latency) as server:
+        print(f"[INFO] 응답 지연 {latency:.2f}s, 모드당 학습 {study:.2f}s, 세트 {num_sets}개")
+        print(f"{'lookahead':<10}{'wall(s)':>9}{'words(s)':>10}{'modes done':>12}")
+        for lookahead in LOOKAHEADS:
+            elapsed, waited, done = bench_range(server, sets, lookahead, study)
+            print(f"{lookahead:<10}{elapsed:>9.2f}{waited:>10.2f}{done:>9}/{len(sets) * len(MODES)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
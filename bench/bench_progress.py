@@ -0,0 +1,101 @@
+"""Range re-run with and without the set-page progress probe.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_progress [num_sets] [done_sets] [study_seconds]
+
+The first done_sets sets of the range show recall and spelling at 100% on
+their set page (bench.fixtures renders the percentages into the study menu).
+ClassCardCore.run_range_automation_with_stop drives FakeDriver through the
+range; each mode sleeps study_seconds to stand in for real learning time.
+"http" reads set pages from bench.replay_server (with prefetch), "browser"
+has no HTTP session and reads everything through the browser. Each row is one
+path and setting of skip_complete: wall time, load_words calls, modes
+actually run, browser page loads (driver.get) and set pages fetched over HTTP.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from selenium.webdriver.remote.command import Command
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.replay_server import CLASS_ID, ReplayServer, make_sets
+from classcard_core import ClassCardCore
+from progress import parse_progress
+from utility import make_soup
+
+MODES = ["recall", "spelling"]
+
+
+def _counted(func, calls: list, seconds: float = 0.0):
+    def run(*args):
+        calls.append(args)
+        time.sleep(seconds)
+        return func(*args)
+    return run
+
+
+def bench_range(server: ReplayServer, sets: dict, progress: dict, skip: bool, study: float, http: bool) -> tuple:
+    directory = tempfile.mkdtemp()
+    core = ClassCardCore(word_cache=False, base_url=server.base_url, trace=False,
+                         chrome_profile=os.path.join(directory, "profile"),
+                         cookie_jar=os.path.join(directory, "cookies.json") if http else False,
+                         ledger=False, skip_complete=skip)
+    core.driver = FakeDriver(ClassCardSite(sets, server.classes, progress=progress))
+    loads, modes = [], []
+    core.load_words = _counted(core.load_words, loads)
+    core.run_recall_learning = _counted(core.run_recall_learning, modes, study)
+    core.run_spelling_learning = _counted(core.run_spelling_learning, modes, study)
+    set_ids = sorted(int(set_id) for set_id in sets)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if http:
+            core.login("bench", "bench")
+        gets, requests = core.driver.commands[Command.GET], server.requests
+        start = time.perf_counter()
+        results = core.run_range_automation_with_stop(CLASS_ID, set_ids[0], set_ids[-1], MODES, None)
+    elapsed = time.perf_counter() - start
+    done = sum(1 for data in results.values() for r in data["results"].values() if r["percentage"] >= 100)
+    # 범위 실행 중 HTTP 요청은 세트 목록 1회를 빼면 모두 세트 페이지
+    http_pages = max(0, server.requests - requests - 1) if http else 0
+    return elapsed, len(loads), len(modes), core.driver.commands[Command.GET] - gets, http_pages, done
+
+
+def check_parser(sets: dict, progress: dict):
+    """parse_progress against the rendered set pages, including ones without any percentage."""
+    site = ClassCardSite(sets, progress=progress)
+    driver = FakeDriver(site)
+    wrong = 0
+    for set_id in sets:
+        driver.get(f"https://www.classcard.net/set/{set_id}/{CLASS_ID}")
+        found = parse_progress(make_soup(driver.page_source))
+        expected = {mode: progress.get(set_id, {}).get(mode) for mode in found}
+        wrong += found != expected
+    print(f"[INFO] 진행률 파싱: 세트 {len(sets)}개 중 불일치 {wrong}개")
+
+
+def main(args: list):
+    num_sets = int(args[0]) if args else 6
+    done_sets = int(args[1]) if len(args) > 1 else 4
+    study = float(args[2]) if len(args) > 2 else 0.2
+    sets = make_sets([20 + i for i in range(num_sets)])
+    progress = {set_id: {"rote": 100, "recall": 100, "spelling": 200, "test": 90}
+                for set_id in sorted(sets)[:done_sets]}
+    progress.update({set_id: {"recall": 40} for set_id in sorted(sets)[done_sets:done_sets + 1]})
+    check_parser(sets, progress)
+    with ReplayServer(sets, progress=progress) as server:
+        print(f"[INFO] 세트 {num_sets}개 중 {done_sets}개 완료 상태, 모드당 학습 {study:.2f}s")
+        print(f"{'path':<9}{'skip_complete':<14}{'wall(s)':>9}{'loads':>7}{'modes run':>11}"
+              f"{'driver.get':>12}{'http pages':>12}{'modes done':>12}")
+        for http in (True, False):
+            for skip in (False, True):
+                elapsed, loads, modes, gets, pages, done = bench_range(server, sets, progress, skip, study, http)
+                print(f"{'http' if http else 'browser':<9}{str(skip):<14}{elapsed:>9.2f}{loads:>7}{modes:>11}"
+                      f"{gets:>12}{pages:>12}{done:>9}/{num_sets * len(MODES)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
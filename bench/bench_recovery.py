@@ -0,0 +1,109 @@
+"""Mode recovery after card failures: retry in place vs. re-entering the set.
+
+Usage (from the repository root, needs lxml and cssselect):
+    python -m bench.bench_recovery [num_cards] [failing_card]
+
+ClassCardCore.run_multiple_modes studies one set (recall + spelling) on
+FakeDriver while a failure is injected at failing_card of the recall mode:
+
+  stale xN   the card's prompt raises StaleElementReferenceException N times
+             (1-2: retried on the same card, 3+: the mode stops and resumes
+             from that card because the learn page is still open)
+  words      the scraped word list is out of date for that card; with the
+             HTTP session the words are re-read without leaving the learn page,
+             without it the mode exits, re-scrapes and starts over
+
+Each row shows wall time, WebDriver commands, recall cards the fake site
+graded (more than num_cards means cards were answered twice) and the result.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from bench.fake_driver import FakeDriver
+from bench.fake_site import ClassCardSite
+from bench.replay_server import CLASS_ID, ReplayServer
+from bench.fixtures import make_words
+from classcard_core import LEARN_PROMPT, ClassCardCore
+from recovery import Backoff
+from word_bank import WordBank
+
+SET_ID = "100"
+MODES = ["recall", "spelling"]
+
+
+class FlakyDriver(FakeDriver):
+    """FakeDriver whose find_element fails ``failures`` times for one locator."""
+
+    def __init__(self, site, target: str, failures: int):
+        super().__init__(site)
+        self.target = target
+        self.failures = failures
+
+    def find_element(self, by=By.ID, value=None):
+        if value == self.target and self.failures > 0:
+            self.failures -= 1
+            raise StaleElementReferenceException(f"stale element: {value}")
+        return super().find_element(by, value)
+
+
+def _stale_once(get_words, card: int):
+    calls = []
+
+    def run(set_id, class_id):
+        num_d, bank = get_words(set_id, class_id)
+        calls.append(set_id)
+        if len(calls) > 1:
+            return num_d, bank
+        english, korean, example = (list(side) for side in bank)
+        english[card - 1] = "outdated"
+        return num_d, WordBank.from_word_d([english, korean, example])
+    return run
+
+
+def run_case(sets: dict, card: int, failures: int = 0, stale_words: bool = False, server=None) -> tuple:
+    directory = tempfile.mkdtemp()
+    core = ClassCardCore(word_cache=False, base_url=server.base_url if server else "https://www.classcard.net",
+                         trace=False, chrome_profile=False, ledger=False, prefetch=0, skip_complete=False,
+                         cookie_jar=os.path.join(directory, "cookies.json") if server else False)
+    site = ClassCardSite(sets, server.classes if server else None)
+    core.driver = FlakyDriver(site, LEARN_PROMPT.format(n=card), failures)
+    core.backoff = Backoff(base=0.05)
+    if stale_words:
+        core.get_words_for_set = _stale_once(core.get_words_for_set, card)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if server:
+            core.login("bench", "bench")
+        commands = core.driver.command_count()
+        start = time.perf_counter()
+        results = core.run_multiple_modes(SET_ID, CLASS_ID, MODES)
+    elapsed = time.perf_counter() - start
+    graded = sum(site.results.get("recall", {}).values())
+    percent = "/".join(f"{results[mode]['percentage']:.0f}" if mode in results else "-" for mode in MODES)
+    return elapsed, core.driver.command_count() - commands, graded, percent
+
+
+def main(args: list):
+    num_cards = int(args[0]) if args else 30
+    card = int(args[1]) if len(args) > 1 else 20
+    sets = {SET_ID: make_words(num_cards)}
+    print(f"[INFO] 카드 {num_cards}개, 리콜 카드 {card}에서 실패")
+    print(f"{'case':<18}{'wall(ms)':>10}{'cmds':>7}{'graded':>8}  recall/spelling %")
+    cases = [("none", {}), ("stale x1", {"failures": 1}), ("stale x3", {"failures": 3}),
+             ("words (browser)", {"stale_words": True})]
+    for name, options in cases:
+        elapsed, commands, graded, percent = run_case(sets, card, **options)
+        print(f"{name:<18}{elapsed * 1000:>10.0f}{commands:>7}{graded:>8}  {percent}")
+    with ReplayServer(sets, {CLASS_ID: "클래스"}) as server:
+        elapsed, commands, graded, percent = run_case(sets, card, stale_words=True, server=server)
+        print(f"{'words (http)':<18}{elapsed * 1000:>10.0f}{commands:>7}{graded:>8}  {percent}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
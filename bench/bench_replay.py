@@ -0,0 +1,85 @@
+"""End-to-end benchmark of every learning mode against the local replay site.
+
+Usage (from the repository root):
+    python -m bench.bench_replay [num_cards ...]
+
+Starts bench.replay_server, logs in with headless Chrome through
+ClassCardCore(base_url=...), then for each set size times get_words_for_set and
+every mode (rote via the handler, recall/spelling/test via ClassCardCore). The
+table shows seconds per card, WebDriver commands per card and wall time; the
+last row per size is the total, followed by the hottest WebDriver call sites
+(driver_profiler). Needs a local Chrome.
+"""
+import contextlib
+import io
+import sys
+import time
+
+from bench.bench_word_extract import start_chrome
+from bench.replay_server import CLASS_ID, SIZES, ReplayServer, make_sets
+from classcard_core import ClassCardCore
+from driver_profiler import DriverProfiler
+from handler.rote_learning import RoteLearning
+
+
+def _steps(core: ClassCardCore) -> list:
+    return [
+        ("rote", lambda num_d, word_d: RoteLearning(core.driver).run(num_d)),
+        ("recall", core.run_recall_learning),
+        ("spelling", core.run_spelling_learning),
+        ("test", core.run_test_learning),
+    ]
+
+
+def _timed(profiler: DriverProfiler, func):
+    before = profiler.total()[0]
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return result, time.perf_counter() - start, profiler.total()[0] - before
+
+
+def bench_set(core: ClassCardCore, profiler: DriverProfiler, set_id: str) -> list:
+    rows = []
+    (num_d, word_d), seconds, commands = _timed(profiler, lambda: core.get_words_for_set(set_id, CLASS_ID))
+    rows.append(("words", seconds, commands))
+    for name, run in _steps(core):
+        core.open_set(set_id, CLASS_ID)
+        try:
+            _, seconds, commands = _timed(profiler, lambda: run(num_d, word_d))
+        except Exception as e:
+            print(f"[WARNING] {name} 실패 ({set_id}장): {e}")
+            continue
+        rows.append((name, seconds, commands))
+    rows.append(("total", sum(row[1] for row in rows), sum(row[2] for row in rows)))
+    return rows
+
+
+def main(sizes: list):
+    sizes = sizes or SIZES
+    driver = start_chrome()
+    if driver is None:
+        return
+    profiler = DriverProfiler().install(driver)
+    try:
+        with ReplayServer(make_sets(sizes)) as server:
+            core = ClassCardCore(word_cache=False, base_url=server.base_url, chrome_profile=False, cookie_jar=False)
+            core.driver = driver
+            with contextlib.redirect_stdout(io.StringIO()):
+                logged_in = core.login("bench", "bench")
+            if not logged_in:
+                print("[ERROR] 재현 사이트 로그인 실패")
+                return
+            profiler.reset()
+            for size in sizes:
+                print(f"{'cards':>6}  {'step':<10}{'wall(s)':>9}{'s/card':>9}{'cmds/card':>11}")
+                for name, seconds, commands in bench_set(core, profiler, str(size)):
+                    print(f"{size:>6}  {name:<10}{seconds:>9.2f}{seconds / size:>9.3f}{commands / size:>11.1f}")
+                print(profiler.report(f"{size}장 세트"))
+                profiler.reset()
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]])
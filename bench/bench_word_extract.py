@@ -0,0 +1,88 @@
+"""Compare page_source parsing with the WebDriver word_get path.
+
+Usage (from the repository root):
+    python -m bench.bench_word_extract [saved_set_page.html ...]
+
+Without arguments, synthetic set pages of 10, 100 and 1,000 cards are used.
+The WebDriver path needs a local Chrome; it is skipped when none is available.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from bench.fixtures import make_set_page, make_words
+from utility import HTML_PARSERS, make_soup, word_get, word_parse
+
+SIZES = (10, 100, 1000)
+
+
+def _best_of(func, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_parse(page: str, num_d: int) -> dict:
+    results = {}
+    for parser in HTML_PARSERS:
+        soup = make_soup(page, parser)
+        if soup.builder.NAME != parser:  # 미설치 백엔드
+            continue
+        results[parser] = _best_of(lambda: word_parse(page, num_d, parser))
+    return results
+
+
+def bench_webdriver(driver, page: str, num_d: int):
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        f.write(page)
+        path = f.name
+    try:
+        driver.get("file://" + path)
+        return _best_of(lambda: word_get(driver, num_d), repeat=1)
+    finally:
+        os.unlink(path)
+
+
+def start_chrome():
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        options.add_argument("--headless=new")
+        return webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"[INFO] WebDriver path skipped (Chrome unavailable): {e}")
+        return None
+
+
+def main(paths: list):
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                page = f.read()
+            pages.append((os.path.basename(path), page))
+    else:
+        pages = [(f"{size} cards", make_set_page(make_words(size))) for size in SIZES]
+    driver = start_chrome()
+    print(f"{'page':<20}{'cards':>7}  {'backend':<14}{'seconds':>10}")
+    try:
+        for name, page in pages:
+            num_d = len(make_soup(page).find("div", class_="flip-body").find_all("div", class_="flip-card"))
+            for parser, seconds in bench_parse(page, num_d).items():
+                print(f"{name:<20}{num_d:>7}  {parser:<14}{seconds:>10.4f}")
+            if driver is not None:
+                seconds = bench_webdriver(driver, page, num_d)
+                print(f"{name:<20}{num_d:>7}  {'webdriver':<14}{seconds:>10.4f}")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
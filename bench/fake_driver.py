@@ -0,0 +1,463 @@
+"""In-process stand-in for selenium's Chrome driver, backed by an lxml DOM.
+
+Pages and their click behaviour come from a site object (see bench.fake_site),
+so handler and ClassCardCore logic can run offline in milliseconds:
+
+    driver = FakeDriver(ClassCardSite({"100": make_words(20)}))
+    core.driver = driver
+
+Supported: find_element(s) with every By strategy, element .text/.click()/
+.send_keys()/get_attribute(), page_source, get/back/refresh, and the
+repository's own scripts (probe.PROBE_SCRIPT, waits.WAIT_SCRIPT). Waits never
+sleep: the DOM only changes inside click()/send_keys(), so a condition that
+does not hold when the wait starts would never hold, and it returns -1 at once.
+Every call is counted in ``driver.commands`` under selenium's Command names.
+"""
+import re
+from collections import Counter
+from urllib.parse import urlsplit
+
+from cssselect import HTMLTranslator
+from lxml import etree, html as lxml_html
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from probe import PROBE_SCRIPT
+from waits import WAIT_SCRIPT
+
+_BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "body", "dd", "div", "dl", "dt", "fieldset",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "html",
+    "li", "main", "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "th", "tr", "ul",
+))
+_NEVER_RENDERED = frozenset(("head", "script", "style", "template", "noscript", "title", "meta"))
+_translator = HTMLTranslator()
+_compiled = {}  # (by, value, scope) → etree.XPath
+
+
+def _is_element(node) -> bool:
+    return isinstance(node, etree._Element) and isinstance(node.tag, str)
+
+
+def _style_hidden(node) -> bool:
+    style = node.get("style", "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def _self_rendered(node) -> bool:
+    if node.tag in _NEVER_RENDERED or node.get("hidden") is not None or _style_hidden(node):
+        return False
+    return not (node.tag == "input" and node.get("type", "").lower() == "hidden")
+
+
+def displayed(node) -> bool:
+    return all(_self_rendered(n) for n in node.iterancestors()) and _self_rendered(node)
+
+
+def layout_text(node, skip_hidden: bool = True) -> str:
+    """Text with block elements and <br> as line breaks, whitespace collapsed per line."""
+    parts = []
+
+    def walk(el):
+        if skip_hidden and not _self_rendered(el):
+            return
+        if el.tag in ("script", "style"):
+            return
+        block = el.tag in _BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if el.tag == "br":
+            parts.append("\n")
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            if _is_element(child):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def rendered_text(node) -> str:  # selenium getVisibleText 와 같은 규칙
+    return layout_text(node) if displayed(node) else ""
+
+
+def inner_text(node) -> str:  # 브라우저 innerText: 렌더링되지 않은 요소는 textContent
+    return rendered_text(node) if displayed(node) else node.text_content()
+
+
+def set_displayed(node, shown: bool):
+    style = [rule for rule in node.get("style", "").split(";")
+             if rule.strip() and rule.split(":")[0].strip().lower() != "display"]
+    if not shown:
+        style.append("display:none")
+    if style:
+        node.set("style", ";".join(style))
+    elif "style" in node.attrib:
+        del node.attrib["style"]
+
+
+def add_class(node, name: str):
+    classes = node.get("class", "").split()
+    if name not in classes:
+        node.set("class", " ".join(classes + [name]))
+
+
+def remove_class(node, name: str):
+    node.set("class", " ".join(c for c in node.get("class", "").split() if c != name))
+
+
+def _xpath_for(by: str, value: str, scope: str) -> etree.XPath:
+    key = (by, value, scope)
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        return compiled
+    if by == By.XPATH:
+        expression = value
+    else:
+        if by == By.ID:
+            css = f'[id="{value}"]'
+        elif by == By.NAME:
+            css = f'[name="{value}"]'
+        elif by == By.CLASS_NAME:
+            css = f'[class~="{value}"]'
+        elif by == By.TAG_NAME:
+            css = value
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            css = "a"
+        elif by == By.CSS_SELECTOR:
+            css = value
+        else:
+            raise InvalidSelectorException(f"Unsupported locator strategy: {by}")
+        try:
+            expression = _translator.css_to_xpath(css, prefix=scope)
+        except Exception as e:
+            raise InvalidSelectorException(f"{by} {value!r}: {e}")
+    try:
+        compiled = _compiled[key] = etree.XPath(expression)
+    except etree.XPathError as e:
+        raise InvalidSelectorException(f"{by} {value!r}: {e}")
+    return compiled
+
+
+def select(context, by: str, value: str, scope: str = "descendant-or-self::") -> list:
+    nodes = [node for node in _xpath_for(by, value, scope)(context) if _is_element(node)]
+    if by == By.LINK_TEXT:
+        nodes = [node for node in nodes if rendered_text(node) == value]
+    elif by == By.PARTIAL_LINK_TEXT:
+        nodes = [node for node in nodes if value in rendered_text(node)]
+    return nodes
+
+
+def _locator(selector: str) -> tuple:  # probe/waits 와 같은 규칙: "/" 또는 "(" 은 XPath
+    return (By.XPATH, selector) if selector.startswith(("/", "(")) else (By.CSS_SELECTOR, selector)
+
+
+class FakeElement:
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and other._node is self._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    def __repr__(self):
+        return f"<FakeElement {self._node.tag} {dict(self._node.attrib)}>"
+
+    @property
+    def id(self) -> str:
+        return f"fake-{id(self._node):x}"
+
+    def _live(self, command: str):
+        self._driver._count(command)
+        if self._node.getroottree().getroot() is not self._driver._root:
+            raise StaleElementReferenceException("element is not attached to the page document")
+        return self._node
+
+    @property
+    def tag_name(self) -> str:
+        return self._live(Command.GET_ELEMENT_TAG_NAME).tag
+
+    @property
+    def text(self) -> str:
+        return rendered_text(self._live(Command.GET_ELEMENT_TEXT))
+
+    def is_displayed(self) -> bool:
+        return displayed(self._live(Command.W3C_EXECUTE_SCRIPT))
+
+    def is_enabled(self) -> bool:
+        return self._live(Command.IS_ELEMENT_ENABLED).get("disabled") is None
+
+    def is_selected(self) -> bool:
+        node = self._live(Command.IS_ELEMENT_SELECTED)
+        return node.get("checked") is not None or node.get("selected") is not None
+
+    def get_attribute(self, name: str):
+        node = self._live(Command.W3C_EXECUTE_SCRIPT)
+        if name == "value" and node.tag in ("input", "textarea"):
+            return self._driver._values.get(node, node.get("value", ""))
+        if name == "outerHTML":
+            return lxml_html.tostring(node, encoding="unicode", with_tail=False)
+        if name == "innerHTML":
+            return (node.text or "") + "".join(
+                lxml_html.tostring(child, encoding="unicode") for child in node
+            )
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else inner_text(node)
+        return node.get(name)
+
+    def get_dom_attribute(self, name: str):
+        return self._live(Command.GET_ELEMENT_ATTRIBUTE).get(name)
+
+    def click(self):
+        node = self._live(Command.CLICK_ELEMENT)
+        if not displayed(node):
+            raise ElementNotInteractableException(f"element not interactable: {self!r}")
+        self._driver._click(node)
+
+    def send_keys(self, *values):
+        node = self._live(Command.SEND_KEYS_TO_ELEMENT)
+        if not displayed(node):
+            raise ElementNotInteractableException(f"element not interactable: {self!r}")
+        text = "".join(str(value) for value in values)
+        self._driver._values[node] = self._driver._values.get(node, node.get("value", "")) + text
+        self._driver._mutated()
+
+    def clear(self):
+        self._driver._values[self._live(Command.CLEAR_ELEMENT)] = ""
+        self._driver._mutated()
+
+    def find_element(self, by=By.ID, value=None):
+        nodes = select(self._live(Command.FIND_CHILD_ELEMENT), by, value, "descendant::")
+        if not nodes:
+            raise NoSuchElementException(f"no such element: {by} {value!r}")
+        return FakeElement(self._driver, nodes[0])
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        nodes = select(self._live(Command.FIND_CHILD_ELEMENTS), by, value, "descendant::")
+        return [FakeElement(self._driver, node) for node in nodes]
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    @property
+    def alert(self):
+        self._driver._count(Command.W3C_GET_ALERT_TEXT)
+        raise NoAlertPresentException("no such alert")
+
+
+class FakeDriver:
+    """Selenium-compatible driver over an lxml DOM; pages and transitions come from ``site``."""
+
+    def __init__(self, site, url: str = None):
+        self.site = site
+        self.commands = Counter()  # Command 이름별 호출 수
+        self.wait_timeouts = 0  # 조건이 끝내 충족되지 않은 wait_for 호출 수
+        self.unhandled_scripts = Counter()
+        self.switch_to = _SwitchTo(self)
+        self.scripts = {
+            PROBE_SCRIPT: self._probe_script,
+            WAIT_SCRIPT: self._wait_script,
+        }
+        self.scripts.update(getattr(site, "scripts", {}))
+        self._history = []
+        self._url = "about:blank"
+        self._root = lxml_html.document_fromstring("<html><head></head><body></body></html>")
+        self._values = {}  # 입력창 값 (page_source 에는 반영되지 않음, 브라우저와 동일)
+        self._version = 0  # DOM 변경 횟수
+        self._waited_version = 0
+        if url:
+            self.get(url)
+
+    def _count(self, command: str):
+        self.commands[command] += 1
+
+    def _mutated(self):
+        self._version += 1
+
+    # --- 페이지 ---
+    def load(self, url: str, page: str, remember: bool = True):
+        """Replace the document (used by get/back and by site transitions)."""
+        if remember and self._url != "about:blank":
+            self._history.append(self._url)
+        self._url = url
+        self._root = lxml_html.document_fromstring(page)
+        self._values = {}
+        self._mutated()
+        on_load = getattr(self.site, "on_load", None)
+        if on_load is not None:
+            on_load(self)
+
+    def get(self, url: str):
+        self._count(Command.GET)
+        self.load(url, self.site.page(url))
+
+    def back(self):
+        self._count(Command.GO_BACK)
+        if self._history:
+            url = self._history.pop()
+            self.load(url, self.site.page(url), remember=False)
+
+    def refresh(self):
+        self._count(Command.REFRESH)
+        self.load(self._url, self.site.page(self._url), remember=False)
+
+    @property
+    def current_url(self) -> str:
+        self._count(Command.GET_CURRENT_URL)
+        return self._url
+
+    @property
+    def path(self) -> str:  # 사이트 쪽 라우팅용 (명령 수에 포함되지 않음)
+        return urlsplit(self._url).path
+
+    @property
+    def title(self) -> str:
+        self._count(Command.GET_TITLE)
+        title = self._root.find(".//title")
+        return title.text_content() if title is not None else ""
+
+    @property
+    def page_source(self) -> str:
+        self._count(Command.GET_PAGE_SOURCE)
+        return "<!DOCTYPE html>\n" + lxml_html.tostring(self._root, encoding="unicode")
+
+    @property
+    def root(self):
+        return self._root
+
+    # --- 요소 검색 ---
+    def find_element(self, by=By.ID, value=None):
+        self._count(Command.FIND_ELEMENT)
+        nodes = select(self._root, by, value)
+        if not nodes:
+            raise NoSuchElementException(f"no such element: {by} {value!r}")
+        return FakeElement(self, nodes[0])
+
+    def find_elements(self, by=By.ID, value=None) -> list:
+        self._count(Command.FIND_ELEMENTS)
+        return [FakeElement(self, node) for node in select(self._root, by, value)]
+
+    def first(self, selector: str):  # CSS 또는 XPath 의 첫 번째 요소 (lxml 노드)
+        nodes = select(self._root, *_locator(selector))
+        return nodes[0] if nodes else None
+
+    # --- 스크립트 ---
+    def execute_script(self, script: str, *args):
+        self._count(Command.W3C_EXECUTE_SCRIPT)
+        return self._run_script(script, args)
+
+    def execute_async_script(self, script: str, *args):
+        self._count(Command.W3C_EXECUTE_SCRIPT_ASYNC)
+        return self._run_script(script, args)
+
+    def _run_script(self, script: str, args):
+        handler = self.scripts.get(script)
+        if handler is not None:
+            return handler(self, *args)
+        if re.fullmatch(r"\s*(return\s+)?arguments\[0\]\.click\(\);?\s*", script):
+            args[0]._driver._click(args[0]._node)
+            return None
+        self.unhandled_scripts[script.strip()[:60]] += 1
+        return None
+
+    @staticmethod
+    def _probe_script(driver, candidates, require):
+        for index, selector in enumerate(candidates):
+            try:
+                node = driver.first(selector)
+            except InvalidSelectorException:
+                continue
+            if node is None:
+                continue
+            if require == "visible" and not displayed(node):
+                continue
+            if require == "clickable" and (not displayed(node) or node.get("disabled") is not None):
+                continue
+            if require == "text" and (not displayed(node) or not inner_text(node).strip()):
+                continue
+            return [index, FakeElement(driver, node)]
+        return None
+
+    @staticmethod
+    def _wait_script(driver, conditions, root=None, timeout_ms=0):
+        mutated = driver._version != driver._waited_version
+        driver._waited_version = driver._version
+        for index, condition in enumerate(conditions):
+            if FakeDriver._met(driver, condition, mutated):
+                return index
+        driver.wait_timeouts += 1
+        return -1
+
+    @staticmethod
+    def _met(driver, condition, mutated: bool) -> bool:
+        kind = condition[0]
+        if kind == "mutation":
+            return mutated
+        if kind == "all":
+            return all(FakeDriver._met(driver, part, mutated) for part in condition[1:])
+        try:
+            node = driver.first(condition[1])
+        except InvalidSelectorException:
+            return False
+        return (
+            (kind == "present" and node is not None)
+            or (kind == "absent" and node is None)
+            or (kind == "visible" and node is not None and displayed(node))
+            or (kind == "hidden" and (node is None or not displayed(node)))
+            or (kind == "text_changed" and (node is None or inner_text(node).strip() != condition[2]))
+        )
+
+    # --- 상호작용 ---
+    def _click(self, node):
+        if self.site.click(self, node):
+            self._mutated()
+
+    def value_of(self, node) -> str:
+        return self._values.get(node, node.get("value", ""))
+
+    # --- 기타 WebDriver API ---
+    def set_script_timeout(self, time_to_wait: float):
+        self._count(Command.SET_TIMEOUTS)
+
+    def implicitly_wait(self, time_to_wait: float):
+        self._count(Command.SET_TIMEOUTS)
+
+    def set_page_load_timeout(self, time_to_wait: float):
+        self._count(Command.SET_TIMEOUTS)
+
+    def get_cookies(self) -> list:
+        self._count(Command.GET_ALL_COOKIES)
+        return list(getattr(self.site, "cookies", []))
+
+    def add_cookie(self, cookie: dict):
+        self._count(Command.ADD_COOKIE)
+
+    def delete_all_cookies(self):
+        self._count(Command.DELETE_ALL_COOKIES)
+
+    def close(self):
+        self._count(Command.CLOSE)
+
+    def quit(self):
+        self._count(Command.QUIT)
+
+    def command_count(self) -> int:
+        return sum(self.commands.values())
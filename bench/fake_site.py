@@ -0,0 +1,283 @@
+"""Scripted ClassCard behaviour for FakeDriver: login, class and set pages, study modes and test.
+
+Pages come from bench.fixtures, so every XPath used by ClassCardCore and the
+handlers resolves the same way it does on the real site. One card is shown at
+a time and the next one appears as soon as the current one is answered.
+Answers are graded against the set's words and tallied in ``site.results``.
+"""
+from collections import Counter
+from urllib.parse import urljoin, urlsplit
+
+from bench.fake_driver import add_class, inner_text, layout_text, remove_class, select, set_displayed
+from bench.fixtures import SET_PATH, STUDY_PATH, render_page
+from selenium.webdriver.common.by import By
+from utility import CLASS_LIST_SCRIPT, SET_LIST_SCRIPT, WORD_EXTRACT_SCRIPT
+
+_ENTRY_MODES = {"btn-rote": "rote", "btn-recall": "recall", "btn-spell": "spelling", "btn-test": "test"}
+EMPTY_PAGE = "<!DOCTYPE html><html><head></head><body></body></html>"
+
+
+def _classes(node) -> list:
+    return node.get("class", "").split()
+
+
+def _parent_has(node, name: str) -> bool:
+    parent = node.getparent()
+    return parent is not None and name in _classes(parent)
+
+
+class ClassCardSite:
+    """Route table and click transitions; ``sets`` maps set_id → [(english, korean, example), ...]."""
+
+    def __init__(self, sets: dict, classes: dict = None, user_id: int = 1000, progress: dict = None):
+        self.sets = {str(set_id): words for set_id, words in sets.items()}
+        self.classes = {str(class_id): name for class_id, name in (classes or {"1": "클래스"}).items()}
+        self.user_id = user_id
+        self.progress = progress or {}  # {set_id: {mode: %}} 세트 화면에 표시할 진행률
+        self.results = {}  # {mode: Counter(correct, wrong, known)}
+        self.scripts = {
+            WORD_EXTRACT_SCRIPT: self._word_extract,
+            CLASS_LIST_SCRIPT: self._class_list,
+            SET_LIST_SCRIPT: self._set_list,
+            "return c_u;": lambda driver: self.user_id,
+        }
+        self._page = {}
+
+    def _words(self, set_id) -> list:
+        return self.sets.get(str(set_id), [])
+
+    def page(self, url: str) -> str:
+        page = render_page(urlsplit(url).path, self.sets, self.classes, self.user_id, progress=self.progress)
+        return EMPTY_PAGE if page is None else page
+
+    def on_load(self, driver):
+        path = driver.path
+        match = SET_PATH.match(path) or STUDY_PATH.match(path)
+        info = match.groupdict() if match else {}
+        mode = info.get("mode")
+        self._page = {
+            "mode": mode,
+            "set_id": info.get("set_id"),
+            "class_id": info.get("class_id"),
+            "words": self._words(info["set_id"]) if info else [],
+            "current": -1,
+        }
+        if mode == "test":
+            self._page["cards"] = select(driver.root, By.CSS_SELECTOR, "#testForm > div.quiz-item")
+        elif mode:
+            self._page["cards"] = select(driver.root, By.CSS_SELECTOR, "div.study-card-list > div.study-card")
+
+    def tally(self, key: str):
+        self.results.setdefault(self._page["mode"], Counter())[key] += 1
+
+    # --- 클릭 처리 ---
+    def click(self, driver, node) -> bool:
+        """Run the transition for the clicked node (or its nearest handled ancestor)."""
+        for el in (node, *node.iterancestors()):
+            handler = self._handler_for(el)
+            if handler is not None:
+                handler(driver, el)
+                return True
+        return False
+
+    def _handler_for(self, el):
+        classes = _classes(el)
+        mode = self._page.get("mode")
+        if mode is None:  # 로그인/클래스/세트 화면
+            if "btn-login" in classes:
+                return lambda driver, _el: self._navigate(driver, "/Main")
+            for name, entry_mode in _ENTRY_MODES.items():
+                if name in classes:
+                    return lambda driver, _el, entry_mode=entry_mode: self._enter(driver, entry_mode)
+            if el.tag == "a" and _parent_has(el, "dropdown"):
+                return lambda driver, _el: add_class(el.getparent(), "open")
+            if el.tag == "a" and el.getparent() is not None and el.getparent().tag == "li":
+                return self._close_dropdown
+            return None
+        if mode == "test":
+            return self._test_handler(el, classes)
+        return self._learn_handler(el, classes, mode)
+
+    def _navigate(self, driver, path: str):
+        base = urlsplit(driver.current_url)
+        url = f"{base.scheme}://{base.netloc}{path}"
+        driver.load(url, self.page(url))
+
+    def _enter(self, driver, mode: str):
+        self._navigate(driver, f"/study/{mode}/{self._page['set_id']}/{self._page['class_id']}")
+
+    def _close_dropdown(self, driver, el):
+        for dropdown in select(driver.root, By.CSS_SELECTOR, "div.dropdown.open"):
+            remove_class(dropdown, "open")
+
+    def _show_card(self, driver, index: int):
+        cards = self._page["cards"]
+        current = self._page["current"]
+        if 0 <= current < len(cards):
+            set_displayed(cards[current], False)
+        self._page["current"] = index
+        if index < len(cards):
+            set_displayed(cards[index], True)
+        progress = driver.first("span.study-progress")
+        if progress is not None:
+            progress.text = str(min(index, len(cards)))
+
+    def _exit_study(self, driver, el=None):
+        driver.back()
+
+    # --- 암기/리콜/스펠 ---
+    def _learn_handler(self, el, classes, mode):
+        if "remote_left" in classes:
+            return self._exit_study
+        if "btn-start" in classes:
+            return self._start_learning
+        if _parent_has(el, "end-confirm") and el.tag == "a":
+            return self._end_confirm
+        if el.tag == "div" and any("remote_left" in _classes(child) for child in el):
+            return self._ask_end  # 헤더의 학습종료 영역 → 종료 확인 창
+        if mode == "recall" and _parent_has(el, "card-choices"):
+            return self._recall_choice
+        if mode == "rote":
+            if "btn-down-cover-box" in classes:
+                return self._rote_reveal
+            if "btn-know-box" in classes:
+                return self._rote_know
+        if mode == "spelling":
+            if "btn-next" in classes:
+                return self._spelling_next
+            if "btn-check" in classes or "study-bottom" in classes:
+                return self._spelling_check
+        return None
+
+    def _start_learning(self, driver, el):
+        set_displayed(driver.first("div.start-opt-body"), False)
+        self._show_card(driver, 0)
+
+    def _ask_end(self, driver, el):
+        set_displayed(driver.first("div.start-opt-body"), True)
+        set_displayed(driver.first("div.end-confirm"), True)
+
+    def _end_confirm(self, driver, el):
+        if el.getparent().index(el) == 2:  # 세 번째 링크: 학습종료
+            self._exit_study(driver)
+        else:
+            set_displayed(driver.first("div.end-confirm"), False)
+            set_displayed(driver.first("div.start-opt-body"), False)
+
+    def _recall_choice(self, driver, el):
+        index = self._page["current"]
+        self.tally("correct" if layout_text(el) == self._page["words"][index][1] else "wrong")
+        self._show_card(driver, index + 1)
+
+    def _rote_reveal(self, driver, el):
+        add_class(el.getparent(), "down")
+        set_displayed(driver.first("div.btn-know-box"), True)
+
+    def _rote_know(self, driver, el):
+        remove_class(el.getparent(), "down")
+        set_displayed(el, False)
+        self.tally("known")
+        self._show_card(driver, self._page["current"] + 1)
+
+    def _spelling_check(self, driver, el):
+        index = self._page["current"]
+        if not 0 <= index < len(self._page["cards"]):
+            return
+        typed = driver.value_of(select(self._page["cards"][index], By.TAG_NAME, "input")[0])
+        self.tally("correct" if typed.strip() == self._page["words"][index][0] else "wrong")
+        set_displayed(driver.first("div.btn-next"), True)
+
+    def _spelling_next(self, driver, el):
+        set_displayed(el, False)
+        self._show_card(driver, self._page["current"] + 1)
+
+    # --- 테스트 ---
+    def _test_handler(self, el, classes):
+        if el.tag == "a" and _parent_has(el, "m-t-xl") and el.getparent().getparent() is not None:
+            if "retry-layer" in _classes(el.getparent().getparent()):
+                return self._hide_layer
+            return self._close_alert
+        if el.tag == "a" and _parent_has(el, "m-t-md"):
+            return self._hide_layer
+        if "btn-condition-next" in classes or "btn-ok" in classes:
+            return lambda driver, _el: set_displayed(el, False)
+        if "btn-quiz-start" in classes:
+            return self._start_quiz
+        if "quiz-front" in classes:
+            return self._reveal_answer
+        if el.tag == "div" and _parent_has(el, "quiz-choices"):
+            return self._quiz_choice
+        if el.tag == "a" and el.getparent() is not None and _parent_has(el.getparent(), "quiz-subjective"):
+            return self._quiz_submit
+        return None
+
+    def _hide_layer(self, driver, el):
+        set_displayed(el.getparent().getparent(), False)
+
+    def _close_alert(self, driver, el):
+        set_displayed(driver.first("#alertModal"), False)
+
+    def _start_quiz(self, driver, el):
+        set_displayed(driver.first("div.quiz-start-div"), False)
+        set_displayed(driver.first("div.quiz-body"), True)
+        set_displayed(driver.first("#alertModal"), True)
+        self._show_card(driver, 0)
+
+    def _reveal_answer(self, driver, el):
+        set_displayed(el.getnext(), True)
+
+    def _grade_test(self, driver, answer: str):
+        index = self._page["current"]
+        english, korean, _ = self._page["words"][index]
+        expected = korean if index % 2 == 0 else english  # fixtures: 짝수 문항은 객관식
+        self.tally("correct" if answer.strip() == expected else "wrong")
+        self._show_card(driver, index + 1)
+
+    def _quiz_choice(self, driver, el):
+        self._grade_test(driver, layout_text(el))
+
+    def _quiz_submit(self, driver, el):
+        card = self._page["cards"][self._page["current"]]
+        self._grade_test(driver, driver.value_of(select(card, By.TAG_NAME, "input")[0]))
+
+    # --- 스크립트 ---
+    @staticmethod
+    def _class_list(driver, selector):  # utility.CLASS_LIST_SCRIPT 와 같은 결과
+        found = select(driver.root, By.CSS_SELECTOR, selector) or select(driver.root, By.CSS_SELECTOR, "div.left-class-list")
+        if not found:
+            return None
+        return [[inner_text(link).strip(), urljoin(driver._url, link.get("href", ""))]
+                for link in select(found[0], By.TAG_NAME, "a")]
+
+    @staticmethod
+    def _set_list(driver, xpath):  # utility.SET_LIST_SCRIPT 와 같은 결과
+        found = driver.root.xpath(xpath)
+        if not found:
+            return None
+        rows = []
+        for item in select(found[0], By.CLASS_NAME, "set-items"):
+            links = select(item, By.TAG_NAME, "a")
+            if not links:
+                return None
+            count = select(links[0], By.TAG_NAME, "span")
+            rows.append([inner_text(count[0]).strip() if count else "", inner_text(links[0]).strip(),
+                         links[0].get("data-idx")])
+        return rows
+
+    @staticmethod
+    def _word_extract(driver):  # utility.WORD_EXTRACT_SCRIPT 와 같은 결과
+        cards = select(driver.root, By.CSS_SELECTOR, "#tab_set_all > div:nth-of-type(2) > div")
+        if not cards:
+            cards = select(driver.root, By.CSS_SELECTOR, ".flip-body .flip-card")
+
+        def pick(card, side: int) -> str:
+            for path in (f"./div[4]/div[{side}]/div[1]/div/div",
+                         f".//*[contains(concat(' ', @class, ' '), ' {('card-front', 'card-back')[side - 1]} ')]"
+                         "//*[contains(concat(' ', @class, ' '), ' card-text ')]"):
+                found = card.xpath(path)
+                text = layout_text(found[0], skip_hidden=False) if found else ""
+                if text:
+                    return text
+            return ""
+
+        return [[pick(card, 1), pick(card, 2)] for card in cards]
@@ -0,0 +1,390 @@
+"""Synthetic ClassCard pages that mirror the DOM paths used by ClassCardCore and the handlers.
+
+render_page() routes a URL path to the matching page; pass REPLAY_SCRIPT to get
+pages that also advance cards in a real browser (bench.replay_server).
+"""
+import html
+import re
+
+SAMPLE_WORDS = [
+    ("apple", "사과", "I ate an apple."),
+    ("run", "달리다", "They run every morning."),
+    ("library", "도서관", ""),
+    ("borrow", "빌리다", "Can I borrow your pen?"),
+    ("weather", "날씨", "The weather is nice today."),
+    ("bridge", "다리", ""),
+    ("quiet", "조용한", "Please be quiet."),
+    ("travel", "여행하다", "We travel by train."),
+]
+
+
+def _script_tag(script: str) -> str:
+    return f"<script>{script}</script>" if script else ""
+
+
+def make_words(num_cards: int) -> list:  # (영어, 뜻, 예문) 목록
+    words = []
+    for i in range(num_cards):
+        english, korean, example = SAMPLE_WORDS[i % len(SAMPLE_WORDS)]
+        suffix = "" if i < len(SAMPLE_WORDS) else f" {i // len(SAMPLE_WORDS)}"
+        words.append((f"{english}{suffix}", f"{korean}{suffix}", example))
+    return words
+
+
+def _flip_card(english: str, korean: str, example: str) -> str:
+    back = html.escape(korean)
+    if example:
+        back += f"<br><span class=\"example\">{html.escape(example)}</span>"
+    return (
+        '<div class="flip-card">'
+        '<div class="card-top"></div><div class="card-num"></div><div class="card-audio"></div>'
+        "<div>"
+        f'<div class="card-front"><div><div><div class="card-text">{html.escape(english)}</div></div></div></div>'
+        f'<div class="card-back"><div><div><div class="card-text">{back}</div></div></div></div>'
+        "</div>"
+        "</div>"
+    )
+
+
+def _progress(progress: dict, mode: str) -> str:  # 학습 메뉴 버튼 안의 진행률 표시
+    return f' <span class="pct">{progress[mode]}%</span>' if mode in progress else ""
+
+
+def make_set_page(words: list, title: str = "단어 세트", script: str = "", progress: dict = None) -> str:
+    """Set page; ``progress`` maps mode → percent shown on the study menu buttons."""
+    cards = "".join(_flip_card(*word) for word in words)
+    progress = progress or {}
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title></head>
+<body>
+<div class="mw-1080 header"><a href="/">ClassCard</a></div>
+<div class="test">
+  <div class="p-b-sm">
+    <div class="set-title">{html.escape(title)}</div>
+    <div class="study-menu">
+      <div class="menu-row">
+        <div class="btn-rote">암기{_progress(progress, "rote")}</div>
+        <div class="btn-recall">리콜{_progress(progress, "recall")}</div>
+        <div class="btn-spell">스펠{_progress(progress, "spelling")}</div>
+      </div>
+      <div class="test-row"><div class="btn-test">테스트{_progress(progress, "test")}</div></div>
+    </div>
+    <div class="set-body m-t-25 m-b-lg">
+      <div class="m-b-md pos-relative">
+        <div class="dropdown"><a href="#">보기</a><ul><li><a href="#">전체 카드</a></li></ul></div>
+      </div>
+      <div id="tab_set_all">
+        <div class="card-list-title"><div><div><a href="#">한글</a></div></div></div>
+        <div class="flip-body">{cards}</div>
+      </div>
+    </div>
+  </div>
+</div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+LEARN_MODES = ("rote", "recall", "spelling")
+_MODE_TITLES = {"rote": "암기학습", "recall": "리콜학습", "spelling": "스펠학습"}
+
+
+def choices_for(words: list, index: int, count: int = 4) -> list:  # 정답 + 다음 단어들의 뜻 (순서 고정)
+    options = [words[(index + offset) % len(words)][1] for offset in range(min(count, len(words)))]
+    shift = index % len(options)
+    return options[shift:] + options[:shift]
+
+
+def _learn_card(words: list, index: int, mode: str) -> str:
+    english, korean, example = words[index]
+    prompt = html.escape(korean if mode == "spelling" else english)
+    answer = ""
+    if mode == "spelling":
+        answer = '<div><div><div><div></div><div><input type="text" autocomplete="off"></div></div></div></div>'
+    choices = ""
+    if mode == "recall":
+        choices = "".join(f"<div>{html.escape(option)}</div>" for option in choices_for(words, index))
+    return (
+        '<div class="study-card" style="display:none">'
+        f'<div class="card-quest"><div><div><div><div><span>{prompt}</span></div></div></div></div></div>'
+        f'<div class="card-answer">{answer}</div>'
+        f'<div class="card-choices">{choices}</div>'
+        "</div>"
+    )
+
+
+def make_learn_page(words: list, mode: str, title: str = "단어 세트", script: str = "") -> str:
+    """Rote/recall/spelling study screen; card N sits at #wrapper-learn/div[1]/div/div[2]/div[2]/div[N]."""
+    cards = "".join(_learn_card(words, index, mode) for index in range(len(words)))
+    if mode == "rote":
+        bottom = (
+            '<div class="btn-text btn-down-cover-box">의미 보기</div>'
+            '<div class="btn-text btn-know-box" style="display:none">이제 알아요</div>'
+        )
+    elif mode == "spelling":
+        bottom = (
+            '<div class="btn-text btn-check">확인</div>'
+            '<div class="btn-text btn-next" style="display:none">다음</div>'
+        )
+    else:
+        bottom = ""
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)} - {_MODE_TITLES[mode]}</title></head>
+<body>
+<div class="study-header-body"><div><div><div><a class="cc remote_left" href="javascript:;" onclick="study_end();">학습종료</a></div></div></div></div>
+<div id="wrapper-learn" class="study-{mode}">
+  <div class="study-content">
+    <div>
+      <div class="study-top"><span class="study-progress">0</span>/<span>{len(words)}</span></div>
+      <div class="study-body">
+        <div class="study-card-top"></div>
+        <div class="study-card-list">{cards}</div>
+      </div>
+      <div class="study-bottom">{bottom}</div>
+    </div>
+  </div>
+  <div class="start-opt-body"><div><div><div>
+    <div class="start-title">{_MODE_TITLES[mode]}</div>
+    <div class="start-desc">{len(words)}개 카드</div>
+    <div class="start-opt"></div>
+    <div class="m-t"><a class="btn btn-primary btn-start" href="javascript:;">학습 시작</a></div>
+    <div class="end-confirm" style="display:none"><a href="javascript:;">취소</a><a href="javascript:;">이어하기</a><a href="javascript:;">학습종료</a></div>
+  </div></div></div></div>
+</div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+def _quiz_item(words: list, index: int) -> str:
+    english, korean, example = words[index]
+    if index % 2 == 0:  # 객관식: 영어 → 뜻
+        prompt = english
+        options = "".join(f"<div>{html.escape(option)}</div>" for option in choices_for(words, index))
+        answer = f'<div class="quiz-choices">{options}</div>'
+    else:  # 주관식: 뜻 → 영어
+        prompt = korean
+        answer = (
+            '<div class="quiz-choices" style="display:none"></div>'
+            '<div class="quiz-subjective"><div><input type="text" autocomplete="off"></div>'
+            '<div><a class="btn btn-primary" href="javascript:;">제출</a></div></div>'
+        )
+    return (
+        '<div class="quiz-item" style="display:none"><div>'
+        f'<div class="quiz-front"><div></div><div><div></div><div><div><div>{html.escape(prompt)}</div></div></div></div></div>'
+        f'<div class="quiz-answer" style="display:none"><div>{answer}</div></div>'
+        "</div></div>"
+    )
+
+
+def make_test_page(words: list, title: str = "단어 세트", script: str = "") -> str:
+    """Test screen; question N sits at #testForm/div[N], even questions are multiple choice."""
+    items = "".join(_quiz_item(words, index) for index in range(len(words)))
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)} - 테스트</title></head>
+<body>
+<div class="mw-1080 header"><a href="/">ClassCard</a></div>
+<div id="wrapper-test"><div>
+  <div class="quiz-start-div">
+    <div class="layer retry-layer box"><div class="m-t-xl"><a class="btn btn-default" href="javascript:;">다시 테스트</a></div></div>
+    <div class="layer prepare-layer box bg-gray text-white"><div class="text-center m-t-md"><a class="btn btn-default" href="javascript:;">준비 완료</a></div></div>
+    <a class="btn btn-success btn-lg shadow w-250 btn-condition-next" href="javascript:;">다음</a>
+    <a class="btn btn-success btn-xl shadow w-250 btn-quiz-start" href="javascript:;">테스트 시작</a>
+  </div>
+  <div class="quiz-body" style="display:none">
+    <div><div><span>문제</span><span class="quiz-count"><span>{len(words)}</span></span></div></div>
+    <div><form id="testForm" onsubmit="return false;">{items}</form></div>
+  </div>
+</div></div>
+<div id="alertModal" class="modal" style="display:none"><div class="modal-dialog"><div>
+  <div class="text-center m-t-xl"><a class="btn btn-primary" href="javascript:;">확인</a></div>
+  <div class="m-t"><a class="btn btn-primary shadow btn-ok m-l-xs" href="javascript:;">응시</a><a class="btn shadow btn-ok m-l-xs btn-danger" href="javascript:;">새로 시작</a></div>
+</div></div></div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+def make_login_page(script: str = "") -> str:
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>로그인</title></head>
+<body>
+<div class="mw-1080 header"><a href="/">ClassCard</a></div>
+<div class="login-body"><form onsubmit="return false;">
+  <input type="text" name="login_id" placeholder="아이디">
+  <input type="password" name="login_pwd" placeholder="비밀번호">
+  <a class="btn btn-primary btn-login" href="javascript:;">로그인</a>
+</form></div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+def make_main_page(classes: dict, user_id: int, script: str = "") -> str:
+    """Landing page after login; the class list sits where ClassCardCore.get_classes looks."""
+    links = "".join(
+        f'<a href="/ClassMain/{html.escape(str(class_id))}">{html.escape(name)}</a>'
+        for class_id, name in classes.items()
+    )
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>ClassCard</title><script>var c_u = {int(user_id)};</script></head>
+<body>
+<div class="mw-1080">
+  <div class="header"></div><div></div><div></div><div></div><div></div>
+  <div><div><div>
+    <div class="left-menu">
+      <div class="left-item-group p-t-none p-r-lg">
+        <div class="m-t-sm left-class-list">{links}<a href="/Main/joinClass">클래스 참여</a></div>
+      </div>
+    </div>
+  </div></div></div>
+</div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+def make_class_page(sets: dict, user_id: int, title: str = "클래스", script: str = "") -> str:
+    """Class page; ``sets`` maps set_id → words, listed where ClassCardCore.get_sets looks."""
+    items = "".join(  # 제목에 숫자가 있으면 get_sets 가 카드 수와 함께 지우므로 글자로 구분
+        f'<div class="set-items"><a href="javascript:;" data-idx="{html.escape(str(set_id))}">'
+        f"단어 세트 {chr(ord('A') + index % 26)}<span>{len(words)}</span></a></div>"
+        for index, (set_id, words) in enumerate(sets.items())
+    )
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title><script>var c_u = {int(user_id)};</script></head>
+<body>
+<div class="cc-body">
+  <div class="header"></div>
+  <div><div><div>
+    <div class="class-top"></div>
+    <div class="class-content">
+      <div class="class-title">{html.escape(title)}</div><div></div>
+      <div class="set-list"><div>{items}</div></div>
+    </div>
+  </div></div></div>
+</div>
+{_script_tag(script)}
+</body></html>
+"""
+
+
+SET_PATH = re.compile(r"^/set/(?P<set_id>[^/]+)/(?P<class_id>[^/]+)/?$")
+STUDY_PATH = re.compile(r"^/study/(?P<mode>rote|recall|spelling|test)/(?P<set_id>[^/]+)/(?P<class_id>[^/]+)/?$")
+CLASS_PATH = re.compile(r"^/ClassMain/(?P<class_id>[^/]+)/?$")
+
+
+def render_page(path: str, sets: dict, classes: dict, user_id: int = 1000, script: str = "",
+                progress: dict = None):
+    """Page for a URL path, or None when the path is unknown (404); ``progress`` is {set_id: {mode: %}}."""
+    if path in ("/", "/Login"):
+        return make_login_page(script)
+    if path == "/Main":
+        return make_main_page(classes, user_id, script)
+    match = CLASS_PATH.match(path)
+    if match and match["class_id"] in classes:
+        return make_class_page(sets, user_id, classes[match["class_id"]], script)
+    match = SET_PATH.match(path)
+    if match and match["set_id"] in sets:
+        return make_set_page(sets[match["set_id"]], f"세트 {match['set_id']}", script,
+                             (progress or {}).get(match["set_id"]))
+    match = STUDY_PATH.match(path)
+    if match and match["set_id"] in sets:
+        words, title = sets[match["set_id"]], f"세트 {match['set_id']}"
+        if match["mode"] == "test":
+            return make_test_page(words, title, script)
+        return make_learn_page(words, match["mode"], title, script)
+    return None
+
+
+# 실제 브라우저에서 카드 진행을 재현하는 최소 스크립트 (bench.fake_site 의 전환과 동일)
+REPLAY_SCRIPT = r"""
+(function () {
+    function $(selector) { return document.querySelector(selector); }
+    function show(el, on) { if (el) el.style.display = on ? "" : "none"; }
+    function parentHas(el, name) { return !!el.parentElement && el.parentElement.classList.contains(name); }
+    var cards = document.querySelectorAll(".study-card-list > .study-card, #testForm > .quiz-item");
+    var current = -1;
+    var entries = {"btn-rote": "rote", "btn-recall": "recall", "btn-spell": "spelling", "btn-test": "test"};
+    function showCard(index) {
+        if (cards[current]) show(cards[current], false);
+        current = index;
+        if (cards[index]) show(cards[index], true);
+        var progress = $(".study-progress");
+        if (progress) progress.textContent = Math.min(index, cards.length);
+    }
+    window.study_end = function () { history.back(); };
+    function handle(el) {
+        var cls = el.classList, tag = el.tagName;
+        for (var name in entries) {
+            if (cls.contains(name)) {
+                var m = location.pathname.match(/^\/set\/([^\/]+)\/([^\/]+)/);
+                location.href = "/study/" + entries[name] + "/" + m[1] + "/" + m[2];
+                return true;
+            }
+        }
+        if (tag === "A" && parentHas(el, "dropdown")) { el.parentElement.classList.add("open"); return true; }
+        if (tag === "A" && el.parentElement && el.parentElement.tagName === "LI") {
+            var open = $(".dropdown.open");
+            if (open) open.classList.remove("open");
+            return true;
+        }
+        if (cls.contains("btn-login")) { location.href = "/Main"; return true; }
+        if (cls.contains("remote_left")) return true;  // onclick="study_end();"
+        if (cls.contains("btn-start")) { show($(".start-opt-body"), false); showCard(0); return true; }
+        if (tag === "A" && parentHas(el, "end-confirm")) {
+            if (el === el.parentElement.children[2]) { study_end(); return true; }
+            show($(".end-confirm"), false);
+            show($(".start-opt-body"), false);
+            return true;
+        }
+        if (tag === "DIV" && el.querySelector(":scope > .remote_left")) {
+            show($(".start-opt-body"), true);
+            show($(".end-confirm"), true);
+            return true;
+        }
+        if (parentHas(el, "card-choices") || parentHas(el, "quiz-choices")) { showCard(current + 1); return true; }
+        if (cls.contains("btn-down-cover-box")) {
+            el.parentElement.classList.add("down");
+            show($(".btn-know-box"), true);
+            return true;
+        }
+        if (cls.contains("btn-know-box")) {
+            el.parentElement.classList.remove("down");
+            show(el, false);
+            showCard(current + 1);
+            return true;
+        }
+        if (cls.contains("btn-next")) { show(el, false); showCard(current + 1); return true; }
+        if (cls.contains("btn-check") || (cls.contains("study-bottom") && $(".btn-check"))) {
+            if (current >= 0 && current < cards.length) show($(".btn-next"), true);
+            return true;
+        }
+        if (tag === "A" && (parentHas(el, "m-t-md") ||
+                (parentHas(el, "m-t-xl") && el.parentElement.parentElement.classList.contains("retry-layer")))) {
+            show(el.parentElement.parentElement, false);
+            return true;
+        }
+        if (tag === "A" && parentHas(el, "m-t-xl")) { show($("#alertModal"), false); return true; }
+        if (cls.contains("btn-condition-next") || cls.contains("btn-ok")) { show(el, false); return true; }
+        if (cls.contains("btn-quiz-start")) {
+            show($(".quiz-start-div"), false);
+            show($(".quiz-body"), true);
+            show($("#alertModal"), true);
+            showCard(0);
+            return true;
+        }
+        if (cls.contains("quiz-front")) { show(el.nextElementSibling, true); return true; }
+        if (tag === "A" && el.parentElement && parentHas(el.parentElement, "quiz-subjective")) {
+            showCard(current + 1);
+            return true;
+        }
+        return false;
+    }
+    document.addEventListener("click", function (event) {
+        for (var el = event.target; el && el.nodeType === 1; el = el.parentElement) {
+            if (handle(el)) return;
+        }
+    });
+})();
+"""
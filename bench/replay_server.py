@@ -0,0 +1,130 @@
+"""Local replay of the ClassCard pages (login, class main, set, study modes, test).
+
+Usage (from the repository root):
+    python -m bench.replay_server [port] [num_cards ...]
+
+Pages come from bench.fixtures with REPLAY_SCRIPT, which advances cards the
+way the real site does, so ClassCardCore(base_url=server.base_url) can run every
+mode in a real browser without network access. Sets are named after their card
+count (set "20" has 20 cards) and all belong to class "1".
+
+POST /LoginProc answers like the real endpoint and sets a session cookie, so
+http_client.ClassCardClient and http_reader.HttpReader can run against it.
+With require_login=True every other page redirects to /Login without that
+cookie.
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from bench.fixtures import REPLAY_SCRIPT, make_words, render_page
+
+SIZES = (20, 100, 500)
+CLASS_ID = "1"
+SESSION_COOKIE = "replay_session"
+BAD_PASSWORD = "wrong"  # 이 비밀번호로는 /LoginProc 가 실패
+
+
+def make_sets(sizes) -> dict:
+    return {str(size): make_words(size) for size in sizes}
+
+
+class ReplayServer:
+    """Serve the fixture pages on localhost from a background thread."""
+
+    def __init__(self, sets: dict, classes: dict = None, user_id: int = 1000,
+                 host: str = "127.0.0.1", port: int = 0, require_login: bool = False,
+                 latency: float = 0.0, progress: dict = None):
+        self.sets = {str(set_id): words for set_id, words in sets.items()}
+        self.classes = classes or {CLASS_ID: "재현 클래스"}
+        self.user_id = user_id
+        self.require_login = require_login
+        self.progress = progress or {}  # {set_id: {mode: %}} 세트 화면에 표시할 진행률
+        self.latency = latency  # 응답마다 더하는 지연 (초), 실제 사이트 왕복 시간 흉내
+        self.requests = 0
+        self.logins = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: str, content_type: str = "text/html", headers: dict = None):
+                if server.latency:
+                    time.sleep(server.latency)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                server.requests += 1
+                path = urlsplit(self.path).path
+                if (server.require_login and path not in ("/", "/Login")
+                        and f"{SESSION_COOKIE}=" not in (self.headers.get("Cookie") or "")):
+                    self._send(302, "", headers={"Location": "/Login"})
+                    return
+                page = render_page(path, server.sets, server.classes, server.user_id, REPLAY_SCRIPT,
+                                   server.progress)
+                self._send(200 if page is not None else 404, page or "<h1>404</h1>")
+
+            def do_POST(self):
+                server.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                if urlsplit(self.path).path != "/LoginProc":
+                    self._send(404, "<h1>404</h1>")
+                    return
+                if not form.get("login_id") or form.get("login_pwd", [""])[0] == BAD_PASSWORD:
+                    self._send(200, json.dumps({"result": "fail"}), "application/json")
+                    return
+                server.logins += 1
+                self._send(200, json.dumps({"result": "ok"}), "application/json",
+                           {"Set-Cookie": f"{SESSION_COOKIE}={server.user_id}-{server.logins}; Path=/"})
+
+            def log_message(self, format, *args):  # 요청 로그 생략
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(args: list):
+    port = int(args[0]) if args else 8000
+    sizes = [int(arg) for arg in args[1:]] or SIZES
+    server = ReplayServer(make_sets(sizes), port=port)
+    print(f"[INFO] Replay site: {server.base_url}/Login (sets {', '.join(server.sets)} in class {CLASS_ID})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,112 @@
+import os
+
+# 학습 자동화에 필요 없는 리소스 (DevTools Network.setBlockedURLs 패턴, * 와일드카드)
+BLOCKED_IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"]
+BLOCKED_FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+BLOCKED_MEDIA = ["*.mp3", "*.mp4", "*.m4a", "*.wav", "*.ogg", "*.webm"]
+BLOCKED_ANALYTICS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*analytics.tiktok.com*",
+    "*wcs.naver.net*",
+    "*channel.io*",
+]
+BLOCKED_URLS = BLOCKED_IMAGES + BLOCKED_FONTS + BLOCKED_MEDIA + BLOCKED_ANALYTICS
+
+# Chrome 설정으로 막을 수 있는 콘텐츠 (2 = 차단)
+BLOCKING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+
+class BrowserProfile:
+    """Lean Chrome launch settings: headless, resource blocking, small window, eager page loads."""
+
+    def __init__(self, headless: bool = True, block_resources: bool = True,
+                 window_size: tuple = (1024, 768), page_load_strategy: str = "eager",
+                 blocked_urls: list = None):
+        self.headless = headless
+        self.block_resources = block_resources
+        self.window_size = window_size
+        self.page_load_strategy = page_load_strategy
+        self.blocked_urls = BLOCKED_URLS if blocked_urls is None else blocked_urls
+
+    @classmethod
+    def from_env(cls, value=None):
+        """CLASSCARD_LEAN: "1"/"true" → 헤드리스 경량 프로필, "window" → 창을 띄운 경량 프로필."""
+        value = os.environ.get("CLASSCARD_LEAN") if value is None else value
+        if not value or value in ("0", "false"):
+            return None
+        return cls(headless=value != "window")
+
+    def apply(self, options):
+        """Add this profile to selenium ChromeOptions before launch."""
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument("--window-size={},{}".format(*self.window_size))
+        if self.page_load_strategy:
+            options.page_load_strategy = self.page_load_strategy
+        if self.block_resources:
+            options.add_experimental_option("prefs", BLOCKING_PREFS)
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--mute-audio")
+        options.add_argument("--disable-extensions")
+        return options
+
+    def attach(self, driver):
+        """Block fonts/media/analytics over DevTools after launch (prefs cover only images)."""
+        if not self.block_resources or not self.blocked_urls:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        except Exception as e:  # Chrome 이 아닌 드라이버 등
+            print(f"[WARNING] 네트워크 차단 설정 실패: {e}")
+
+    def describe(self) -> str:
+        parts = ["headless" if self.headless else "windowed"]
+        if self.window_size:
+            parts.append("{}x{}".format(*self.window_size))
+        if self.page_load_strategy:
+            parts.append(f"pageLoad={self.page_load_strategy}")
+        if self.block_resources:
+            parts.append(f"blocked={len(self.blocked_urls)} patterns")
+        return ", ".join(parts)
+
+
+def chrome_rss(driver):
+    """Resident memory (bytes) of chromedriver and every Chrome process under it; None without psutil."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:  # 측정 중 종료된 렌더러
+            pass
+    return total
+
+
+def page_load_time(driver):
+    """(domContentLoaded, load) in seconds for the current page from Navigation Timing."""
+    timing = driver.execute_script(
+        "const t = performance.getEntriesByType('navigation')[0];"
+        "return t ? [t.domContentLoadedEventEnd, t.loadEventEnd] : null;"
+    )
+    if not timing:
+        return None
+    return tuple(value / 1000 for value in timing)
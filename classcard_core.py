@@ -1,13 +1,16 @@
+import json
+import os
 import time
 import warnings
 import re
-from bs4 import BeautifulSoup
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     NoSuchElementException,
+    WebDriverException,
     TimeoutException,
     UnexpectedAlertPresentException,
     StaleElementReferenceException
@@ -16,29 +19,235 @@ from handler.recall_learning import RecallLearning, UnknownWordException as Reca
 from handler.spelling_learning import SpellingLearning, UnknownWordException as SpellingUnknownWordException
 from handler.rote_learning import RoteLearning
 from handler.test_learning import TestLearning
-from utility import word_get
+from browser_profile import BrowserProfile
+from driver_profiler import DriverProfiler
+from http_client import COOKIE_FILE, ClassCardClient
+from http_reader import HttpReader
+from navigation import CLASS_LIST, CLASS_SETS, LEARN_PROMPT, LEARN_START, STUDY_END_CONFIRM, Navigator
+from prefetch import WordPrefetcher
+from recovery import CARD_RETRIES, FATAL, TRANSIENT, WORDS, Backoff, ModeInterrupted, classify
+from scheduler import ModeScheduler, plan_jobs, print_event
+from progress import parse_progress
+from probe import VISIBLE, probe
+from run_ledger import LEDGER_FILE, RunLedger
+from tracing import TRACE_DIR, Tracer, span, traced
+from waits import wait_absent, wait_for, wait_visible
+from utility import class_list_script, make_soup, set_list_script, word_get, word_parse
+from word_bank import WordBank
+from word_cache import WordCache, content_fingerprint
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+BASE_URL = "https://www.classcard.net"
+CHROME_PROFILE_DIR = "chrome_profile"  # 실행 간에 쿠키/세션을 유지하는 Chrome user-data-dir
+SESSION_FILE = "classcard_session.json"  # 프로필 폴더 안, 세션을 만든 로그인 아이디 기록
+OVERLAY_SELECTORS = [".modal", ".modal-backdrop", ".overlay", ".popup", ".modal-footer"]
+SPELLING_START = "/html/body/div[2]/div[2]/div/div/div/div[4]/a"
+SPELLING_INPUT = "/html/body/div[2]/div[1]/div/div[2]/div[2]/div[{n}]/div[2]/div/div/div/div[2]/input"
+SPELLING_NEXT = "//*[@id='wrapper-learn']/div/div/div[3]/div[2]"
+TEST_PROMPT = "//*[@id='testForm']/div[{n}]/div/div[1]/div[2]/div[2]/div/div"
+TEST_INPUT = "//*[@id='testForm']/div[{n}]/div/div[2]/div/div[2]/div[1]/input"
+TEST_CHOICES = "/html/body/div[2]/div/div[2]/div[2]/form/div[{n}]/div/div[2]/div/div[1]"
+
+
+def _flag(value, env: str, default=None):
+    """Constructor option: ``value`` if given, else environment variable ``env`` (``default`` if unset).
+
+    None when switched off (False, 0, "", "0" or "false"); anything else is returned as is.
+    """
+    if value is None:
+        value = os.environ.get(env, default)
+    if not value or value in ("0", "false"):
+        return None
+    return value
+
+
 class ClassCardCore:
-    def __init__(self):
+    def __init__(self, html_parser=None, word_cache=True, base_url=BASE_URL, trace=None, profile=None, browser=None,
+                 chrome_profile=None, cookie_jar=None, http_read=None, prefetch=None,
+                 ledger=None, skip_complete=None):
         self.driver = None
+        self.base_url = base_url.rstrip("/")  # 로컬 재현 서버 등으로 바꿀 수 있음
+        # 단계별 시간 추적: True 또는 기록 폴더 (기본값은 환경 변수 CLASSCARD_TRACE)
+        trace = _flag(trace, "CLASSCARD_TRACE")
+        self.tracer = None
+        if trace:
+            directory = trace if isinstance(trace, str) and trace not in ("1", "true") else TRACE_DIR
+            self.tracer = Tracer(directory).install()
+        # WebDriver 명령 수/왕복 시간 프로파일 (기본값은 환경 변수 CLASSCARD_PROFILE)
+        self.profiler = DriverProfiler() if _flag(profile, "CLASSCARD_PROFILE") else None
+        # 경량 브라우저 프로필: BrowserProfile 또는 None (기본값은 환경 변수 CLASSCARD_LEAN)
+        self.browser = BrowserProfile.from_env() if browser is None else (browser or None)
+        self.navigator = Navigator()  # 고정 sleep 대신 페이지별 준비 조건으로 이동
+        # 영구 Chrome 프로필 폴더 (기본값은 환경 변수 CLASSCARD_CHROME_PROFILE, False 면 매번 새 프로필)
+        chrome_profile = _flag(chrome_profile, "CLASSCARD_CHROME_PROFILE", CHROME_PROFILE_DIR)
+        self.chrome_profile = os.path.abspath(chrome_profile) if chrome_profile else None
+        # HTTP 로그인 쿠키 저장 파일 (기본값은 환경 변수 CLASSCARD_COOKIES, False 면 HTTP 로그인 안 함)
+        cookie_jar = _flag(cookie_jar, "CLASSCARD_COOKIES", COOKIE_FILE)
+        self.http = ClassCardClient(self.base_url, cookie_jar) if cookie_jar else None
+        # 클래스/세트/단어 목록을 브라우저 없이 HTTP 로 읽기 (기본값은 환경 변수 CLASSCARD_HTTP_READ)
+        http_read = _flag(http_read, "CLASSCARD_HTTP_READ", "1")
+        self.reader = HttpReader(self.http, html_parser) if self.http and http_read else None
+        self._http_ready = False
+        # 범위 실행 중 다음 세트 단어를 미리 읽는 개수 (기본값은 환경 변수 CLASSCARD_PREFETCH, 0 이면 끔)
+        self.prefetch = int(_flag(prefetch, "CLASSCARD_PREFETCH", "1") or 0)
+        self._prefetcher = None
+        # 세트/모드 결과 기록 파일 (기본값은 환경 변수 CLASSCARD_LEDGER, False 면 기록 안 함)
+        ledger = _flag(ledger, "CLASSCARD_LEDGER", LEDGER_FILE)
+        self.ledger = RunLedger(ledger) if ledger else None
+        # 범위 실행 전 세트 화면의 진행률로 이미 100% 인 모드 건너뛰기 (기본값은 환경 변수 CLASSCARD_SKIP_COMPLETE)
+        self.skip_complete = _flag(skip_complete, "CLASSCARD_SKIP_COMPLETE", "1") is not None
         self.user_id = None
         self.class_id = None
+        self._session_expired = False
+        self.html_parser = html_parser  # "html.parser" 또는 "lxml"
+        self.word_cache = WordCache() if word_cache is True else (word_cache or None)
+        self._word_memo = {}  # 실행 중 세트별 단어 메모 {(set_id, class_id): (num_d, word_d)}
+        self._pages = {}  # 진행률 확인 때 HTTP 로 받은 세트 페이지 (단어 읽기에 재사용)
+        self._progress = {}  # 마지막으로 읽은 세트 페이지의 진행률 {(set_id, class_id): {mode: percent}}
+        self._current_set = None  # 학습 중인 세트 (set_id, class_id)
+        self.backoff = Backoff()  # 일시적 오류 재시도 간격
+
+    def driver_alive(self):
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
 
     def setup_driver(self):
+        """Launch Chrome, or return the already-running driver if it still responds."""
+        if self.driver_alive():
+            return self.driver
         from selenium.webdriver.chrome.options import Options
         chrome_options = Options()
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('--log-level=1')
+        chrome_options.page_load_strategy = "eager"  # DOMContentLoaded 후 반환, 준비 여부는 Navigator 가 확인
+        if self.chrome_profile is not None:
+            chrome_options.add_argument(f"--user-data-dir={self.chrome_profile}")
+        if self.browser is not None:
+            self.browser.apply(chrome_options)
+            print(f"[INFO] 경량 브라우저 프로필: {self.browser.describe()}")
         self.driver = webdriver.Chrome(options=chrome_options)
+        if self.browser is not None:
+            self.browser.attach(self.driver)
+        if self.profiler is not None:
+            self.profiler.install(self.driver)
         return self.driver
 
+    def report_profile(self, set_id):  # 세트 하나가 끝날 때 호출 위치별 명령 통계 출력
+        if self.profiler is not None:
+            print(self.profiler.report(f"세트 {set_id}"))
+            self.profiler.reset()
+
+    def _session_path(self):
+        return os.path.join(self.chrome_profile, SESSION_FILE) if self.chrome_profile else None
+
+    def saved_login_id(self):
+        """Login id that created the session stored in the Chrome profile, if any."""
+        path = self._session_path()
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f).get("login_id")
+        except (OSError, ValueError):
+            return None
+
+    def _save_login_id(self, login_id):
+        path = self._session_path()
+        if path is None:
+            return
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.chrome_profile, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"login_id": login_id}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] 세션 정보 저장 실패: {e}")
+
+    def session_user(self):
+        """Open the main page and return the logged-in user id (c_u), or None if the session is gone."""
+        self.navigator.goto(self.driver, f"{self.base_url}/Main", "entry")
+        try:
+            if self.driver.find_elements(By.NAME, "login_id"):  # 로그인 화면으로 돌아옴
+                return None
+            user = self.driver.execute_script("return c_u;")
+        except WebDriverException:
+            return None
+        return int(user) if user else None
+
+    @traced("session")
+    def restore_session(self, user_id=None):
+        """Reuse a still-valid session from the persistent profile instead of the login form.
+
+        ``user_id`` (the login id) must match the one that created the session; None accepts any.
+        """
+        saved = self.saved_login_id()
+        if saved is None or self._session_expired or (user_id is not None and saved != user_id):
+            return False
+        user = self.session_user()
+        if user is None:
+            print("[INFO] 저장된 세션이 만료되어 다시 로그인합니다.")
+            self._session_expired = True  # 이어지는 login() 에서 다시 확인하지 않음
+            return False
+        self.user_id = user
+        self._share_session(saved)
+        print(f"[INFO] 저장된 세션 재사용 ({saved}). User ID: {self.user_id}")
+        return True
+
+    @traced("http_login")
+    def http_login(self, user_id, password):
+        """Log in over HTTP (or reuse the saved cookie jar) and hand the cookies to the browser.
+
+        True on success, None if the server refused the credentials, False if the
+        browser login form should be tried (no HTTP session, network error, ...).
+        """
+        if self.http is None:
+            return False
+        try:
+            if not self.http.ensure_login(user_id, password):
+                return None
+        except requests.RequestException as e:
+            print(f"[WARNING] HTTP 로그인 실패, 로그인 폼을 사용합니다: {e}")
+            return False
+        try:
+            self.http.inject(self.driver)
+        except WebDriverException as e:
+            print(f"[WARNING] 브라우저 쿠키 주입 실패: {e}")
+            return False
+        self._session_expired = False
+        user = self.session_user()
+        if user is None:
+            print("[WARNING] 쿠키 주입 후에도 로그인되지 않아 로그인 폼을 사용합니다.")
+            return False
+        self.user_id = user
+        self._save_login_id(user_id)
+        self._share_session(user_id, from_browser=False)
+        print(f"[INFO] HTTP 로그인 성공 (쿠키 주입). User ID: {self.user_id}")
+        return True
+
+    @traced("login")
     def login(self, user_id, password):
+        if self.restore_session(user_id):
+            return True
+        logged_in = self.http_login(user_id, password)
+        if logged_in:
+            return True
+        if logged_in is None:  # 서버가 거부한 비밀번호를 로그인 폼에 다시 넣지 않음 (잠금/캡차 방지)
+            print("[ERROR] 아이디 또는 비밀번호가 잘못되었습니다.")
+            return False
         try:
-            self.driver.get("https://www.classcard.net/Login")
+            if self.saved_login_id() not in (None, user_id):  # 다른 계정의 세션 정리
+                self.driver.delete_all_cookies()
+            self.driver.get(f"{self.base_url}/Login")
+            self.navigator.forget()
             try:
                 id_element = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.NAME, "login_id"))
@@ -58,13 +267,13 @@ class ClassCardCore:
             id_element.clear()
             id_element.send_keys(user_id)
             pw_element.send_keys(password)
-            time.sleep(1)
             try:
                 login_button = WebDriverWait(self.driver, 10).until(
                     EC.element_to_be_clickable((By.CLASS_NAME, "btn-login"))
                 )
                 login_button.click()
-                time.sleep(1)
+                self.navigator.ready(self.driver, "main")
+                self.user_id = int(self.driver.execute_script("return c_u;"))  # 실패 시 alert 가 여기서 드러남
             except UnexpectedAlertPresentException:
                 try:
                     alert = self.driver.switch_to.alert
@@ -74,20 +283,52 @@ class ClassCardCore:
                     print("[LOGIN ERROR] Unexpected alert present, but could not read text.")
                 print("로그인에 실패했습니다. 아이디/비밀번호를 확인하거나, 사이트에서 자동화 로그인을 차단했을 수 있습니다.")
                 return False
-            self.user_id = int(self.driver.execute_script("return c_u;"))
+            self._save_login_id(user_id)
+            self._share_session(user_id)
+            self._session_expired = False
             print(f"[INFO] Login successful. User ID: {self.user_id}")
             return True
         except Exception as e:
             print(f"[ERROR] Login failed: {e}")
             return False
 
+    def http_ready(self):
+        """True once a login has given the HTTP session valid cookies (reads skip the browser)."""
+        return self.reader is not None and self._http_ready
+
+    def _http_failed(self):
+        print("[INFO] HTTP 읽기를 중단하고 브라우저로 읽습니다.")
+        self._http_ready = False
+
+    def _share_session(self, user_id, from_browser=True):  # 로그인 성공 후 HTTP 세션과 쿠키 공유
+        if self.http is None:
+            return
+        if from_browser:
+            try:
+                self.http.adopt(self.driver.get_cookies(), user_id)
+            except WebDriverException as e:
+                print(f"[WARNING] 브라우저 쿠키 복사 실패: {e}")
+                return
+        self._http_ready = True
+
+    @traced("get_classes")
     def get_classes(self):
+        if self.http_ready():
+            with span("http_get"):
+                class_dict = self.reader.get_classes()
+            if class_dict:
+                return class_dict
+            self._http_failed()
+        class_dict = class_list_script(self.driver)
+        if class_dict is not None:
+            return class_dict
+        print("[INFO] Falling back to per-element class extraction")
+        return self._get_classes_legacy()
+
+    def _get_classes_legacy(self):  # 요소별 .text/get_attribute 조회 (fallback)
         try:
             class_dict = {}
-            class_list_element = self.driver.find_element(
-                By.CSS_SELECTOR,
-                "body > div.mw-1080 > div:nth-child(6) > div > div > div.left-menu > div.left-item-group.p-t-none.p-r-lg > div.m-t-sm.left-class-list",
-            )
+            class_list_element = self.driver.find_element(By.CSS_SELECTOR, CLASS_LIST)
             class_count = len(class_list_element.find_elements(By.TAG_NAME, "a"))
             for class_item, i in zip(
                 class_list_element.find_elements(By.TAG_NAME, "a"),
@@ -104,16 +345,31 @@ class ClassCardCore:
             print(f"[ERROR] Failed to get classes: {e}")
             return {}
 
+    @traced("get_sets", "class_id")
     def get_sets(self, class_id):
+        self.class_id = class_id
+        if self.http_ready():
+            with span("http_get"):
+                sets_dict = self.reader.get_sets(class_id)
+            if sets_dict is not None:
+                return sets_dict
+            self._http_failed()
+        try:
+            class_url = f"{self.base_url}/ClassMain/{class_id}"
+            self.navigator.goto(self.driver, class_url, "class")
+            sets_dict = set_list_script(self.driver)
+            if sets_dict is not None:
+                return sets_dict
+            print("[INFO] Falling back to per-element set extraction")
+            return self._get_sets_legacy()
+        except Exception as e:
+            print(f"[ERROR] Failed to get sets: {e}")
+            return {}
+
+    def _get_sets_legacy(self):  # 세트마다 find_element/.text/get_attribute 조회 (fallback)
         try:
-            self.class_id = class_id
-            class_url = f"https://www.classcard.net/ClassMain/{class_id}"
-            self.driver.get(class_url)
-            time.sleep(1)
             sets_dict = {}
-            sets_div = self.driver.find_element(
-                By.XPATH, "/html/body/div[1]/div[2]/div/div/div[2]/div[3]/div"
-            )
+            sets_div = self.driver.find_element(By.XPATH, CLASS_SETS)
             sets = sets_div.find_elements(By.CLASS_NAME, "set-items")
             sets_count = len(sets)
             for set_item, i in zip(sets, range(sets_count)):
@@ -133,463 +389,595 @@ class ClassCardCore:
             print(f"[ERROR] Failed to get sets: {e}")
             return {}
 
+    def _set_page_in_browser(self, set_id, class_id):
+        set_site = f"{self.base_url}/set/{set_id}/{class_id}"
+        self.navigator.goto(self.driver, set_site, "set")
+        self.driver.find_element(
+            By.CSS_SELECTOR,
+            "body > div.test > div.p-b-sm > div.set-body.m-t-25.m-b-lg > div.m-b-md.pos-relative > div.dropdown > a",
+        ).click()
+        self.driver.find_element(
+            By.CSS_SELECTOR,
+            "body > div.test > div.p-b-sm > div.set-body.m-t-25.m-b-lg > div.m-b-md.pos-relative > div.dropdown.open > ul > li:nth-child(1) > a",
+        ).click()
+        with span("page_source"):
+            return make_soup(self.driver.page_source, self.html_parser)
+
+    def _words_from_page(self, set_id, class_id, html, browser=True):
+        """Cache lookup + parse of a set page; without a browser page, None means "retry in the browser"."""
+        self._progress[(str(set_id), str(class_id))] = parse_progress(html)
+        cards_ele = html.find("div", class_="flip-body")
+        if not browser and cards_ele is None:
+            return None
+        num_d = len(cards_ele.find_all("div", class_="flip-card"))
+        fingerprint = content_fingerprint(cards_ele)
+        if self.word_cache is not None:
+            cached = self.word_cache.get(set_id, class_id, num_d, fingerprint)
+            print(f"[CACHE] 세트 {set_id}: {'hit' if cached is not None else 'miss'} - {self.word_cache.stats()}")
+            if cached is not None:
+                return num_d, cached
+        with span("parse"):
+            word_d = word_parse(html, num_d)
+        if word_d is None:
+            if not browser:
+                return None
+            print("[INFO] page_source 파싱 실패, 브라우저에서 단어를 다시 읽습니다.")
+            with span("word_get"):
+                time.sleep(0.5)
+                word_d = word_get(self.driver, num_d)
+        word_d = WordBank.from_word_d(word_d)
+        if self.word_cache is not None and all(e.english and e.korean for e in word_d.entries):
+            self.word_cache.put(set_id, class_id, num_d, fingerprint, word_d)
+        da_e, da_k, da_kyn = word_d
+        print(f"[DEBUG] 영어단어 리스트: {da_e}")
+        print(f"[DEBUG] 한글단어 리스트: {da_k}")
+        print(f"[DEBUG] 뜻+예문 리스트: {da_kyn}")
+        return num_d, word_d
+
+    @traced("get_words", "set_id")
     def get_words_for_set(self, set_id, class_id):
+        """Word list of a set; read over HTTP when possible, so the browser may stay where it is."""
         try:
-            set_site = f"https://www.classcard.net/set/{set_id}/{class_id}"
-            self.driver.get(set_site)
-            time.sleep(1)
-            self.driver.find_element(
-                By.CSS_SELECTOR,
-                "body > div.test > div.p-b-sm > div.set-body.m-t-25.m-b-lg > div.m-b-md.pos-relative > div.dropdown > a",
-            ).click()
-            self.driver.find_element(
-                By.CSS_SELECTOR,
-                "body > div.test > div.p-b-sm > div.set-body.m-t-25.m-b-lg > div.m-b-md.pos-relative > div.dropdown.open > ul > li:nth-child(1) > a",
-            ).click()
-            html = BeautifulSoup(self.driver.page_source, "html.parser")
-            cards_ele = html.find("div", class_="flip-body")
-            num_d = len(cards_ele.find_all("div", class_="flip-card"))
-            time.sleep(0.5)
-            word_d = word_get(self.driver, num_d)
-            da_e, da_k, da_kyn = word_d
-            print(f"[DEBUG] 영어단어 리스트: {da_e}")
-            print(f"[DEBUG] 한글단어 리스트: {da_k}")
-            print(f"[DEBUG] 뜻+예문 리스트: {da_kyn}")
-            return num_d, word_d
+            if self.http_ready():
+                with span("http_get"):
+                    html = self.reader.set_page(set_id, class_id)
+                if html is None:
+                    self._http_failed()
+                else:
+                    result = self._words_from_page(set_id, class_id, html, browser=False)
+                    if result is not None:
+                        return result
+                    print(f"[INFO] 세트 {set_id} HTTP 파싱 실패, 브라우저에서 다시 읽습니다.")
+            return self._words_from_page(set_id, class_id, self._set_page_in_browser(set_id, class_id))
         except Exception as e:
             print(f"[ERROR] Failed to get words for set: {e}")
-            return 0, ([], [], [])
+            return 0, WordBank([])
+
+    @traced("navigate", "set_id")
+    def open_set(self, set_id, class_id):
+        set_site = f"{self.base_url}/set/{set_id}/{class_id}"
+        self.navigator.goto(self.driver, set_site, "set")
+
+    def load_words(self, set_id, class_id):
+        """Return the run-scoped word memo for a set, scraping it only on first use."""
+        key = (str(set_id), str(class_id))
+        self._current_set = key
+        if key not in self._word_memo:
+            html = self._pages.pop(key, None)
+            if html is None and self._prefetcher is not None:
+                html = self._prefetcher.take(set_id, class_id)
+            # 미리 받은 페이지도 캐시 확인/저장과 로그를 같은 경로로 처리
+            prefetched = self._words_from_page(set_id, class_id, html, browser=False) if html is not None else None
+            if prefetched is not None and prefetched[0]:
+                self._word_memo[key] = prefetched
+        if key in self._word_memo:
+            self.open_set(set_id, class_id)
+            return self._word_memo[key]
+        num_d, word_d = self.get_words_for_set(set_id, class_id)
+        if num_d:
+            self._word_memo[key] = (num_d, word_d)
+        self.open_set(set_id, class_id)  # 학습을 위해 세트 화면으로 (이미 세트 화면이면 다시 읽지 않음)
+        return num_d, word_d
 
-    def run_recall_learning(self, num_d, word_d):
+    def refresh_words(self):
+        """Re-read the current set's words over HTTP without leaving the learn page; WordBank or None."""
+        if self._current_set is None or not self.http_ready():
+            return None
+        set_id, class_id = self._current_set
+        with span("refresh_words", set_id=set_id):
+            result = self.reader.get_words(set_id, class_id)
+        if result is None:
+            return None
+        print(f"[INFO] 세트 {set_id} 단어 목록을 학습 화면에서 HTTP 로 다시 읽었습니다.")
+        self._word_memo[self._current_set] = result
+        if self.word_cache is not None:
+            self.word_cache.invalidate(set_id, class_id)
+        return result[1]
+
+    def invalidate_words(self, set_id, class_id):  # 세트 내용이 바뀐 것이 확인된 경우에만 호출
+        print(f"[INFO] 세트 {set_id} 단어 목록이 변경되어 다시 불러옵니다.")
+        self._word_memo.pop((str(set_id), str(class_id)), None)
+        if self.word_cache is not None:
+            self.word_cache.invalidate(set_id, class_id)
+
+    def _exit_study(self):  # 학습종료 버튼으로 세트 화면 복귀 (없으면 종료 확인 창, 그래도 안 되면 뒤로 가기)
+        driver = self.driver
         try:
-            print("[INFO] 리콜학습 시작...")
-            driver = self.driver
-            da_e, da_k, _ = word_d
-            driver.find_element(
-                By.XPATH,
-                "/html/body/div[2]/div/div[2]/div[1]/div[2]",
-            ).click()
-            time.sleep(1)
             driver.find_element(
                 By.CSS_SELECTOR,
-                "#wrapper-learn > div.start-opt-body > div > div > div > div.m-t > a",
+                "a.cc.remote_left[onclick*='study_end']"
             ).click()
-            time.sleep(2)
-            completed_words = 0
-            for i in range(num_d):
-                try:
-                    cash_d = driver.find_element(
-                        By.XPATH,
-                        f"//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{i+1}]/div[1]/div/div/div/div[1]/span",
-                    ).text
-                    choice_list_element = driver.find_element(
+            wait_absent(driver, "#wrapper-learn")
+        except:
+            try:
+                driver.find_element(
+                    By.XPATH, "/html/body/div[1]/div/div[1]/div[1]"
+                ).click()
+                wait_visible(driver, STUDY_END_CONFIRM, "click_settle")
+                driver.find_element(By.XPATH, STUDY_END_CONFIRM).click()
+            except:
+                print("[WARNING] Could not find exit button, trying to go back")
+                driver.back()
+        self.navigator.forget()
+
+    @traced("mode", mode="recall")
+    def run_recall_learning(self, num_d, word_d, start=0):
+        """Recall mode; ``start`` > 0 continues a learn page that is still open at card start + 1."""
+        try:
+            print("[INFO] 리콜학습 시작..." if not start else f"[INFO] 리콜학습 카드 {start + 1}부터 이어서 진행...")
+            driver = self.driver
+            bank = WordBank.from_word_d(word_d)
+            refreshed = False
+            if not start:
+                with span("start"):
+                    driver.find_element(
                         By.XPATH,
-                        f"//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{i+1}]/div[3]",
-                    )
-                    for choice_item in choice_list_element.find_elements(By.TAG_NAME, "div"):
-                        choice_text = choice_item.text
-                        if choice_text in da_k:
-                            if cash_d == da_e[da_k.index(choice_text)]:
-                                choice_item.click()
-                                break
-                        elif choice_text in da_e:
-                            if cash_d == da_k[da_e.index(choice_text)]:
-                                choice_item.click()
-                                break
-                        else:
-                            continue
-                    else:
-                        print("모르는 단어 감지됨")
-                        raise RecallUnknownWordException("모르는 단어 감지됨: no match found, random guess made.")
+                        "/html/body/div[2]/div/div[2]/div[1]/div[2]",
+                    ).click()
+                    self.navigator.ready(driver, "learn")
+                    driver.find_element(By.CSS_SELECTOR, LEARN_START).click()
+                    wait_visible(driver, LEARN_PROMPT.format(n=1), "learn_ready")
+            completed_words = start
+            for i in range(start, num_d):
+                with span("card", index=i + 1):
+                    attempt = 0
+                    while True:
+                        try:
+                            with span("lookup"):
+                                cash_d = driver.find_element(By.XPATH, LEARN_PROMPT.format(n=i + 1)).text
+                                choice_list_element = driver.find_element(
+                                    By.XPATH,
+                                    f"//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{i+1}]/div[3]",
+                                )
+                                items = choice_list_element.find_elements(By.TAG_NAME, "div")
+                                choices = []
+                                choice = None
+                                for item in items:  # 정확히 일치하는 선택지를 찾으면 나머지 텍스트는 읽지 않음
+                                    choices.append(item.text)
+                                    if bank.is_pair(cash_d, choices[-1]):
+                                        choice = item
+                                        break
+                                else:
+                                    # 유사 매칭(오타 허용)은 단어 목록을 다시 읽어 본 뒤에만 사용
+                                    index = bank.choose(cash_d, choices) if refreshed else None
+                                    choice = items[index] if index is not None else None
+                            if choice is None and not refreshed:  # 학습 화면을 떠나지 않고 단어만 다시 읽어 봄
+                                refreshed = True
+                                fresh = self.refresh_words()
+                                if fresh is not None:
+                                    bank = fresh
+                                    continue
+                                index = bank.choose(cash_d, choices)  # 다시 읽을 수 없으면 유사 매칭 허용
+                                choice = items[index] if index is not None else None
+                            if choice is None:
+                                print("모르는 단어 감지됨")
+                                raise RecallUnknownWordException("모르는 단어 감지됨: no match found, random guess made.")
+                            with span("click"):
+                                choice.click()
+                            break
+                        except RecallUnknownWordException:
+                            print(f"[INFO] 리콜학습 중단됨 (모르는 단어): 완료된 단어 {completed_words}/{num_d}")
+                            self._exit_study()
+                            raise
+                        except Exception as e:
+                            attempt += 1
+                            if classify(e) != TRANSIENT or attempt >= CARD_RETRIES:
+                                raise ModeInterrupted("recall", completed_words, e) from e
+                            print(f"[WARNING] 리콜학습 카드 {i + 1} 처리 실패, 같은 카드 재시도: {e}")
+                            self.backoff.wait(attempt)
                     completed_words += 1
-                    time.sleep(3)
-                except RecallUnknownWordException:
-                    print(f"[INFO] 리콜학습 중단됨 (모르는 단어): 완료된 단어 {completed_words}/{num_d}")
-                    try:
-                        driver.find_element(
-                            By.CSS_SELECTOR, 
-                            "a.cc.remote_left[onclick*='study_end']"
-                        ).click()
-                        time.sleep(2)
-                    except:
+                    if i + 1 < num_d:
+                        wait_visible(driver, LEARN_PROMPT.format(n=i + 2))
+                    else:
+                        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
+            print(f"[INFO] 리콜학습 완료: {completed_words}/{num_d} 단어")
+            with span("cleanup"):
+                try:
+                    wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
+                    current_url = driver.current_url
+                    if "wrapper-learn" in current_url or "study" in current_url:
                         try:
                             driver.find_element(
-                                By.XPATH, "/html/body/div[1]/div/div[1]/div[1]"
-                            ).click()
-                            time.sleep(1)
-                            driver.find_element(
-                                By.XPATH, "//*[@id='wrapper-learn']/div[2]/div/div/div/div[5]/a[3]"
+                                By.CSS_SELECTOR, 
+                                "a.cc.remote_left[onclick*='study_end']"
                             ).click()
+                            wait_absent(driver, "#wrapper-learn")
                         except:
-                            print("[WARNING] Could not find exit button, trying to go back")
                             driver.back()
-                    raise
                 except Exception as e:
-                    print(f"[WARNING] 리콜학습 중 예외 발생 (단어 {i+1}): {e}")
-                    continue
-            print(f"[INFO] 리콜학습 완료: {completed_words}/{num_d} 단어")
-            try:
-                time.sleep(2)
-                current_url = driver.current_url
-                if "wrapper-learn" in current_url or "study" in current_url:
-                    try:
-                        driver.find_element(
-                            By.CSS_SELECTOR, 
-                            "a.cc.remote_left[onclick*='study_end']"
-                        ).click()
-                        time.sleep(2)
-                    except:
-                        driver.back()
-            except Exception as e:
-                print(f"[WARNING] Error during recall completion cleanup: {e}")
+                    print(f"[WARNING] Error during recall completion cleanup: {e}")
+                self.navigator.forget()
             return completed_words, num_d
         except Exception as e:
             print(f"[ERROR] Recall learning failed: {e}")
             raise
 
-    def run_spelling_learning(self, num_d, word_d):
+    @traced("mode", mode="spelling")
+    def run_spelling_learning(self, num_d, word_d, start=0):
+        """Spelling mode; ``start`` > 0 continues a learn page that is still open at card start + 1."""
         try:
-            print("[INFO] 스펠학습 시작...")
+            print("[INFO] 스펠학습 시작..." if not start else f"[INFO] 스펠학습 카드 {start + 1}부터 이어서 진행...")
             driver = self.driver
-            da_e, da_k, _ = word_d
-            driver.find_element(
-                By.XPATH,
-                "/html/body/div[2]/div/div[2]/div[1]/div[3]",
-            ).click()
-            time.sleep(1)
-            driver.find_element(
-                By.XPATH,
-                "/html/body/div[2]/div[2]/div/div/div/div[4]/a",
-            ).click()
-            time.sleep(1)
-            completed_words = 0
-            try:
-                for i in range(1, num_d + 1):
-                    cash_d = driver.find_element(
-                        By.XPATH,
-                        f"//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{i}]/div[1]/div/div/div/div[1]/span",
-                    ).text.split("\n")[0]
-                    try:
-                        if cash_d.upper() != cash_d.lower():
-                            try:
-                                text = da_k[da_e.index(cash_d)]
-                            except ValueError:
-                                text = da_e[da_k.index(cash_d)]
-                        else:
-                            text = da_e[da_k.index(cash_d)]
-                    except ValueError:
-                        print("모르는 단어 감지됨")
-                        raise SpellingUnknownWordException("모르는 단어 감지됨: no match found in word list.")
-                    in_tag = driver.find_element(
-                        By.XPATH,
-                        f"/html/body/div[2]/div[1]/div/div[2]/div[2]/div[{i}]/div[2]/div/div/div/div[2]/input",
-                    )
-                    in_tag.click()
-                    in_tag.send_keys(text)
+            bank = WordBank.from_word_d(word_d)
+            refreshed = False
+            if not start:
+                with span("start"):
                     driver.find_element(
-                        By.XPATH, "//*[@id='wrapper-learn']/div/div/div[3]"
+                        By.XPATH,
+                        "/html/body/div[2]/div/div[2]/div[1]/div[3]",
                     ).click()
-                    time.sleep(1.5)
-                    try:
-                        driver.find_element(
-                            By.XPATH, "//*[@id='wrapper-learn']/div/div/div[3]/div[2]"
-                        ).click()
-                    except:
-                        pass
+                    self.navigator.ready(driver, "learn")
+                    driver.find_element(By.XPATH, SPELLING_START).click()
+                    wait_visible(driver, SPELLING_INPUT.format(n=1), "learn_ready")
+            completed_words = start
+            for i in range(start + 1, num_d + 1):
+                with span("card", index=i):
+                    attempt = 0
+                    while True:
+                        try:
+                            with span("lookup"):
+                                cash_d = driver.find_element(By.XPATH, LEARN_PROMPT.format(n=i)).text.split("\n")[0]
+                                # 유사 매칭(오타 허용)은 단어 목록을 다시 읽어 본 뒤에만 사용
+                                text = bank.answer_for(cash_d, fuzzy=refreshed)
+                            if text is None and not refreshed:  # 학습 화면을 떠나지 않고 단어만 다시 읽어 봄
+                                refreshed = True
+                                fresh = self.refresh_words()
+                                if fresh is not None:
+                                    bank = fresh
+                                    continue
+                                text = bank.answer_for(cash_d)  # 다시 읽을 수 없으면 유사 매칭 허용
+                            if text is None:
+                                print("모르는 단어 감지됨")
+                                raise SpellingUnknownWordException("모르는 단어 감지됨: no match found in word list.")
+                            with span("type"):
+                                in_tag = driver.find_element(By.XPATH, SPELLING_INPUT.format(n=i))
+                                in_tag.click()
+                                if attempt:  # 재시도: 이전 시도에서 입력한 내용 지우기
+                                    in_tag.clear()
+                                in_tag.send_keys(text)
+                            with span("click"):
+                                driver.find_element(
+                                    By.XPATH, "//*[@id='wrapper-learn']/div/div/div[3]"
+                                ).click()
+                            break
+                        except SpellingUnknownWordException:
+                            print(f"[INFO] 스펠학습 중단됨 (모르는 단어): 완료된 단어 {completed_words}/{num_d}")
+                            self._exit_study()
+                            raise
+                        except Exception as e:
+                            attempt += 1
+                            if classify(e) != TRANSIENT or attempt >= CARD_RETRIES:
+                                raise ModeInterrupted("spelling", completed_words, e) from e
+                            print(f"[WARNING] 스펠학습 카드 {i} 처리 실패, 같은 카드 재시도: {e}")
+                            self.backoff.wait(attempt)
+                    # 정답 확인 후 '다음' 버튼이 뜨거나 다음 카드가 바로 활성화될 때까지 대기
+                    next_input = SPELLING_INPUT.format(n=i + 1)
+                    if wait_for(driver, [("visible", SPELLING_NEXT), ("visible", next_input)]) == 0:
+                        try:
+                            driver.find_element(By.XPATH, SPELLING_NEXT).click()
+                        except:
+                            pass
+                        if i < num_d:
+                            wait_visible(driver, next_input)
                     completed_words += 1
-                    time.sleep(0.5)
-            except SpellingUnknownWordException:
-                print(f"[INFO] 스펠학습 중단됨 (모르는 단어): 완료된 단어 {completed_words}/{num_d}")
+            print(f"[INFO] 스펠학습 완료: {completed_words}/{num_d} 단어")
+            with span("cleanup"):
                 try:
-                    driver.find_element(
-                        By.CSS_SELECTOR, 
-                        "a.cc.remote_left[onclick*='study_end']"
-                    ).click()
-                    time.sleep(2)
-                except:
-                    try:
-                        driver.find_element(
-                            By.XPATH, "/html/body/div[1]/div/div[1]/div[1]"
-                        ).click()
-                        time.sleep(1)
-                        driver.find_element(
-                            By.XPATH, "//*[@id='wrapper-learn']/div[2]/div/div/div/div[5]/a[3]"
-                        ).click()
-                    except:
-                        print("[WARNING] Could not find exit button, trying to go back")
-                        driver.back()
-                raise
-            except NoSuchElementException:
-                if completed_words < num_d:
-                    print(f"[WARNING] 스펠학습이 예상보다 일찍 종료됨. 완료된 단어: {completed_words}/{num_d}")
-                else:
-                    print(f"[INFO] 스펠학습 완료: {completed_words}/{num_d} 단어")
-            try:
-                time.sleep(2)
-                current_url = driver.current_url
-                if "wrapper-learn" in current_url or "study" in current_url:
-                    try:
-                        driver.find_element(
-                            By.CSS_SELECTOR, 
-                            "a.cc.remote_left[onclick*='study_end']"
-                        ).click()
-                        time.sleep(2)
-                    except:
-                        driver.back()
-            except Exception as e:
-                print(f"[WARNING] Error during spelling completion cleanup: {e}")
+                    wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
+                    current_url = driver.current_url
+                    if "wrapper-learn" in current_url or "study" in current_url:
+                        try:
+                            driver.find_element(
+                                By.CSS_SELECTOR, 
+                                "a.cc.remote_left[onclick*='study_end']"
+                            ).click()
+                            wait_absent(driver, "#wrapper-learn")
+                        except:
+                            driver.back()
+                except Exception as e:
+                    print(f"[WARNING] Error during spelling completion cleanup: {e}")
+                self.navigator.forget()
             return completed_words, num_d
         except Exception as e:
             print(f"[ERROR] Spelling learning failed: {e}")
             raise
 
+    @traced("mode", mode="test")
     def run_test_learning(self, num_d, word_d):
-        import re
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
         driver = self.driver
-        da_e, da_k, da_kyn = word_d
-        def normalize(text):
-            return re.sub(r'[^\u0000-\u007f\w\d]', '', str(text).lower().strip())
-        print("[DEBUG] 영어단어 리스트:", da_e)
-        print("[DEBUG] 한글단어 리스트:", da_k)
-        print("[DEBUG] 뜻+예문 리스트:", da_kyn)
+        bank = WordBank.from_word_d(word_d)
         try:
-            for _ in range(3):
-                overlays = driver.find_elements(By.CSS_SELECTOR, '.modal, .modal-backdrop, .overlay, .popup, .modal-footer')
-                for overlay in overlays:
+            with span("start"):
+                self.navigator.forget()  # 테스트 화면은 클릭으로 전환됨
+                for _ in range(3):
+                    _, overlay = probe(driver, OVERLAY_SELECTORS, VISIBLE)
+                    if overlay is None:
+                        break
                     try:
-                        if overlay.is_displayed():
-                            close_btns = overlay.find_elements(By.TAG_NAME, 'a') + overlay.find_elements(By.TAG_NAME, 'button')
-                            if close_btns:
-                                close_btns[-1].click()
-                                time.sleep(0.2)
+                        close_btns = overlay.find_elements(By.TAG_NAME, 'a') + overlay.find_elements(By.TAG_NAME, 'button')
+                        if not close_btns:
+                            break
+                        close_btns[-1].click()
+                        time.sleep(0.2)
                     except Exception as e:
                         print(f"[ERROR] Overlay close failed: {e}")
+                    time.sleep(0.15)
+                for attempt in range(3):
+                    try:
+                        WebDriverWait(driver, 10).until(
+                            EC.element_to_be_clickable((By.XPATH, "/html/body/div[2]/div/div[2]/div[2]/div"))
+                        ).click()
+                        break
+                    except Exception as e:
+                        print(f"[ERROR] 테스트 시작 버튼 클릭 실패 (시도 {attempt+1}): {e}")
+                        if attempt == 2:
+                            input("[MANUAL] 테스트 시작 버튼이 차단되었습니다. 팝업/오버레이를 수동으로 닫고 Enter를 눌러주세요...")
+                        time.sleep(0.15)
+                else:
+                    print("[ERROR] 테스트 시작 버튼을 클릭할 수 없습니다. 메뉴로 돌아갑니다.")
+                    return 0, num_d
                 time.sleep(0.15)
-            for attempt in range(3):
                 try:
-                    WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "/html/body/div[2]/div/div[2]/div[2]/div"))
-                    ).click()
-                    break
+                    btn_condition_next = WebDriverWait(driver, 5).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-success.btn-lg.shadow.w-250.btn-condition-next"))
+                    )
+                    btn_condition_next.click()
+                    time.sleep(0.15)
                 except Exception as e:
-                    print(f"[ERROR] 테스트 시작 버튼 클릭 실패 (시도 {attempt+1}): {e}")
-                    if attempt == 2:
-                        input("[MANUAL] 테스트 시작 버튼이 차단되었습니다. 팝업/오버레이를 수동으로 닫고 Enter를 눌러주세요...")
+                    print(f"[ERROR] 조건 확인 버튼 클릭 실패: {e}")
+                try:
+                    btn_quiz_start = WebDriverWait(driver, 5).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-success.btn-xl.shadow.w-250.btn-quiz-start"))
+                    )
+                    btn_quiz_start.click()
                     time.sleep(0.15)
-            else:
-                print("[ERROR] 테스트 시작 버튼을 클릭할 수 없습니다. 메뉴로 돌아갑니다.")
-                return 0, num_d
-            time.sleep(0.15)
-            try:
-                btn_condition_next = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-success.btn-lg.shadow.w-250.btn-condition-next"))
-                )
-                btn_condition_next.click()
-                time.sleep(0.15)
-            except Exception as e:
-                print(f"[ERROR] 조건 확인 버튼 클릭 실패: {e}")
-            try:
-                btn_quiz_start = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-success.btn-xl.shadow.w-250.btn-quiz-start"))
-                )
-                btn_quiz_start.click()
+                except Exception as e:
+                    print(f"[ERROR] 퀴즈 시작 버튼 클릭 실패: {e}")
+                try:
+                    WebDriverWait(driver, 2).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, "#alertModal > div.modal-dialog > div > div.text-center.m-t-xl > a"))
+                    ).click()
+                except Exception:
+                    pass
                 time.sleep(0.15)
-            except Exception as e:
-                print(f"[ERROR] 퀴즈 시작 버튼 클릭 실패: {e}")
-            try:
-                WebDriverWait(driver, 2).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "#alertModal > div.modal-dialog > div > div.text-center.m-t-xl > a"))
-                ).click()
-            except Exception:
-                pass
-            time.sleep(0.15)
             completed_words = 0
             for i in range(1, int(num_d) + 1):
-                try:
-                    cash_d = driver.find_element(
-                        By.XPATH,
-                        f"//*[@id='testForm']/div[{i}]/div/div[1]/div[2]/div[2]/div/div",
-                    ).text.split("\n")[0]
-                    element = driver.find_element(
-                        By.XPATH,
-                        f"//*[@id='testForm']/div[{i}]/div/div[1]/div[2]/div[2]/div/div",
-                    )
-                    element.click()
-                    print(f"[DEBUG] 카드 {i} 앞면 클릭됨 (original XPath).")
-                    time.sleep(1)
-                    try:
-                        if cash_d.upper() != cash_d.lower():
-                            try:
-                                text = da_k[da_e.index(cash_d)]
-                            except ValueError:
-                                text = da_e[da_k.index(cash_d)]
-                        else:
-                            text = da_e[da_k.index(cash_d)]
-                    except ValueError:
-                        text = "모름"
-                    print(f"[PROBLEM] 카드 {i} 질문: '{cash_d}' | [SUPPOSED ANSWER]: '{text}'")
+                with span("card", index=i):
                     try:
-                        input_tag = driver.find_element(
-                            By.XPATH,
-                            f"//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[1]/input",
-                        )
-                        submit_tag = driver.find_element(
-                            By.XPATH,
-                            f"//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[2]/a",
-                        )
-                        input_tag.click()
-                        input_tag.send_keys(text)
-                        submit_tag.click()
-                        print(f"[DEBUG] 카드 {i} 입력창에 답안 입력 및 제출: '{text}' (original XPath)")
-                    except NoSuchElementException:
+                        with span("lookup"):
+                            element = driver.find_element(By.XPATH, TEST_PROMPT.format(n=i))
+                            cash_d = element.text.split("\n")[0]
+                        with span("click"):
+                            element.click()
+                        print(f"[DEBUG] 카드 {i} 앞면 클릭됨 (original XPath).")
+                        wait_for(driver, [("visible", TEST_INPUT.format(n=i)), ("visible", TEST_CHOICES.format(n=i))], "click_settle")
+                        with span("lookup"):
+                            text = bank.answer_for(cash_d)
+                        if text is None:
+                            text = "모름"
+                        print(f"[PROBLEM] 카드 {i} 질문: '{cash_d}' | [SUPPOSED ANSWER]: '{text}'")
                         try:
-                            box_items = driver.find_element(
+                            input_tag = driver.find_element(By.XPATH, TEST_INPUT.format(n=i))
+                            submit_tag = driver.find_element(
                                 By.XPATH,
-                                f"/html/body/div[2]/div/div[2]/div[2]/form/div[{i}]/div/div[2]/div/div[1]",
+                                f"//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[2]/a",
                             )
-                            box_items = box_items.find_elements(By.TAG_NAME, "div")
-                            if text == "모름":
-                                print("모르는 단어 감지됨")
-                                box_items[0].click()
-                            for box_item in box_items:
-                                if box_item.text == text:
-                                    box_item.click()
-                                    print(f"[DEBUG] 카드 {i} 선택지 클릭: '{box_item.text}' (정답: '{text}') (original XPath)")
-                                    break
-                        except Exception as e:
-                            print(f"[ERROR] 카드 {i} 선택지 클릭 실패 (original XPath): {e}")
-                    time.sleep(2)
-                    completed_words += 1
-                except Exception as e:
-                    print(f"[ERROR] 카드 {i} 처리 중 예외 발생: {e}")
-                    continue
+                            input_tag.click()
+                            input_tag.send_keys(text)
+                            submit_tag.click()
+                            print(f"[DEBUG] 카드 {i} 입력창에 답안 입력 및 제출: '{text}' (original XPath)")
+                        except NoSuchElementException:
+                            try:
+                                box_items = driver.find_element(By.XPATH, TEST_CHOICES.format(n=i))
+                                box_items = box_items.find_elements(By.TAG_NAME, "div")
+                                choices = [box_item.text for box_item in box_items]
+                                index = bank.choose(cash_d, choices)
+                                if index is None:
+                                    print("모르는 단어 감지됨")
+                                    index = 0
+                                box_items[index].click()
+                                print(f"[DEBUG] 카드 {i} 선택지 클릭: '{choices[index]}' (정답: '{text}') (original XPath)")
+                            except Exception as e:
+                                print(f"[ERROR] 카드 {i} 선택지 클릭 실패 (original XPath): {e}")
+                        if i < int(num_d):
+                            wait_visible(driver, TEST_PROMPT.format(n=i + 1))
+                        else:
+                            wait_for(driver, [("mutation",)], "click_settle", root="#testForm")
+                        completed_words += 1
+                    except Exception as e:
+                        print(f"[ERROR] 카드 {i} 처리 중 예외 발생: {e}")
+                        continue
             print(f"[INFO] 테스트학습 완료: {completed_words}/{num_d} 단어")
             return completed_words, num_d
         except Exception as e:
             print(f"[ERROR] 테스트학습 실패: {e}")
             raise
 
-    def run_multiple_modes(self, set_id, class_id, modes):
-        results = {}
-        num_d, word_d = self.get_words_for_set(set_id, class_id)
-        for mode in modes:
-            retry_count = 0
-            completed = False
-            while retry_count < 5 and not completed:
-                try:
-                    if mode == "recall":
-                        completed_words, total_words = self.run_recall_learning(num_d, word_d)
-                    elif mode == "spelling":
-                        completed_words, total_words = self.run_spelling_learning(num_d, word_d)
-                    elif mode == "test":
-                        completed_words, total_words = self.run_test_learning(num_d, word_d)
-                    else:
-                        continue
-                    completion_percentage = (completed_words / total_words) * 100
-                    results[mode] = {
-                        "completed_words": completed_words,
-                        "total_words": total_words,
-                        "percentage": completion_percentage
-                    }
-                    if completion_percentage >= 100:
-                        print(f"[SUCCESS] {mode} learning completed: {completed_words}/{total_words} ({completion_percentage:.1f}%)")
-                        completed = True
-                    else:
-                        print(f"[RETRY] {mode} learning incomplete: {completed_words}/{total_words} ({completion_percentage:.1f}%) - Retrying...")
-                        retry_count += 1
-                        set_site = f"https://www.classcard.net/set/{set_id}/{class_id}"
-                        self.driver.get(set_site)
-                        time.sleep(2)
-                        num_d, word_d = self.get_words_for_set(set_id, class_id)
-                except Exception as e:
-                    print(f"[ERROR] {mode} learning failed: {e}")
-                    retry_count += 1
-                    set_site = f"https://www.classcard.net/set/{set_id}/{class_id}"
-                    self.driver.get(set_site)
-                    time.sleep(2)
-                    num_d, word_d = self.get_words_for_set(set_id, class_id)
-        return results
+    def study(self, mode, num_d, word_d, start=0):
+        """Run one study mode from the set page; (completed_words, total_words)."""
+        if mode == "recall":
+            return self.run_recall_learning(num_d, word_d, start)
+        if mode == "spelling":
+            return self.run_spelling_learning(num_d, word_d, start)
+        if mode == "test":
+            return self.run_test_learning(num_d, word_d)
+        raise ValueError(f"지원하지 않는 학습 모드: {mode}")
 
-    def run_range_automation(self, class_id, start_set_id, end_set_id, modes):
-        sets = self.get_sets(class_id)
-        set_indices = [i for i in sets if start_set_id <= int(sets[i]["set_id"]) <= end_set_id]
-        results = {}
-        for i in set_indices:
-            set_id = sets[i]["set_id"]
-            set_title = sets[i]["title"]
-            print(f"[INFO] Processing set {set_id}")
-            print(f"[INFO] Set: {set_title}")
-            set_results = self.run_multiple_modes(set_id, class_id, modes)
-            results[set_id] = {
-                "title": set_title,
-                "results": set_results
-            }
-        return results
+    def scheduler(self, class_id, stop_callback=None, listener=None, skip_complete=False):
+        """ModeScheduler reporting to the console, the ledger and an optional extra ``listener``."""
+        listeners = [print_event]
+        if self.ledger is not None:
+            listeners.append(self.ledger.on_event)
+        if listener is not None:
+            listeners.append(listener)
+        return ModeScheduler(self, class_id, listeners, stop_callback, skip_complete=skip_complete)
 
-    def run_range_automation_with_stop(self, class_id, start_set_id, end_set_id, modes, stop_callback):
-        sets = self.get_sets(class_id)
-        set_indices = [i for i in sets if start_set_id <= int(sets[i]["set_id"]) <= end_set_id]
-        results = {}
-        for i in set_indices:
-            if stop_callback and stop_callback():
-                print("[INFO] 중지 요청 감지됨. 자동화 중단.")
-                break
-            set_id = sets[i]["set_id"]
-            set_title = sets[i]["title"]
-            print(f"[INFO] Processing set {set_id}")
-            print(f"[INFO] Set: {set_title}")
-            set_results = {}
+    @traced("modes", "set_id", run=True)
+    def run_multiple_modes(self, set_id, class_id, modes, listener=None):
+        self._word_memo = {}
+        try:
+            results = self.scheduler(class_id, listener=listener).run(plan_jobs([set_id], modes))
+        finally:
+            if self.word_cache is not None:
+                self.word_cache.flush()
+        return results.get(str(set_id), {}).get("results", {})
+
+    def recover_mode(self, set_id, class_id, mode, error, attempt):
+        """(num_d, word_d, start card) to retry a failed mode with, depending on the kind of failure.
+
+        Transient failures back off and, if the learn page still shows the card the
+        mode stopped at, continue from it; changed words re-read the set; fatal
+        failures (browser or session gone) are re-raised.
+        """
+        kind = classify(error)
+        if kind == FATAL:
+            print(f"[ERROR] 브라우저 세션을 잃어 {mode} 학습을 다시 시도하지 않습니다: {error}")
+            raise error
+        if kind == WORDS:
+            self.invalidate_words(set_id, class_id)
+        else:
+            self.backoff.wait(attempt)
+            start = error.completed if isinstance(error, ModeInterrupted) else 0
+            memo = self._word_memo.get((str(set_id), str(class_id)))
+            if start and memo is not None and probe(self.driver, [LEARN_PROMPT.format(n=start + 1)], VISIBLE)[0] is not None:
+                print(f"[INFO] {mode} 학습 화면 유지: 카드 {start + 1}부터 이어서 진행합니다.")
+                return (*memo, start)
+        return (*self.load_words(set_id, class_id), 0)
+
+    def resume_state(self, class_id, resume):
+        """{(set_id, mode): result} already at 100% in the ledger when resuming, else {}."""
+        if not resume:
+            return {}
+        if self.ledger is None:
+            print("[WARNING] 실행 기록이 꺼져 있어 이어하기를 할 수 없습니다.")
+            return {}
+        done = self.ledger.completed(class_id)
+        print(f"[INFO] 이어하기: 실행 기록에서 완료된 세트/모드 {len(done)}개를 건너뜁니다.")
+        return done
+
+    @traced("progress", "class_id")
+    def get_progress(self, set_ids, class_id):
+        """{set_id: (num_d, {mode: percent or None})} from each set page over HTTP, read before any word scraping.
+
+        The pages are kept for load_words, so a set studied afterwards is not downloaded again.
+        """
+        progress = {}
+        for set_id in set_ids:
+            with span("http_get", set_id=set_id):
+                html = self.reader.set_page(set_id, class_id)
+            if html is None:
+                self._http_failed()
+                break  # 나머지 세트는 load_words 가 연 세트 화면에서 확인
+            self._pages[(str(set_id), str(class_id))] = html
+            cards_ele = html.find("div", class_="flip-body")
+            num_d = len(cards_ele.find_all("div", class_="flip-card")) if cards_ele else 0
+            progress[set_id] = (num_d, parse_progress(html))
+        return progress
+
+    def site_percent(self, set_id, class_id, mode):
+        """Progress of a mode on the last read page of the set (see load_words), or None."""
+        return self._progress.get((str(set_id), str(class_id)), {}).get(mode)
+
+    def complete_state(self, set_ids, class_id, modes, done):
+        """Add modes already at 100% on the site to ``done`` (checked for the whole range in one pass).
+
+        The pass needs the HTTP session; in the browser it would open every set
+        twice, so there the scheduler checks each set page as load_words opens it.
+        """
+        if not self.skip_complete or not self.http_ready():
+            return done
+        set_ids = [set_id for set_id in set_ids if any((set_id, mode) not in done for mode in modes)]
+        skipped = 0
+        for set_id, (num_d, progress) in self.get_progress(set_ids, class_id).items():
+            percents = ", ".join(f"{mode} {progress.get(mode)}%" for mode in modes if progress.get(mode) is not None)
+            print(f"[PROGRESS] 세트 {set_id}: {percents or '진행률 없음'}")
             for mode in modes:
-                if stop_callback and stop_callback():
-                    print("[INFO] 중지 요청 감지됨. 자동화 중단.")
-                    break
-                retry_count = 0
-                completed = False
-                num_d, word_d = self.get_words_for_set(set_id, class_id)
-                while retry_count < 5 and not completed:
-                    try:
-                        if mode == "recall":
-                            completed_words, total_words = self.run_recall_learning(num_d, word_d)
-                        elif mode == "spelling":
-                            completed_words, total_words = self.run_spelling_learning(num_d, word_d)
-                        elif mode == "test":
-                            completed_words, total_words = self.run_test_learning(num_d, word_d)
-                        else:
-                            continue
-                        completion_percentage = (completed_words / total_words) * 100
-                        set_results[mode] = {
-                            "completed_words": completed_words,
-                            "total_words": total_words,
-                            "percentage": completion_percentage
-                        }
-                        if completion_percentage >= 100:
-                            print(f"[SUCCESS] {mode} learning completed: {completed_words}/{total_words} ({completion_percentage:.1f}%)")
-                            completed = True
-                        else:
-                            print(f"[RETRY] {mode} learning incomplete: {completed_words}/{total_words} ({completion_percentage:.1f}%) - Retrying...")
-                            retry_count += 1
-                            set_site = f"https://www.classcard.net/set/{set_id}/{class_id}"
-                            self.driver.get(set_site)
-                            time.sleep(2)
-                            num_d, word_d = self.get_words_for_set(set_id, class_id)
-                    except Exception as e:
-                        print(f"[ERROR] {mode} learning failed: {e}")
-                        retry_count += 1
-                        set_site = f"https://www.classcard.net/set/{set_id}/{class_id}"
-                        self.driver.get(set_site)
-                        time.sleep(2)
-                        num_d, word_d = self.get_words_for_set(set_id, class_id)
-                    if stop_callback and stop_callback():
-                        print("[INFO] 중지 요청 감지됨. 자동화 중단.")
-                        break
-                results[set_id] = {
-                    "title": set_title,
-                    "results": set_results
-                }
+                percent = progress.get(mode)
+                if percent is not None and percent >= 100 and (set_id, mode) not in done:
+                    done[(set_id, mode)] = {"completed_words": num_d, "total_words": num_d, "percentage": percent}
+                    skipped += 1
+        if skipped:
+            print(f"[INFO] 진행률 100% 이상인 세트/모드 {skipped}개를 건너뜁니다.")
+        return done
+
+    def start_prefetch(self, set_ids, class_id):
+        """Prefetch the pages of the given sets over HTTP while the browser studies (range runs)."""
+        self.stop_prefetch()
+        if self.prefetch > 0 and self.http_ready() and len(set_ids) > 1:
+            self._prefetcher = WordPrefetcher(
+                self.reader.set_page, [(set_id, class_id) for set_id in set_ids], self.prefetch
+            )
+
+    def stop_prefetch(self):
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
+    @traced("range", "class_id", run=True)
+    def run_range_automation(self, class_id, start_set_id, end_set_id, modes, resume=False, listener=None):
+        return self._run_range(class_id, start_set_id, end_set_id, modes, None, resume, listener)
+
+    @traced("range", "class_id", run=True)
+    def run_range_automation_with_stop(self, class_id, start_set_id, end_set_id, modes, stop_callback, resume=False,
+                                       listener=None):
+        return self._run_range(class_id, start_set_id, end_set_id, modes, stop_callback, resume, listener)
+
+    def _run_range(self, class_id, start_set_id, end_set_id, modes, stop_callback, resume, listener):
+        self._word_memo = {}
+        self._pages = {}
+        self._progress = {}
+        sets = self.get_sets(class_id)
+        titles = {sets[i]["set_id"]: sets[i]["title"] for i in sets
+                  if start_set_id <= int(sets[i]["set_id"]) <= end_set_id}
+        done = self.resume_state(class_id, resume)
+        done = self.complete_state(list(titles), class_id, modes, done)
+        jobs = plan_jobs(titles, modes, done)
+        # 진행률 확인 때 받은 세트는 다시 받지 않음
+        self.start_prefetch([set_id for set_id in dict.fromkeys(set_id for set_id, _ in jobs)
+                             if (str(set_id), str(class_id)) not in self._pages], class_id)
+        scheduler = self.scheduler(class_id, stop_callback, listener, self.skip_complete)
+        if self.ledger is not None:
+            self.ledger.start_run(class_id, start_set_id, end_set_id, modes, resume)
+        try:
+            results = scheduler.run(jobs, titles, done)
+        finally:
+            self.stop_prefetch()
+            self._pages = {}
+            if self.word_cache is not None:
+                self.word_cache.flush()
+            if self.ledger is not None:
+                self.ledger.finish_run(stopped=scheduler.stopped())
+        if self.word_cache is not None:
+            print(f"[CACHE] {self.word_cache.stats()}")
+        if self.navigator.ready_times:
+            print(self.navigator.report())
         return results
 
     def close(self):
+        if self.word_cache is not None:
+            self.word_cache.flush()
         if self.driver:
-            self.driver.quit() 
\ No newline at end of file
+            self.driver.quit()
+            self.driver = None 
\ No newline at end of file
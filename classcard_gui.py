@@ -15,6 +15,7 @@ from handler.recall_learning import RecallLearning
 from handler.spelling_learning import SpellingLearning
 from handler.test_learning import TestLearning
 from classcard_core import ClassCardCore
+from scheduler import format_event
 
 CONFIG_FILE = 'config.json'
 
@@ -23,13 +24,14 @@ class AutomationThread(QThread):
     error_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
     
-    def __init__(self, core, class_id, start_set_id, end_set_id, modes):
+    def __init__(self, core, class_id, start_set_id, end_set_id, modes, resume=False):
         super().__init__()
         self.core = core
         self.class_id = class_id
         self.start_set_id = start_set_id
         self.end_set_id = end_set_id
         self.modes = modes
+        self.resume = resume
         self._stop_requested = False
         
     def run(self):
@@ -42,7 +44,9 @@ class AutomationThread(QThread):
                 self.start_set_id, 
                 self.end_set_id, 
                 self.modes,
-                self.is_stop_requested
+                self.is_stop_requested,
+                resume=self.resume,
+                listener=self.on_event
             )
             
             # Log final results
@@ -75,6 +79,11 @@ class AutomationThread(QThread):
             self.error_signal.emit(f"[ERROR] 자동화 중 오류 발생: {e}")
             self.finished_signal.emit()
 
+    def on_event(self, event):  # 세트/모드 진행 이벤트를 실시간으로 로그 창에 표시
+        line = format_event(event)
+        if line:
+            self.progress_signal.emit(line)
+
     def request_stop(self):
         self._stop_requested = True
 
@@ -189,6 +198,11 @@ class ClassCardGUI(QMainWindow):
         modes_layout.addWidget(self.spelling_checkbox)
         modes_layout.addWidget(self.test_checkbox)
         
+        # 실행 기록에서 이미 100% 완료된 세트/모드는 건너뜀
+        self.resume_checkbox = QCheckBox("이어하기")
+        self.resume_checkbox.setToolTip("이전 실행에서 100% 완료된 세트/모드를 건너뜁니다")
+        modes_layout.addWidget(self.resume_checkbox)
+        
         modes_group.setLayout(modes_layout)
         layout.addWidget(modes_group)
         
@@ -270,8 +284,9 @@ class ClassCardGUI(QMainWindow):
         # Run login in thread
         def login_thread():
             try:
-                self.core = ClassCardCore()
-                driver = self.core.setup_driver()
+                if self.core is None:
+                    self.core = ClassCardCore()
+                self.core.setup_driver()  # 이미 실행 중인 브라우저가 있으면 그대로 재사용
                 
                 if self.core.login(user_id, password):
                     self.log_message("[INFO] 로그인 성공!")
@@ -421,7 +436,8 @@ class ClassCardGUI(QMainWindow):
         
         # Create and start automation thread
         self.automation_thread = AutomationThread(
-            self.core, class_id, start_set_id, end_set_id, modes
+            self.core, class_id, start_set_id, end_set_id, modes,
+            resume=self.resume_checkbox.isChecked()
         )
         self.automation_thread.progress_signal.connect(self.log_message)
         self.automation_thread.error_signal.connect(self.log_message)
@@ -438,6 +454,12 @@ class ClassCardGUI(QMainWindow):
             self.stop_btn.setEnabled(False)
             self.log_message("[INFO] 자동화가 안전하게 중지되었습니다.")
     
+    def closeEvent(self, event):
+        """Quit Chrome so the persistent profile is unlocked for the next run"""
+        if self.core is not None and not self.is_running:
+            self.core.close()
+        super().closeEvent(event)
+
     def on_automation_finished(self):
         """Handle automation completion"""
         self.is_running = False
@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+_SELENIUM = os.sep + "selenium" + os.sep
+# 호출 위치로 보지 않는 모듈: 이 파일과 공용 대기/탐색 헬퍼 (그 헬퍼를 부른 코드가 호출 위치)
+_HELPERS = {os.path.join(_ROOT, name) for name in ("driver_profiler.py", "probe.py", "waits.py", "selector_registry.py")}
+
+
+def call_site() -> str:
+    """First frame outside selenium and the shared helpers, as "file.py:line function"."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _SELENIUM not in filename and filename not in _HELPERS:
+            break
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    filename = frame.f_code.co_filename
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    return f"{filename}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+class DriverProfiler:
+    """Counts and times every WebDriver command by command type and by calling code site."""
+
+    def __init__(self):
+        self.by_command = {}  # {command: [count, seconds]}
+        self.by_site = {}  # {call site: {command: [count, seconds]}}
+        self._driver = None
+        self._execute = None
+
+    def install(self, driver):
+        self._driver = driver
+        self._execute = driver.execute
+
+        def execute(driver_command, params=None):  # WebElement 도 부모 driver.execute 를 거침
+            start = time.perf_counter()
+            try:
+                return self._execute(driver_command, params)
+            finally:
+                self.record(driver_command, call_site(), time.perf_counter() - start)
+
+        driver.execute = execute
+        return self
+
+    def uninstall(self):
+        if self._driver is not None:
+            self._driver.__dict__.pop("execute", None)
+            self._driver = None
+
+    def record(self, command: str, site: str, seconds: float):
+        entry = self.by_command.setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry = self.by_site.setdefault(site, {}).setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def total(self) -> tuple:
+        return (sum(count for count, _ in self.by_command.values()),
+                sum(seconds for _, seconds in self.by_command.values()))
+
+    def reset(self):
+        self.by_command = {}
+        self.by_site = {}
+
+    def report(self, title: str = "", top: int = 10) -> str:
+        count, seconds = self.total()
+        prefix = f"{title} " if title else ""
+        lines = [f"[PROFILE] {prefix}WebDriver 명령 {count}개, 왕복 {seconds:.2f}s"]
+        lines.append(f"{'command':<28}{'count':>7}{'total(s)':>10}{'mean(ms)':>10}")
+        for command, (n, total) in sorted(self.by_command.items(), key=lambda item: -item[1][1])[:top]:
+            lines.append(f"{command:<28}{n:>7}{total:>10.2f}{total / n * 1000:>10.1f}")
+        sites = sorted(
+            self.by_site.items(),
+            key=lambda item: -sum(total for _, total in item[1].values()),
+        )[:top]
+        lines.append(f"{'call site':<52}{'count':>7}{'total(s)':>10}  commands")
+        for site, commands in sites:
+            n = sum(c for c, _ in commands.values())
+            total = sum(t for _, t in commands.values())
+            detail = ", ".join(f"{name}×{c}" for name, (c, _) in sorted(commands.items(), key=lambda i: -i[1][0]))
+            lines.append(f"{site[-52:]:<52}{n:>7}{total:>10.2f}  {detail}")
+        return "\n".join(lines)
@@ -1,8 +1,10 @@
 import contextlib
 import random
-import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from navigation import LEARN_PROMPT, LEARN_START, STUDY_END_CONFIRM
+from waits import wait_absent, wait_for, wait_visible
+from word_bank import WordBank
 
 
 class UnknownWordException(Exception):
@@ -13,29 +15,23 @@ class RecallLearning:
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver  # webdriver
 
-    def run(self, num_d: int, word_d: list, auto_exit: bool = True) -> None:  # 핸들러 실행
+    def run(self, num_d: int, word_d, auto_exit: bool = True) -> None:  # 핸들러 실행
         driver = self.driver
-        da_e, da_k, _ = word_d
+        bank = WordBank.from_word_d(word_d)
         driver.find_element(
             By.XPATH,
             "/html/body/div[2]/div/div[2]/div[1]/div[2]",
         ).click()  # 리콜학습 진입 버튼
-        time.sleep(1)
-        driver.find_element(
-            By.CSS_SELECTOR,
-            "#wrapper-learn > div.start-opt-body > div > div > div > div.m-t > a",
-        ).click()  # 리콜학습 시작 버튼
-        time.sleep(2)
+        wait_visible(driver, LEARN_START, "learn_ready")
+        driver.find_element(By.CSS_SELECTOR, LEARN_START).click()  # 리콜학습 시작 버튼
+        wait_visible(driver, LEARN_PROMPT.format(n=1), "learn_ready")
         
         completed_words = 0
         unknown_word_count = 0  # Track unknown words to prevent infinite loops
         
         for i in range(num_d):  # 단어 수 만큼 반복
             try:
-                cash_d = driver.find_element(
-                    By.XPATH,
-                    f"//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{i+1}]/div[1]/div/div/div/div[1]/span",
-                ).text  # 메인 단어 추출
+                cash_d = driver.find_element(By.XPATH, LEARN_PROMPT.format(n=i + 1)).text  # 메인 단어 추출
 
                 choice_list_element = driver.find_element(
                     By.XPATH,
@@ -46,19 +42,10 @@ class RecallLearning:
                 for choice_item in choice_list_element.find_elements(
                     By.TAG_NAME, "div"
                 ):
-                    choice_text = choice_item.text
-                    if choice_text in da_k:
-                        if cash_d == da_e[da_k.index(choice_text)]:
-                            choice_item.click()
-                            choice_made = True
-                            break
-                    elif choice_text in da_e:
-                        if cash_d == da_k[da_e.index(choice_text)]:
-                            choice_item.click()
-                            choice_made = True
-                            break
-                    else:
-                        continue
+                    if bank.is_pair(cash_d, choice_item.text):
+                        choice_item.click()
+                        choice_made = True
+                        break
                 
                 if not choice_made:
                     unknown_word_count += 1
@@ -76,7 +63,11 @@ class RecallLearning:
                         raise UnknownWordException(f"모르는 단어 감지됨: {cash_d}")
                 
                 completed_words += 1
-                time.sleep(3)
+                # 다음 카드가 활성화될 때까지 대기 (마지막 카드는 완료 화면 전환)
+                if i + 1 < num_d:
+                    wait_visible(driver, LEARN_PROMPT.format(n=i + 2))
+                else:
+                    wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
             except UnknownWordException:
                 # Only exit early for UnknownWordException if we haven't had too many
                 if unknown_word_count < 3:
@@ -87,17 +78,15 @@ class RecallLearning:
                             By.CSS_SELECTOR, 
                             "a.cc.remote_left[onclick*='study_end']"
                         ).click()
-                        time.sleep(2)
+                        wait_absent(driver, "#wrapper-learn")
                     except:
                         # Fallback to old method if new button not found
                         try:
                             driver.find_element(
                                 By.XPATH, "/html/body/div[1]/div/div[1]/div[1]"
                             ).click()  # 학습 종료 버튼 클릭
-                            time.sleep(1)
-                            driver.find_element(
-                                By.XPATH, "//*[@id='wrapper-learn']/div[2]/div/div/div/div[5]/a[3]"
-                            ).click()  # 학습 종료 확인 버튼 클릭
+                            wait_visible(driver, STUDY_END_CONFIRM, "click_settle")
+                            driver.find_element(By.XPATH, STUDY_END_CONFIRM).click()  # 학습 종료 확인 버튼 클릭
                         except:
                             print("[WARNING] Could not find exit button, trying to go back")
                             driver.back()
@@ -115,8 +104,8 @@ class RecallLearning:
         # Ensure we're back to the set page after completion only if auto_exit is True
         if auto_exit:
             try:
-                # Wait a bit for any completion screens
-                time.sleep(2)
+                # Wait for any completion screens
+                wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
                 # Check if we need to exit to get back to set page
                 current_url = driver.current_url
                 if "wrapper-learn" in current_url or "study" in current_url:
@@ -125,7 +114,7 @@ class RecallLearning:
                             By.CSS_SELECTOR, 
                             "a.cc.remote_left[onclick*='study_end']"
                         ).click()
-                        time.sleep(2)
+                        wait_absent(driver, "#wrapper-learn")
                     except:
                         driver.back()
             except Exception as e:
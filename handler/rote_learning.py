@@ -1,6 +1,10 @@
-import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from waits import wait_visible
+
+SHOW_MEANING = "#wrapper-learn > div > div > div.study-bottom > div.btn-text.btn-down-cover-box"  # 의미 보기
+KNOW_IT = "#wrapper-learn > div > div > div.study-bottom.down > div.btn-text.btn-know-box"  # 이제 알아요
+EXIT_BUTTON = "body > div.study-header-body > div > div:nth-child(1) > div:nth-child(1) > a"
 
 
 class RoteLearning:
@@ -13,31 +17,21 @@ class RoteLearning:
             By.XPATH,
             "/html/body/div[2]/div/div[2]/div[1]/div[1]",
         ).click()
-        time.sleep(1)
+        wait_visible(driver, "/html/body/div[2]/div[2]/div/div/div/div[4]/a", "learn_ready")
         driver.find_element(
             By.XPATH,
             "/html/body/div[2]/div[2]/div/div/div/div[4]/a",
         ).click()
         for _ in range(1, num_d):
-            time.sleep(2)
+            wait_visible(driver, SHOW_MEANING)  # 다음 카드 표시 대기
             try:
-                self.button_auto_pass(
-                    driver,
-                    "#wrapper-learn > div > div > div.study-bottom > div.btn-text.btn-down-cover-box",  # 의미 보기
-                    0.5,
-                    "#wrapper-learn > div > div > div.study-bottom.down > div.btn-text.btn-know-box",  # 이제 알아요
-                )  # 카드 넘기기
+                self.button_auto_pass(driver, SHOW_MEANING, KNOW_IT)  # 카드 넘기기
             except Exception:
                 break
-        time.sleep(0.5)
-        driver.find_element(
-            By.CSS_SELECTOR,
-            "body > div.study-header-body > div > div:nth-child(1) > div:nth-child(1) > a",
-        ).click()
+        wait_visible(driver, EXIT_BUTTON, "click_settle")
+        driver.find_element(By.CSS_SELECTOR, EXIT_BUTTON).click()
 
-    def button_auto_pass(
-        self, driver, btn1: str, time_sec: int, btn2: str
-    ) -> None:  # 버튼 자동 클릭
+    def button_auto_pass(self, driver, btn1: str, btn2: str) -> None:  # 버튼 자동 클릭
         driver.find_element(By.CSS_SELECTOR, btn1).click()  # 1번 버튼 클릭
-        time.sleep(time_sec)
+        wait_visible(driver, btn2, "click_settle")
         driver.find_element(By.CSS_SELECTOR, btn2).click()  # 2번 버튼 클릭
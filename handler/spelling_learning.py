@@ -1,12 +1,10 @@
-import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    TimeoutException,
-)
+from navigation import STUDY_END_CONFIRM
+from probe import CLICKABLE, TEXT
+from selector_registry import SelectorRegistry
+from waits import TIMEOUTS, wait_absent, wait_for, wait_text_changed, wait_visible
+from word_bank import WordBank
 
 
 class UnknownWordException(Exception):
@@ -14,19 +12,25 @@ class UnknownWordException(Exception):
 
 
 class SpellingLearning:
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(self, driver: webdriver.Chrome, registry: SelectorRegistry = None):
         self.driver = driver  # webdriver
+        self.registry = registry or SelectorRegistry()  # 선택자 적중 통계 (학습된 순서)
 
-    def run(self, num_d: int, word_d: list, auto_exit: bool = True) -> None:  # 핸들러 실행
+    def run(self, num_d: int, word_d, auto_exit: bool = True) -> None:  # 핸들러 실행
+        try:
+            self._run(num_d, word_d, auto_exit)
+        finally:
+            self.registry.save()
+            print(f"[DEBUG] 선택자 적중 통계:\n{self.registry.report('spelling.')}")
+
+    def _run(self, num_d: int, word_d, auto_exit: bool) -> None:
         driver = self.driver
-        da_e, da_k, _ = word_d
+        registry = self.registry
+        bank = WordBank.from_word_d(word_d)
         
         print(f"[DEBUG] Starting spelling learning entry button detection...")
         print(f"[DEBUG] Current URL: {driver.current_url}")
         
-        # Wait longer for page to be fully loaded
-        time.sleep(3)
-        
         # Wait for and click the spelling learning entry button with multiple selectors
         spelling_entry_clicked = False
         selectors_to_try = [
@@ -52,20 +56,14 @@ class SpellingLearning:
             "//*[contains(text(), 'spelling')]",  # Any element with spelling (English)
         ]
         
-        for i, selector in enumerate(selectors_to_try):
-            try:
-                print(f"[DEBUG] Trying selector {i+1}: {selector}")
-                element = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                print(f"[DEBUG] Found element with selector: {selector}")
-                element.click()
-                spelling_entry_clicked = True
-                print(f"[DEBUG] Spelling entry clicked using selector: {selector}")
-                break
-            except (TimeoutException, NoSuchElementException) as e:
-                print(f"[DEBUG] Selector {i+1} failed: {e}")
-                continue
+        # 페이지 로딩이 끝나 진입 버튼이 클릭 가능해지는 즉시 진행
+        element, selector = registry.find(
+            driver, "spelling.entry", selectors_to_try, TIMEOUTS["learn_ready"], CLICKABLE
+        )
+        if element is not None:
+            element.click()
+            spelling_entry_clicked = True
+            print(f"[DEBUG] Spelling entry clicked using selector: {selector}")
         
         if not spelling_entry_clicked:
             print(f"[DEBUG] All selectors failed, trying fallback methods...")
@@ -92,7 +90,8 @@ class SpellingLearning:
         if not spelling_entry_clicked:
             # Try one more time with a longer wait and different approach
             print(f"[DEBUG] Trying final approach with longer wait...")
-            time.sleep(5)
+            # 스펠 관련 요소가 화면에 나타날 때까지 대기
+            wait_for(driver, [("visible", "//*[contains(text(), '스펠') or contains(text(), 'spelling')]")], "learn_ready")
             try:
                 # Try to find any button or link that might be clickable
                 all_clickable = driver.find_elements(By.XPATH, "//a | //button | //div[contains(@class, 'btn')]")
@@ -127,8 +126,6 @@ class SpellingLearning:
                 print(f"[DEBUG] Could not get page source: {e}")
             raise Exception("Could not find spelling learning entry button")
         
-        time.sleep(2)  # Wait longer after clicking entry button
-        
         # Wait for and click the spelling learning start button
         start_button_clicked = False
         start_selectors = [
@@ -142,23 +139,17 @@ class SpellingLearning:
             "//a[contains(@class, 'btn') and contains(text(), '시작')]",  # Button link with start text
         ]
         
-        for selector in start_selectors:
-            try:
-                element = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                element.click()
-                start_button_clicked = True
-                print(f"[DEBUG] Spelling start button clicked using selector: {selector}")
-                break
-            except (TimeoutException, NoSuchElementException):
-                continue
+        element, selector = registry.find(
+            driver, "spelling.start", start_selectors, TIMEOUTS["learn_ready"], CLICKABLE
+        )
+        if element is not None:
+            element.click()
+            start_button_clicked = True
+            print(f"[DEBUG] Spelling start button clicked using selector: {selector}")
         
         if not start_button_clicked:
             raise Exception("Could not find spelling learning start button")
         
-        time.sleep(1)
-        
         completed_words = 0
         unknown_word_count = 0  # Track unknown words to prevent infinite loops
         
@@ -177,19 +168,8 @@ class SpellingLearning:
                     "//span[1]",  # First span anywhere (fallback)
                 ]
                 
-                word_element = None
-                for selector in word_selectors:
-                    try:
-                        word_element = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        # Check if the element has actual text content
-                        if word_element.text.strip():
-                            break
-                        else:
-                            word_element = None
-                    except (TimeoutException, NoSuchElementException):
-                        continue
+                # Only accept elements that have actual text content
+                word_element, word_selector = registry.find(driver, "spelling.word", word_selectors, 10, TEXT)
                 
                 if not word_element:
                     print(f"[DEBUG] Could not find word element for word {i}")
@@ -213,15 +193,8 @@ class SpellingLearning:
                 
                 print(f"[DEBUG] Found word: '{cash_d}' for word {i}")
                 
-                try:
-                    if cash_d.upper() != cash_d.lower():
-                        try:
-                            text = da_k[da_e.index(cash_d)]
-                        except ValueError:
-                            text = da_e[da_k.index(cash_d)]
-                    else:
-                        text = da_e[da_k.index(cash_d)]
-                except ValueError:
+                text = bank.answer_for(cash_d)
+                if text is None:
                     unknown_word_count += 1
                     print(f"모르는 단어 감지됨 (단어 {i}: {cash_d}) - {unknown_word_count}번째")
                     
@@ -246,15 +219,7 @@ class SpellingLearning:
                     "//input[contains(@placeholder, 'word')]",  # Input with word placeholder
                 ]
                 
-                input_element = None
-                for selector in input_selectors:
-                    try:
-                        input_element = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((By.XPATH, selector))
-                        )
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
+                input_element, _ = registry.find(driver, "spelling.input", input_selectors, 10)
                 
                 if not input_element:
                     raise Exception("Could not find input field")
@@ -272,44 +237,31 @@ class SpellingLearning:
                     "//a[contains(@class, 'btn')]",  # Any link with btn class
                 ]
                 
-                submit_button = None
-                for selector in submit_selectors:
-                    try:
-                        submit_button = WebDriverWait(driver, 10).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
+                submit_button, _ = registry.find(
+                    driver, "spelling.submit", submit_selectors, 10, CLICKABLE
+                )
                 
                 if not submit_button:
                     raise Exception("Could not find submit button")
                 
                 submit_button.click()
-                time.sleep(1.5)
                 
                 # Try to click the next button if it exists - use simpler selector
-                try:
-                    next_selectors = [
-                        "//button[contains(text(), '다음')]",  # Button with next text
-                        "//a[contains(text(), '다음')]",  # Link with next text
-                        "//div[contains(text(), '다음')]",  # Div with next text
-                    ]
-                    
-                    for selector in next_selectors:
-                        try:
-                            next_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.XPATH, selector))
-                            )
-                            next_button.click()
-                            break
-                        except (TimeoutException, NoSuchElementException):
-                            continue
-                except (TimeoutException, NoSuchElementException):
-                    pass
+                next_selectors = [
+                    "//button[contains(text(), '다음')]",  # Button with next text
+                    "//a[contains(text(), '다음')]",  # Link with next text
+                    "//div[contains(text(), '다음')]",  # Div with next text
+                ]
+                next_button, _ = registry.find(
+                    driver, "spelling.next", next_selectors, 3, CLICKABLE
+                )
+                if next_button is not None:
+                    next_button.click()
                 
                 completed_words += 1
-                time.sleep(0.5)
+                # 다음 단어가 화면에 나타날 때까지 대기 (이전 단어를 다시 읽지 않도록)
+                if i < num_d:
+                    wait_text_changed(driver, word_selector, cash_d)
         except UnknownWordException:
             # Only exit early for UnknownWordException if we haven't had too many
             if unknown_word_count < 3:
@@ -320,17 +272,15 @@ class SpellingLearning:
                         By.CSS_SELECTOR, 
                         "a.cc.remote_left[onclick*='study_end']"
                     ).click()
-                    time.sleep(2)
+                    wait_absent(driver, "#wrapper-learn")
                 except:
                     # Fallback to old method if new button not found
                     try:
                         driver.find_element(
                             By.XPATH, "/html/body/div[1]/div/div[1]/div[1]"
                         ).click()  # 학습 종료 버튼 클릭
-                        time.sleep(1)
-                        driver.find_element(
-                            By.XPATH, "//*[@id='wrapper-learn']/div[2]/div/div/div/div[5]/a[3]"
-                        ).click()  # 학습 종료 확인 버튼 클릭
+                        wait_visible(driver, STUDY_END_CONFIRM, "click_settle")
+                        driver.find_element(By.XPATH, STUDY_END_CONFIRM).click()  # 학습 종료 확인 버튼 클릭
                     except:
                         print("[WARNING] Could not find exit button, trying to go back")
                         driver.back()
@@ -343,8 +293,8 @@ class SpellingLearning:
         # Ensure we're back to the set page after completion only if auto_exit is True
         if auto_exit:
             try:
-                # Wait a bit for any completion screens
-                time.sleep(2)
+                # Wait for any completion screens
+                wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-learn")
                 # Check if we need to exit to get back to set page
                 current_url = driver.current_url
                 if "wrapper-learn" in current_url or "study" in current_url:
@@ -353,7 +303,7 @@ class SpellingLearning:
                             By.CSS_SELECTOR, 
                             "a.cc.remote_left[onclick*='study_end']"
                         ).click()
-                        time.sleep(2)
+                        wait_absent(driver, "#wrapper-learn")
                     except:
                         driver.back()
             except Exception as e:
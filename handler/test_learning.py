@@ -4,26 +4,46 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    NoSuchElementException,
     ElementNotInteractableException,
-    TimeoutException,
     ElementClickInterceptedException,
 )
+from probe import CLICKABLE, VISIBLE
+from selector_registry import SelectorRegistry, locator
+from waits import wait_for, wait_visible
+from word_bank import WordBank, canonical
+
+
+PROMPT = "//*[@id='testForm']/div[{i}]/div/div[1]/div[2]/div[2]/div/div"
+ANSWER_INPUT = "//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[1]/input"
+ANSWER_CHOICES = "/html/body/div[2]/div/div[2]/div[2]/form/div[{i}]/div/div[2]/div/div[1]"
 
 
 class TestLearning:
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(self, driver: webdriver.Chrome, registry: SelectorRegistry = None):
         self.driver = driver  # webdriver
+        self.registry = registry or SelectorRegistry()  # 선택자 적중 통계 (학습된 순서)
 
-    def run(self, num_d: int, word_d: list) -> None:  # 핸들러 실행
+    def run(self, num_d: int, word_d) -> None:  # 핸들러 실행
+        try:
+            self._run(num_d, word_d)
+        finally:
+            self.registry.save()
+            print(f"[DEBUG] 선택자 적중 통계:\n{self.registry.report('test.')}")
+
+    def _run(self, num_d: int, word_d) -> None:
         driver = self.driver
-        da_e, da_k, _ = word_d
+        registry = self.registry
+        bank = WordBank.from_word_d(word_d)
         wait = WebDriverWait(driver, 10)
         
         # Robust click helper with minimal modal handling for btn-quiz-start
-        def robust_click(by, selector, desc, allow_modal_close=False):
+        def robust_click(name, selectors, desc, allow_modal_close=False):
+            elem, selector = registry.find(driver, name, selectors, 10, CLICKABLE)
+            if elem is None:
+                print(f"[WARN] {desc} not found/clickable in time. Skipping.")
+                return False
+            by, selector = locator(selector)
             try:
-                elem = wait.until(EC.element_to_be_clickable((by, selector)))
                 print(f"[DEBUG] {desc} found. Displayed: {elem.is_displayed()}, Enabled: {elem.is_enabled()}")
                 try:
                     elem.click()
@@ -59,29 +79,35 @@ class TestLearning:
                             return False
                     else:
                         return False
-                except ElementNotInteractableException:
-                    print(f"[WARN] {desc} not interactable. Skipping.")
-                    return False
-            except TimeoutException:
-                print(f"[WARN] {desc} not found/clickable in time. Skipping.")
+            except ElementNotInteractableException:
+                print(f"[WARN] {desc} not interactable. Skipping.")
                 return False
 
         # 테스트 시작 (btn btn-success btn-xl shadow w-250 btn-quiz-start)
-        robust_click(By.XPATH, "/html/body/div[2]/div/div[2]/div[2]/div", "테스트 학습 버튼 (세트 화면)")
-        time.sleep(1)
-        robust_click(By.CSS_SELECTOR, "#wrapper-test > div > div.quiz-start-div > div.layer.retry-layer.box > div.m-t-xl > a", "테스트 학습 시작 버튼 1")
-        time.sleep(0.5)
-        robust_click(By.CSS_SELECTOR, "#wrapper-test > div > div.quiz-start-div > div.layer.prepare-layer.box.bg-gray.text-white > div.text-center.m-t-md > a", "테스트 학습 시작 버튼 2")
-        time.sleep(0.5)
-        robust_click(By.CSS_SELECTOR, ".btn.btn-success.btn-xl.shadow.w-250.btn-quiz-start", "테스트 시작 (btn-quiz-start)", allow_modal_close=True)
-        time.sleep(0.5)
+        robust_click("test.entry", ["/html/body/div[2]/div/div[2]/div[2]/div"], "테스트 학습 버튼 (세트 화면)")
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
+        robust_click("test.retry_start", [
+            "#wrapper-test > div > div.quiz-start-div > div.layer.retry-layer.box > div.m-t-xl > a",
+            "#wrapper-test .retry-layer .m-t-xl > a",
+        ], "테스트 학습 시작 버튼 1")
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
+        robust_click("test.prepare_start", [
+            "#wrapper-test > div > div.quiz-start-div > div.layer.prepare-layer.box.bg-gray.text-white > div.text-center.m-t-md > a",
+            "#wrapper-test .prepare-layer .m-t-md > a",
+        ], "테스트 학습 시작 버튼 2")
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
+        robust_click("test.quiz_start", [
+            ".btn.btn-success.btn-xl.shadow.w-250.btn-quiz-start",
+            ".btn-quiz-start",
+        ], "테스트 시작 (btn-quiz-start)", allow_modal_close=True)
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
 
         # 응시 (btn btn-primary shadow btn-ok m-l-xs)
-        robust_click(By.CSS_SELECTOR, ".btn.btn-primary.shadow.btn-ok.m-l-xs", "응시 버튼 (btn-ok m-l-xs)")
-        time.sleep(0.5)
+        robust_click("test.take", [".btn.btn-primary.shadow.btn-ok.m-l-xs"], "응시 버튼 (btn-ok m-l-xs)")
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
         # 새로 시작 (btn shadow btn-ok m-l-xs btn-danger)
-        robust_click(By.CSS_SELECTOR, ".btn.shadow.btn-ok.m-l-xs.btn-danger", "새로 시작 버튼 (btn-danger)")
-        time.sleep(0.5)
+        robust_click("test.restart", [".btn.shadow.btn-ok.m-l-xs.btn-danger"], "새로 시작 버튼 (btn-danger)")
+        wait_for(driver, [("mutation",)], "click_settle", root="#wrapper-test")
         
         # 테스트 학습 유의사항 확인 버튼 클릭
         try:
@@ -91,7 +117,7 @@ class TestLearning:
             print(f"[DEBUG] 유의사항 확인 버튼 clicked.")
         except Exception:
             print(f"[WARN] 유의사항 확인 버튼 not found or not interactable. Skipping.")
-        time.sleep(1.5)
+        wait_visible(driver, PROMPT.format(i=1), "learn_ready")
         
         # Get the number of problems from the page
         num_d = driver.find_element(
@@ -100,16 +126,10 @@ class TestLearning:
         
         for i in range(1, int(num_d) + 1):
             # Get the problem word from the card front
-            cash_d = driver.find_element(
-                By.XPATH,
-                f"//*[@id='testForm']/div[{i}]/div/div[1]/div[2]/div[2]/div/div",
-            ).text.split("\n")[0]
+            element = driver.find_element(By.XPATH, PROMPT.format(i=i))
+            cash_d = element.text.split("\n")[0]
             
             # Click the card front
-            element = driver.find_element(
-                By.XPATH,
-                f"//*[@id='testForm']/div[{i}]/div/div[1]/div[2]/div[2]/div/div",
-            )
             print(f"[DEBUG] 카드 {i} 앞면. Displayed: {element.is_displayed()}, Enabled: {element.is_enabled()}")
             try:
                 element.click()
@@ -117,26 +137,19 @@ class TestLearning:
             except ElementNotInteractableException:
                 print(f"[WARN] 카드 {i} 앞면 not interactable. Skipping.")
                 continue
-            time.sleep(1)
+            wait_for(driver, [("visible", ANSWER_INPUT.format(i=i)), ("visible", ANSWER_CHOICES.format(i=i))], "click_settle")
             
             # Determine the answer
-            try:
-                if cash_d.upper() != cash_d.lower():
-                    try:
-                        text = da_k[da_e.index(cash_d)]
-                    except ValueError:
-                        text = da_e[da_k.index(cash_d)]
-                else:
-                    text = da_e[da_k.index(cash_d)]
-            except ValueError:
+            text = bank.answer_for(cash_d)
+            if text is None:
                 text = "모름"
             
-            # Try input box first
-            try:
-                input_tag = driver.find_element(
-                    By.XPATH,
-                    f"//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[1]/input",
-                )
+            # 입력창 / 선택지 중 이 세트에서 자주 나온 형식을 먼저 확인
+            answer_area, selector = registry.find(
+                driver, "test.answer", [ANSWER_INPUT, ANSWER_CHOICES], 0, VISIBLE, params={"i": i}
+            )
+            if selector == ANSWER_INPUT:
+                input_tag = answer_area
                 submit_tag = driver.find_element(
                     By.XPATH,
                     f"//*[@id='testForm']/div[{i}]/div/div[2]/div/div[2]/div[2]/a",
@@ -146,12 +159,9 @@ class TestLearning:
                 input_tag.send_keys("123456")  # Use "123456" for answer inputting
                 submit_tag.click()
                 print(f"[DEBUG] 카드 {i} 입력창에 답안 입력 및 제출.")
-            except NoSuchElementException:
+            else:
                 # 입력창이 없으면 선택지 시스템 사용
-                box_items = driver.find_element(
-                    By.XPATH,
-                    f"/html/body/div[2]/div/div[2]/div[2]/form/div[{i}]/div/div[2]/div/div[1]",
-                )
+                box_items = answer_area or driver.find_element(By.XPATH, ANSWER_CHOICES.format(i=i))
                 box_items = box_items.find_elements(By.TAG_NAME, "div")
                 print(f"[DEBUG] 카드 {i} 선택지 {len(box_items)}개.")
                 if text == "모름":
@@ -160,8 +170,12 @@ class TestLearning:
                 else:
                     for box_item in box_items:
                         print(f"[DEBUG] 카드 {i} 선택지: '{box_item.text}' Displayed: {box_item.is_displayed()}, Enabled: {box_item.is_enabled()}")
-                        if box_item.text == text:
+                        if canonical(box_item.text) == canonical(text):
                             box_item.click()
                             print(f"[DEBUG] 카드 {i} 선택지 클릭됨.")
                             break
-            time.sleep(2) 
\ No newline at end of file
+            # 다음 문제가 표시될 때까지 대기
+            if i < int(num_d):
+                wait_visible(driver, PROMPT.format(i=i + 1))
+            else:
+                wait_for(driver, [("mutation",)], "click_settle", root="#testForm")
@@ -0,0 +1,154 @@
+import json
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://www.classcard.net"
+COOKIE_FILE = "cookies.json"
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"}
+
+
+class ClassCardClient:
+    """Authenticated HTTP client: one pooled requests.Session whose cookie jar is kept on disk."""
+
+    def __init__(self, base_url: str = BASE_URL, cookie_path: str = COOKIE_FILE, pool_size: int = 4,
+                 timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self.cookie_path = cookie_path
+        self.timeout = timeout
+        self.login_id = None  # 현재 쿠키를 만든 로그인 아이디
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.load_cookies()
+
+    # --- 쿠키 저장소 ---
+    def load_cookies(self) -> bool:
+        if not self.cookie_path:
+            return False
+        try:
+            with open(self.cookie_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 쿠키 파일 로드 실패: {e}")
+            return False
+        for cookie in data.get("cookies", []):
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"), secure=cookie.get("secure", False), expires=cookie.get("expires"),
+            )
+        self.login_id = data.get("login_id")
+        return bool(data.get("cookies"))
+
+    def save_cookies(self):
+        if not self.cookie_path:
+            return
+        data = {"login_id": self.login_id, "cookies": self.cookies()}
+        tmp_path = f"{self.cookie_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cookie_path)
+        except OSError as e:
+            print(f"[WARNING] 쿠키 파일 저장 실패: {e}")
+
+    def cookies(self) -> list:
+        return [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path,
+             "secure": c.secure, "expires": c.expires}
+            for c in self.session.cookies
+        ]
+
+    def adopt(self, browser_cookies: list, login_id: str = None):
+        """Take over the cookies of a browser session (selenium get_cookies() format) and save them."""
+        self.session.cookies.clear()
+        for cookie in browser_cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"), secure=cookie.get("secure", False), expires=cookie.get("expiry"),
+            )
+        self.login_id = login_id
+        self.save_cookies()
+
+    def clear(self):
+        self.session.cookies.clear()
+        self.login_id = None
+        if self.cookie_path and os.path.exists(self.cookie_path):
+            os.remove(self.cookie_path)
+
+    # --- 인증 ---
+    def get(self, path: str, **kwargs):
+        return self.session.get(f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+
+    def post(self, path: str, data=None, **kwargs):
+        kwargs.setdefault("headers", FORM_HEADERS)
+        return self.session.post(f"{self.base_url}{path}", data=data, timeout=self.timeout, **kwargs)
+
+    def authenticate(self, login_id: str, password: str) -> bool:
+        """POST /LoginProc; False only if the credentials were refused, cookies saved on success.
+
+        Network errors, timeouts and server errors raise requests.RequestException.
+        """
+        res = self.post("/LoginProc", {"login_id": login_id, "login_pwd": password})
+        res.raise_for_status()
+        try:
+            ok = res.json().get("result") == "ok"
+        except ValueError as e:
+            raise requests.RequestException(f"로그인 응답을 해석할 수 없습니다: {e}", response=res) from e
+        if ok:
+            self.login_id = login_id
+            self.save_cookies()
+        return ok
+
+    def login(self, login_id: str, password: str) -> bool:
+        """authenticate() that reports transport errors as a failed login (callers fall back to the browser)."""
+        try:
+            return self.authenticate(login_id, password)
+        except requests.RequestException as e:
+            print(f"[WARNING] HTTP 로그인 실패: {e}")
+            return False
+
+    def is_authenticated(self) -> bool:
+        """True if the saved cookies still open the main page without a redirect to the login form."""
+        if not len(self.session.cookies):
+            return False
+        try:
+            res = self.get("/Main")
+        except requests.RequestException:
+            return False
+        return res.ok and "/Login" not in res.url and 'name="login_pwd"' not in res.text
+
+    def ensure_login(self, login_id: str, password: str) -> bool:
+        """Reuse the saved cookie jar for the same account, otherwise authenticate() again (may raise)."""
+        if self.login_id == login_id and self.is_authenticated():
+            return True
+        self.session.cookies.clear()
+        return self.authenticate(login_id, password)
+
+    # --- 브라우저 연동 ---
+    def inject(self, driver):
+        """Copy the session cookies into the Selenium browser so it starts logged in."""
+        cookies = self.cookies()
+        if not cookies:
+            return
+        try:  # Chrome: 페이지 이동 없이 DevTools 로 설정
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+                {"name": c["name"], "value": c["value"], "domain": c["domain"], "path": c["path"],
+                 "secure": c["secure"], **({"expires": c["expires"]} if c["expires"] else {})}
+                for c in cookies
+            ]})
+            return
+        except Exception:
+            pass
+        driver.get(f"{self.base_url}/robots.txt")  # add_cookie 는 같은 도메인 문서에서만 가능
+        for c in cookies:
+            cookie = {"name": c["name"], "value": c["value"], "path": c["path"], "secure": c["secure"]}
+            if c["domain"]:
+                cookie["domain"] = c["domain"]
+            if c["expires"]:
+                cookie["expiry"] = int(c["expires"])
+            driver.add_cookie(cookie)
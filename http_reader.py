@@ -0,0 +1,51 @@
+import requests
+
+from utility import make_soup, parse_classes, parse_sets, word_parse
+from word_bank import WordBank
+
+
+class HttpReader:
+    """Read-only ClassCard pages over the authenticated HTTP session; no browser involved.
+
+    Each method returns the same structure as the ClassCardCore browser path, or
+    None when the page could not be read (network error, session expired).
+    """
+
+    def __init__(self, client, html_parser=None):
+        self.client = client
+        self.html_parser = html_parser
+
+    def page(self, path: str):
+        """GET ``path`` and parse it; None on errors or a redirect to the login form."""
+        try:
+            res = self.client.get(path)
+        except requests.RequestException as e:
+            print(f"[WARNING] HTTP 페이지 읽기 실패 ({path}): {e}")
+            return None
+        if not res.ok or "/Login" in res.url or 'name="login_pwd"' in res.text:
+            print(f"[WARNING] HTTP 페이지 읽기 실패 ({path}): {res.status_code} {res.url}")
+            return None
+        return make_soup(res.text, self.html_parser)
+
+    def get_classes(self):
+        soup = self.page("/Main")
+        return parse_classes(soup) if soup is not None else None
+
+    def get_sets(self, class_id):
+        soup = self.page(f"/ClassMain/{class_id}")
+        return parse_sets(soup) if soup is not None else None
+
+    def set_page(self, set_id, class_id):
+        return self.page(f"/set/{set_id}/{class_id}")
+
+    def get_words(self, set_id, class_id):
+        """(num_d, WordBank) for a set, parsed straight from the set page HTML."""
+        soup = self.set_page(set_id, class_id)
+        if soup is None:
+            return None
+        cards_ele = soup.find("div", class_="flip-body")
+        num_d = len(cards_ele.find_all("div", class_="flip-card")) if cards_ele else 0
+        word_d = word_parse(soup, num_d) if num_d else None
+        if word_d is None:
+            return None
+        return num_d, WordBank.from_word_d(word_d)
@@ -1,6 +1,6 @@
-import time
 import warnings
 from classcard_core import ClassCardCore
+from recovery import WORDS, classify
 from utility import choice_set, choice_class
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -11,17 +11,18 @@ def main():
     
     # Setup core
     core = ClassCardCore()
-    driver = core.setup_driver()
+    core.setup_driver()
     
     try:
-        # Login
-        print("\n로그인 정보를 입력하세요.")
-        user_id = input("아이디: ").strip()
-        password = input("비밀번호: ").strip()
-        
-        if not core.login(user_id, password):
-            print("[ERROR] 로그인 실패")
-            return
+        # Login (영구 프로필의 세션이 유효하면 입력 생략)
+        if not core.restore_session():
+            print("\n로그인 정보를 입력하세요.")
+            user_id = input("아이디: ").strip()
+            password = input("비밀번호: ").strip()
+            
+            if not core.login(user_id, password):
+                print("[ERROR] 로그인 실패")
+                return
         
         print("[INFO] 로그인 성공!")
         
@@ -37,9 +38,9 @@ def main():
         
         # Select class
         if len(classes) == 1:
-    choice_class_val = 0
+            choice_class_val = 0
             print(f"[INFO] 단일 클래스 자동 선택: {classes[0]['class_name']}")
-else:
+        else:
             choice_class_val = choice_class(class_dict=classes)
         
         class_id = classes[choice_class_val]["class_id"]
@@ -78,7 +79,7 @@ else:
                 ch_d = int(ch_d)
                 
                 if ch_d == 2:
-        print("리콜학습을 시작합니다.")
+                    print("리콜학습을 시작합니다.")
                     # Select set
                     if len(sets) == 1:
                         choice_set_val = 0
@@ -90,7 +91,7 @@ else:
                     print(f"[INFO] 선택된 세트: {sets[choice_set_val]['title']}")
                     
                     # Get words
-                    num_d, word_d = core.get_words_for_set(set_id, class_id)
+                    num_d, word_d = core.load_words(set_id, class_id)
                     if num_d == 0:
                         print("[ERROR] 단어를 가져올 수 없습니다.")
                         continue
@@ -107,9 +108,11 @@ else:
                             print(f"[WARNING] 리콜학습이 100% 미만으로 완료되었습니다. ({completion_percentage:.1f}%)")
                     except Exception as e:
                         print(f"[ERROR] 리콜학습 실패: {e}")
+                        if classify(e) == WORDS:  # 다음 실행에서 단어를 다시 읽도록
+                            core.invalidate_words(set_id, class_id)
                 
-    elif ch_d == 3:
-        print("스펠학습을 시작합니다.")
+                elif ch_d == 3:
+                    print("스펠학습을 시작합니다.")
                     # Select set
                     if len(sets) == 1:
                         choice_set_val = 0
@@ -121,7 +124,7 @@ else:
                     print(f"[INFO] 선택된 세트: {sets[choice_set_val]['title']}")
                     
                     # Get words
-                    num_d, word_d = core.get_words_for_set(set_id, class_id)
+                    num_d, word_d = core.load_words(set_id, class_id)
                     if num_d == 0:
                         print("[ERROR] 단어를 가져올 수 없습니다.")
                         continue
@@ -138,6 +141,8 @@ else:
                             print(f"[WARNING] 스펠학습이 100% 미만으로 완료되었습니다. ({completion_percentage:.1f}%)")
                     except Exception as e:
                         print(f"[ERROR] 스펠학습 실패: {e}")
+                        if classify(e) == WORDS:  # 다음 실행에서 단어를 다시 읽도록
+                            core.invalidate_words(set_id, class_id)
                 
                 elif ch_d == 8:
                     print("리콜+스펠학습을 시작합니다.")
@@ -188,11 +193,12 @@ else:
                             print("[ERROR] 시작 섹션이 끝 섹션보다 클 수 없습니다.")
                             continue
                         
+                        resume = input("이전 실행에서 완료된 세트/모드를 건너뛸까요? (y/N): ").strip().lower() == "y"
                         print(f"[INFO] 섹션 {start_section}부터 {end_section}까지 처리합니다.")
                         
                         # Run range automation with robust completion tracking
                         try:
-                            results = core.run_range_automation(class_id, start_section, end_section, ["recall", "spelling"])
+                            results = core.run_range_automation(class_id, start_section, end_section, ["recall", "spelling"], resume=resume)
                             
                             print("\n[INFO] 범위 자동화 완료 - 최종 결과:")
                             all_completed = True
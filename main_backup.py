@@ -1,6 +1,5 @@
 import time
 import warnings
-import re
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,6 +11,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import UnexpectedAlertPresentException
+from progress import parse_progress
 
 # 함수불러오기
 from utility import (
@@ -32,71 +32,11 @@ def get_section_progress(driver, set_id, class_id):
         driver.get(set_site)
         time.sleep(2)
         
-        # Parse the page to find progress information
+        # 학습 메뉴의 모드 버튼 주변만 읽음 (페이지 전체 정규식 fallback 은 다른 숫자를 잘못 읽음)
         html = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Step 1: Try to find a container for the current section
-        section_container = (
-            html.find("div", class_="learning-section") or
-            html.find("div", class_="study-section") or
-            html.find("div", class_="set-overview") or
-            html.find("div", class_="progress-overview")
-        )
-        recall_progress = None
-        spelling_progress = None
-        container_used = None
-        if section_container:
-            container_used = section_container.get("class")
-            container_text = section_container.get_text()
-            # Try to find patterns like '리콜 ... 200%' or '스펠 ... 100%' in the container
-            progress_pairs = re.findall(r'(리콜|스펠)[^\d]*(\d+)%', container_text)
-            if progress_pairs:
-                for label, value in progress_pairs:
-                    pct = int(value)
-                    if '리콜' in label:
-                        recall_progress = pct
-                    elif '스펠' in label:
-                        spelling_progress = pct
-            # Fallback: Try to find any percentages in the container
-            if (recall_progress is None or spelling_progress is None):
-                all_percentages = re.findall(r'(\d+)%', container_text)
-                if all_percentages:
-                    if recall_progress is None and len(all_percentages) > 0:
-                        recall_progress = int(all_percentages[0])
-                    if spelling_progress is None and len(all_percentages) > 1:
-                        spelling_progress = int(all_percentages[1])
-        else:
-            print("[DEBUG] No section container found, using full page fallback (may be unreliable)")
-            all_text = html.get_text()
-            progress_pairs = re.findall(r'(리콜|스펠)[^\d]*(\d+)%', all_text)
-            if progress_pairs:
-                for label, value in progress_pairs:
-                    pct = int(value)
-                    if '리콜' in label:
-                        recall_progress = pct
-                    elif '스펠' in label:
-                        spelling_progress = pct
-            if (recall_progress is None or spelling_progress is None):
-                all_percentages = re.findall(r'(\d+)%', all_text)
-                if all_percentages:
-                    if recall_progress is None and len(all_percentages) > 0:
-                        recall_progress = int(all_percentages[0])
-                    if spelling_progress is None and len(all_percentages) > 1:
-                        spelling_progress = int(all_percentages[1])
-        # If still None, set to 0
-        if recall_progress is None:
-            recall_progress = 0
-        if spelling_progress is None:
-            spelling_progress = 0
-        # If fallback found a suspicious pair (e.g., 0 and 200), treat both as 0
-        if (container_used is None) and (
-            (recall_progress == 0 and spelling_progress >= 100) or
-            (spelling_progress == 0 and recall_progress >= 100)
-        ):
-            print(f"[DEBUG] Fallback found suspicious pair (Recall: {recall_progress}%, Spelling: {spelling_progress}%), treating both as 0%.")
-            recall_progress = 0
-            spelling_progress = 0
-        print(f"[DEBUG] Progress detection container: {container_used}")
+        progress = parse_progress(html, ("recall", "spelling"))
+        recall_progress = progress["recall"] or 0
+        spelling_progress = progress["spelling"] or 0
         print(f"[DEBUG] Progress detection - Recall: {recall_progress}%, Spelling: {spelling_progress}%")
         return recall_progress, spelling_progress
         
@@ -0,0 +1,127 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from tracing import percentile, span
+from waits import TIMEOUTS, wait_for
+
+# 페이지 종류별 준비 완료 조건 (waits.wait_for 조건, 어느 하나라도 충족되면 준비 완료)
+CLASS_LIST = (  # 메인 화면 왼쪽 메뉴의 클래스 목록
+    "body > div.mw-1080 > div:nth-child(6) > div > div > div.left-menu"
+    " > div.left-item-group.p-t-none.p-r-lg > div.m-t-sm.left-class-list"
+)
+CLASS_SETS = "/html/body/div[1]/div[2]/div/div/div[2]/div[3]/div"  # 클래스 화면의 세트 목록
+SET_CARDS = "div.flip-body div.flip-card"  # 세트 화면의 단어 카드
+LEARN_START = "#wrapper-learn > div.start-opt-body > div > div > div > div.m-t > a"  # 리콜 등 학습 시작 버튼
+LEARN_PROMPT = "//*[@id='wrapper-learn']/div[1]/div/div[2]/div[2]/div[{n}]/div[1]/div/div/div/div[1]/span"  # 학습 카드 n 의 문제
+STUDY_END_CONFIRM = "//*[@id='wrapper-learn']/div[2]/div/div/div/div[5]/a[3]"  # 학습 종료 확인 버튼
+READY = {
+    "login": [("present", "input[name='login_id']")],
+    "main": [("present", "div.left-class-list")],
+    "entry": [("present", "div.left-class-list"), ("present", "input[name='login_id']")],  # 세션 확인: 메인 또는 로그인 화면
+    "class": [("present", CLASS_SETS)],
+    "set": [("present", SET_CARDS)],
+    "learn": [("visible", LEARN_START)],
+}
+STALE = "html[data-cc-stale]"  # pageLoadStrategy none 에서 이전 문서를 구분하는 표시
+
+
+class Navigator:
+    """driver.get without fixed sleeps: resolve on a per-page readiness predicate and time it.
+
+    With pageLoadStrategy eager, driver.get returns at DOMContentLoaded; with none
+    it returns as soon as navigation starts, so the old document is marked first
+    and readiness also requires the mark to be gone.
+
+    The navigator also tracks which page the browser is on. goto() skips the
+    reload when the browser is already at the URL and the page predicate holds
+    (e.g. back on the set page after a mode's 학습종료), and counts those skips.
+    """
+
+    def __init__(self):
+        self.ready_times = {}  # {페이지 종류: [초, ...]}
+        self.page = None  # 브라우저가 있는 것으로 확인된 페이지 종류 (None 이면 모름)
+        self.url = None  # goto 로 연 경우의 URL
+        self.loads = 0  # 실제 페이지 로드 수
+        self.saved = 0  # 이미 도착해 있어 생략한 로드 수
+
+    def forget(self):
+        """The browser moved by other means (clicks, back); the next goto checks where it is."""
+        self.page = None
+        self.url = None
+
+    def at(self, driver, url: str, page: str) -> bool:
+        """True if the browser already shows ``url`` with the ``page`` predicate met."""
+        if self.page is not None and (self.page != page or self.url not in (None, url)):
+            return False  # 다른 페이지(학습 화면 등)에 있는 것이 확실함
+        try:
+            if driver.current_url.rstrip("/") != url.rstrip("/"):
+                return False
+        except WebDriverException:
+            return False
+        return wait_for(driver, READY[page], "click_settle") >= 0
+
+    @staticmethod
+    def _strategy(driver) -> str:
+        capabilities = getattr(driver, "capabilities", None) or {}
+        return capabilities.get("pageLoadStrategy", "normal")
+
+    def goto(self, driver, url: str, page: str, timeout: float = None, reload: bool = False) -> bool:
+        """Load ``url`` and wait until the ``page`` predicate holds; False on timeout.
+
+        Unless ``reload`` is set, nothing is loaded when the browser is already there.
+        """
+        conditions = READY[page]
+        with span("goto", page=page) as current:
+            if not reload and self.at(driver, url, page):
+                self.saved += 1
+                self.page, self.url = page, url
+                current.set(ready=True, skipped=True)
+                return True
+            start = time.perf_counter()
+            if self._strategy(driver) == "none":
+                try:
+                    driver.execute_script("document.documentElement.setAttribute('data-cc-stale', '1');")
+                except WebDriverException:
+                    pass
+                conditions = [("all", ("absent", STALE), condition) for condition in conditions]
+            driver.get(url)
+            self.loads += 1
+            ready = self._wait(driver, page, conditions, start, TIMEOUTS["navigation"] if timeout is None else timeout)
+            current.set(ready=ready)
+        self.page, self.url = (page, url) if ready else (None, None)
+        return ready
+
+    def ready(self, driver, page: str, timeout: float = None) -> bool:
+        """Wait for the ``page`` predicate after a click-driven navigation and time it."""
+        with span("ready", page=page) as current:
+            timeout = TIMEOUTS["learn_ready"] if timeout is None else timeout
+            ready = self._wait(driver, page, READY[page], time.perf_counter(), timeout)
+            current.set(ready=ready)
+        self.page, self.url = (page, None) if ready else (None, None)
+        return ready
+
+    def _wait(self, driver, page: str, conditions: list, start: float, timeout: float) -> bool:
+        deadline = start + timeout
+        ready = False
+        for _ in range(3):  # 이동 중 문서가 바뀌면 대기 스크립트가 끊기므로 남은 시간 안에서 다시 대기
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            ready = wait_for(driver, conditions, "navigation", remaining) >= 0
+            if ready:
+                break
+        self.ready_times.setdefault(page, []).append(time.perf_counter() - start)
+        if not ready:
+            print(f"[WARNING] {page} 페이지 준비 시간 초과 ({timeout:.1f}s)")
+        return ready
+
+    def report(self) -> str:
+        lines = [f"[NAV] {'page':<8}{'count':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'max(ms)':>10}"]
+        for page, values in self.ready_times.items():
+            lines.append(
+                f"[NAV] {page:<8}{len(values):>7}{percentile(values, 0.5) * 1000:>10.1f}"
+                f"{percentile(values, 0.95) * 1000:>10.1f}{max(values) * 1000:>10.1f}"
+            )
+        lines.append(f"[NAV] 페이지 로드 {self.loads}회, 이미 도착해 있어 생략 {self.saved}회")
+        return "\n".join(lines)
@@ -0,0 +1,58 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class WordPrefetcher:
+    """Download upcoming sets' pages on a background thread, at most ``lookahead`` sets ahead.
+
+    ``fetch(set_id, class_id)`` must not touch the browser (HTTP only) and returns
+    the parsed set page or None. Word parsing, the word cache and logging stay
+    with the caller on the main thread. take() hands over a finished page and
+    schedules the next set, so the browser never waits for a download between sets.
+    """
+
+    def __init__(self, fetch, keys: list, lookahead: int = 1):
+        self.fetch = fetch
+        self.keys = [(str(set_id), str(class_id)) for set_id, class_id in keys]
+        self.lookahead = max(1, lookahead)
+        self._next = 0  # 다음에 예약할 keys 위치
+        self._pending = {}  # {(set_id, class_id): Future}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._fill()
+
+    def _fill(self):
+        while len(self._pending) < self.lookahead and self._next < len(self.keys):
+            key = self.keys[self._next]
+            self._next += 1
+            if key not in self._pending:
+                self._pending[key] = self._executor.submit(self._fetch, key)
+
+    def _fetch(self, key):
+        try:
+            return self.fetch(*key)
+        except Exception as e:  # 실패하면 호출한 쪽이 직접 읽음
+            print(f"[PREFETCH] 세트 {key[0]} 미리 읽기 실패: {e}")
+            return None
+
+    def take(self, set_id, class_id):
+        """Page of a set (waiting if it is still being fetched), or None if it was not prefetched."""
+        key = (str(set_id), str(class_id))
+        future = self._pending.pop(key, None)
+        if future is None:
+            if key in self.keys[self._next:]:  # 순서를 건너뛴 경우 그 다음부터 이어서 예약
+                self._next = self.keys.index(key, self._next) + 1
+            self._fill()
+            return None
+        start = time.perf_counter()
+        result = future.result()
+        waited = time.perf_counter() - start
+        self._fill()
+        status = "준비됨" if result is not None else "실패"
+        print(f"[PREFETCH] 세트 {set_id} {status} (대기 {waited:.2f}s, 예약 {len(self._pending)}개)")
+        return result
+
+    def close(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending = {}
+        self._executor.shutdown(wait=False)
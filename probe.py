@@ -0,0 +1,58 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+PRESENT = "present"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+TEXT = "text"  # 보이는 텍스트가 있는 요소
+
+# 후보 선택자 전체를 한 번의 script 호출로 검사하고 첫 번째로 조건을 만족하는 요소를 반환
+PROBE_SCRIPT = """
+var candidates = arguments[0], require = arguments[1];
+function resolve(selector) {
+    var first = selector.charAt(0);
+    if (first === "/" || first === "(") {
+        return document.evaluate(selector, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+function visible(el) {
+    if (!el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+for (var i = 0; i < candidates.length; i++) {
+    var el = null;
+    try { el = resolve(candidates[i]); } catch (e) { continue; }
+    if (!el) continue;
+    if (require === "visible" && !visible(el)) continue;
+    if (require === "clickable" && (!visible(el) || el.disabled)) continue;
+    if (require === "text" && (!visible(el) || !(el.innerText || "").trim())) continue;
+    return [i, el];
+}
+return null;
+"""
+
+
+def probe(driver, candidates: list, require: str = PRESENT, timeout: float = 0,
+          poll: float = 0.1, params: dict = None) -> tuple:
+    """Return (index, element) of the first matching candidate, or (None, None) at the deadline.
+
+    Candidates are CSS selectors or XPaths (starting with "/" or "("); ``params``
+    fills in templates such as "//div[{i}]".
+    """
+    targets = [candidate.format(**params) if params else candidate for candidate in candidates]
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = driver.execute_script(PROBE_SCRIPT, targets, require)
+        except WebDriverException as e:
+            print(f"[DEBUG] Probe script failed: {e}")
+            result = None
+        if result:
+            return result[0], result[1]
+        if time.monotonic() >= deadline:
+            return None, None
+        time.sleep(poll)
@@ -0,0 +1,45 @@
+import re
+
+# 세트 화면의 학습 메뉴: 모드별 버튼 class 와 라벨 (진행률은 버튼 안에 "리콜 100%" 처럼 표시)
+MODE_CLASSES = {"rote": "btn-rote", "recall": "btn-recall", "spelling": "btn-spell", "test": "btn-test"}
+MODE_LABELS = {"rote": "암기", "recall": "리콜", "spelling": "스펠", "test": "테스트"}
+PERCENT = re.compile(r"(\d+)\s*%")
+_SKIP_TAGS = {"script", "style", "title", "head"}
+
+
+def _label_element(soup, mode: str):
+    element = soup.find(class_=MODE_CLASSES[mode])
+    if element is not None:
+        return element
+    label = MODE_LABELS[mode]
+    for text in soup.find_all(string=lambda s: label in s):
+        if text.parent is not None and text.parent.name not in _SKIP_TAGS:
+            return text.parent
+    return None
+
+
+def mode_percent(soup, mode: str):
+    """Progress shown next to one mode's menu entry, or None when it is not on the page.
+
+    Only the entry and its nearest ancestors are searched, stopping before an
+    ancestor that also holds another mode's label, so one mode's number can
+    never be read as another's.
+    """
+    element = _label_element(soup, mode)
+    others = [label for name, label in MODE_LABELS.items() if name != mode]
+    for _ in range(3):
+        if element is None or element.name in ("body", "[document]"):
+            return None
+        text = element.get_text(" ", strip=True)
+        if any(label in text for label in others):
+            return None
+        match = PERCENT.search(text)
+        if match:
+            return int(match.group(1))
+        element = element.parent
+    return None
+
+
+def parse_progress(soup, modes=("recall", "spelling", "test")) -> dict:
+    """{mode: percent or None} from a set page."""
+    return {mode: mode_percent(soup, mode) for mode in modes}
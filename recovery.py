@@ -0,0 +1,57 @@
+import time
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError
+from handler.recall_learning import UnknownWordException as RecallUnknownWordException
+from handler.spelling_learning import UnknownWordException as SpellingUnknownWordException
+
+TRANSIENT = "transient"  # 같은 카드에서 잠시 후 다시 시도 (stale 요소, 화면 전환 중, 클릭 가림 등)
+WORDS = "words"  # 단어 목록이 사이트와 달라짐: 다시 읽은 뒤 모드를 처음부터
+FATAL = "fatal"  # 브라우저/세션이 사라짐: 재시도해도 소용없음
+CARD_RETRIES = 3  # 카드 하나당 시도 횟수
+FATAL_MESSAGES = ("chrome not reachable", "disconnected", "session deleted", "target window already closed",
+                  "no such window", "invalid session id")
+
+
+class ModeInterrupted(Exception):
+    """A study mode stopped at a card; the first ``completed`` cards were already answered."""
+
+    def __init__(self, mode: str, completed: int, cause: Exception):
+        super().__init__(f"{mode} 카드 {completed + 1}에서 중단: {cause}")
+        self.mode = mode
+        self.completed = completed
+        self.cause = cause
+
+
+def classify(error: Exception) -> str:
+    """TRANSIENT, WORDS or FATAL for an exception raised while studying."""
+    if isinstance(error, ModeInterrupted):
+        error = error.cause
+    if isinstance(error, (RecallUnknownWordException, SpellingUnknownWordException)):
+        return WORDS
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError, MaxRetryError)):
+        return FATAL
+    if isinstance(error, WebDriverException) and any(m in str(error).lower() for m in FATAL_MESSAGES):
+        return FATAL
+    return TRANSIENT
+
+
+class Backoff:
+    """Exponential retry delay: base, base * factor, ... capped at ``limit`` seconds."""
+
+    def __init__(self, base: float = 0.5, factor: float = 2.0, limit: float = 8.0):
+        self.base = base
+        self.factor = factor
+        self.limit = limit
+
+    def delay(self, attempt: int) -> float:
+        return min(self.limit, self.base * self.factor ** max(0, attempt - 1))
+
+    def wait(self, attempt: int):
+        delay = self.delay(attempt)
+        print(f"[RETRY] {delay:.1f}s 후 다시 시도 ({attempt}번째)")
+        time.sleep(delay)
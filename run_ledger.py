@@ -0,0 +1,77 @@
+import json
+import os
+import time
+
+LEDGER_FILE = "run_ledger.jsonl"
+
+
+class RunLedger:
+    """Append-only JSONL record of every finished set/mode, flushed to disk as it happens.
+
+    Each line is one event; a half-written last line from a crash is ignored
+    when reading, so the ledger survives the app, the GUI or Chrome dying mid-run.
+    """
+
+    def __init__(self, path: str = LEDGER_FILE):
+        self.path = path
+        self.run_id = None
+
+    def _append(self, entry: dict):
+        entry.setdefault("time", time.strftime("%Y-%m-%dT%H:%M:%S"))
+        if self.run_id is not None:
+            entry.setdefault("run", self.run_id)
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"[WARNING] 실행 기록 저장 실패: {e}")
+
+    def start_run(self, class_id, start_set_id, end_set_id, modes, resume: bool = False):
+        self.run_id = time.strftime("%Y%m%d-%H%M%S")
+        self._append({"event": "run_start", "class_id": str(class_id), "range": [start_set_id, end_set_id],
+                      "modes": list(modes), "resume": resume})
+
+    def finish_run(self, stopped: bool = False):
+        self._append({"event": "run_end", "stopped": stopped})
+        self.run_id = None
+
+    def record(self, class_id, set_id, mode, result: dict = None, seconds: float = 0.0, attempts: int = 1):
+        """One set/mode outcome; ``result`` is the run_* summary dict (None if the mode never finished)."""
+        entry = {"event": "mode", "class_id": str(class_id), "set_id": str(set_id), "mode": mode,
+                 "seconds": round(seconds, 3), "attempts": attempts}
+        if result is None:
+            entry["status"] = "failed"
+        else:
+            entry.update(result)
+            entry["status"] = "done" if result["percentage"] >= 100 else "incomplete"
+        self._append(entry)
+
+    def on_event(self, event: dict):
+        """ModeScheduler listener: record finished modes, except ones cut short by a stop request."""
+        if event["event"] == "mode_done" and event["status"] != "stopped":
+            self.record(event["class_id"], event["set_id"], event["mode"], event["result"], event["seconds"],
+                        event["attempts"])
+
+    def entries(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                yield json.loads(line)
+            except ValueError:  # 기록 도중 종료되어 잘린 줄
+                continue
+
+    def completed(self, class_id) -> dict:
+        """{(set_id, mode): result} for every set/mode of the class already recorded at 100%."""
+        done = {}
+        for entry in self.entries():
+            if entry.get("event") == "mode" and entry.get("class_id") == str(class_id) and entry.get("status") == "done":
+                done[(entry["set_id"], entry["mode"])] = {
+                    key: entry[key] for key in ("completed_words", "total_words", "percentage")
+                }
+        return done
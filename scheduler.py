@@ -0,0 +1,183 @@
+import time
+
+from recovery import classify
+from tracing import span
+
+MODE_ORDER = ("recall", "spelling", "test")  # 리콜/스펠은 끝나면 세트 화면으로 돌아오고, 테스트는 아니므로 마지막
+MAX_ATTEMPTS = 5  # 모드당 시도 횟수
+
+
+def plan_jobs(set_ids, modes, done=None) -> list:
+    """Ordered (set_id, mode) jobs: sets in the given order, modes in MODE_ORDER, ``done`` ones left out.
+
+    Modes that return to the set page run first so the next mode starts without
+    a reload; unknown modes are dropped with a warning.
+    """
+    unknown = [mode for mode in modes if mode not in MODE_ORDER]
+    if unknown:
+        print(f"[WARNING] 지원하지 않는 학습 모드는 건너뜁니다: {unknown}")
+    ordered = [mode for mode in MODE_ORDER if mode in modes]
+    done = done or {}
+    return [(str(set_id), mode) for set_id in set_ids for mode in ordered if (str(set_id), mode) not in done]
+
+
+def format_event(event: dict):
+    """Log line for a progress event (None for events that are not shown)."""
+    kind = event["event"]
+    mode = event.get("mode")
+    result = event.get("result")
+    summary = (f"{result['completed_words']}/{result['total_words']} ({result['percentage']:.1f}%)"
+               if result else "")
+    if kind == "set_start":
+        title = f"\n[INFO] Set: {event['title']}" if event.get("title") else ""
+        return f"[INFO] Processing set {event['set_id']}{title}"
+    if kind == "set_skip":
+        return f"[INFO] 세트 {event['set_id']}: 모든 모드가 이미 완료되어 건너뜁니다."
+    if kind == "mode_retry":
+        if "error" in event:
+            return f"[ERROR] {mode} learning failed ({event['kind']}): {event['error']}"
+        return f"[RETRY] {mode} learning incomplete: {summary} - Retrying..."
+    if kind == "mode_done":
+        if event["status"] == "done":
+            return f"[SUCCESS] {mode} learning completed: {summary}"
+        if event["status"] == "skipped":
+            return f"[INFO] {mode}: 사이트 진행률 {result['percentage']}% - 이미 완료되어 건너뜁니다."
+        if event["status"] != "stopped":
+            return f"[WARNING] {mode} learning 미완료 ({event['attempts']}회 시도): {summary or '결과 없음'}"
+        return None
+    if kind == "stopped":
+        return "[INFO] 중지 요청 감지됨. 자동화 중단."
+    return None
+
+
+def print_event(event: dict):
+    line = format_event(event)
+    if line:
+        print(line)
+
+
+class ModeScheduler:
+    """Run an ordered plan of (set_id, mode) jobs against ClassCardCore with one retry policy.
+
+    Modes of a set share the core's run-scoped word memo and the browser stays
+    on the set page between them. Progress is reported as event dicts
+    ({"event": ..., "class_id": ..., ...}) to every listener: set_start,
+    set_skip, mode_start, mode_retry, mode_done (status done/skipped/incomplete/
+    failed/stopped) and stopped. With ``skip_complete`` a mode the set page
+    already shows at 100% is skipped once its words are loaded.
+    """
+
+    def __init__(self, core, class_id, listeners=(), stop=None, attempts: int = MAX_ATTEMPTS,
+                 skip_complete: bool = False):
+        self.core = core
+        self.class_id = str(class_id)
+        self.listeners = list(listeners)
+        self.stop = stop
+        self.attempts = attempts
+        self.skip_complete = skip_complete
+
+    def emit(self, event: str, **fields):
+        entry = {"event": event, "class_id": self.class_id, **fields}
+        for listener in self.listeners:
+            try:
+                listener(entry)
+            except Exception as e:  # 화면/기록 오류로 학습을 멈추지 않음
+                print(f"[WARNING] 진행 이벤트 처리 실패 ({event}): {e}")
+
+    def stopped(self) -> bool:
+        return bool(self.stop and self.stop())
+
+    def run(self, jobs: list, titles: dict = None, done: dict = None) -> dict:
+        """{set_id: {"title", "results": {mode: result}}}; ``titles`` orders the sets, ``done`` fills skipped modes."""
+        done = done or {}
+        pending = {}
+        for set_id, mode in jobs:
+            pending.setdefault(set_id, []).append(mode)
+        titles = titles if titles is not None else {set_id: None for set_id in pending}
+        results = {}
+        for set_id, title in titles.items():
+            set_id = str(set_id)
+            if self.stopped():
+                self.emit("stopped", set_id=set_id)
+                break
+            set_results = {mode: result for (done_set, mode), result in done.items() if done_set == set_id}
+            if set_id not in pending:
+                if set_results:
+                    self.emit("set_skip", set_id=set_id, title=title)
+                    results[set_id] = {"title": title, "results": set_results}
+                continue
+            with span("set", set_id=set_id):
+                self.emit("set_start", set_id=set_id, title=title, modes=pending[set_id])
+                stopped = self.run_set(set_id, pending[set_id], set_results)
+                if set_results or not stopped:
+                    results[set_id] = {"title": title, "results": set_results}
+            self.core.report_profile(set_id)
+            if stopped:
+                self.emit("stopped", set_id=set_id)
+                break
+        return results
+
+    def run_set(self, set_id, modes: list, set_results: dict) -> bool:
+        """Run a set's modes into ``set_results``; True if a stop was requested."""
+        for mode in modes:
+            if self.stopped():
+                return True
+            result, stopped = self.run_mode(set_id, mode)
+            if result is not None:
+                set_results[mode] = result
+            if stopped:
+                return True
+        return False
+
+    def run_mode(self, set_id, mode: str) -> tuple:
+        """(last result or None, stopped) for one mode, retrying up to ``attempts`` times."""
+        core = self.core
+        self.emit("mode_start", set_id=set_id, mode=mode)
+        mode_start = time.perf_counter()
+        num_d, word_d = core.load_words(set_id, self.class_id)
+        percent = core.site_percent(set_id, self.class_id, mode) if self.skip_complete else None
+        if percent is not None and percent >= 100:  # 범위 확인 없이 (브라우저만) 실행할 때는 여기서 확인
+            result = {"completed_words": num_d, "total_words": num_d, "percentage": percent}
+            self._done(set_id, mode, result, "skipped", mode_start, 0)
+            return result, False
+        result = None
+        start = 0  # 이어서 진행할 카드 (0 이면 처음부터)
+        attempts = 0
+        status = "failed"
+        while attempts < self.attempts:
+            attempts += 1
+            try:
+                completed_words, total_words = core.study(mode, num_d, word_d, start)
+            except Exception as e:
+                self.emit("mode_retry", set_id=set_id, mode=mode, attempt=attempts, error=str(e), kind=classify(e))
+                if attempts < self.attempts and not self.stopped():
+                    try:
+                        with span("recover", mode=mode):
+                            num_d, word_d, start = core.recover_mode(set_id, self.class_id, mode, e, attempts)
+                    except Exception:
+                        self._done(set_id, mode, result, "failed", mode_start, attempts)
+                        raise
+            else:
+                result = {
+                    "completed_words": completed_words,
+                    "total_words": total_words,
+                    "percentage": (completed_words / total_words) * 100 if total_words else 0.0,
+                }
+                if result["percentage"] >= 100:
+                    status = "done"
+                    break
+                status = "incomplete"
+                self.emit("mode_retry", set_id=set_id, mode=mode, attempt=attempts, result=result)
+                if attempts < self.attempts and not self.stopped():
+                    start = 0
+                    with span("retry_reload", mode=mode):
+                        num_d, word_d = core.load_words(set_id, self.class_id)
+            if self.stopped():
+                self._done(set_id, mode, result, "stopped", mode_start, attempts)
+                return result, True
+        self._done(set_id, mode, result, status, mode_start, attempts)
+        return result, False
+
+    def _done(self, set_id, mode, result, status, mode_start, attempts):
+        self.emit("mode_done", set_id=set_id, mode=mode, result=result, status=status,
+                  seconds=time.perf_counter() - mode_start, attempts=attempts)
@@ -0,0 +1,98 @@
+import json
+import os
+import time
+
+from selenium.webdriver.common.by import By
+
+from probe import PRESENT, probe
+
+STATS_FILE = "selector_stats.json"
+
+
+def locator(selector: str) -> tuple:  # "/..." 또는 "(..." 은 XPath, 나머지는 CSS
+    if selector.startswith(("/", "(")):
+        return By.XPATH, selector
+    return By.CSS_SELECTOR, selector
+
+
+class SelectorRegistry:
+    """Per-element hit statistics for fallback selector lists, persisted between runs."""
+
+    def __init__(self, path: str = STATS_FILE):
+        self.path = path
+        self.stats = {}  # {element: {selector: {"hits", "misses", "time_lost"}}} (time_lost: 놓친 탐색의 대기 시간)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.stats = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARNING] 선택자 통계 로드 실패: {e}")
+            self.stats = {}
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[WARNING] 선택자 통계 저장 실패: {e}")
+
+    def _entry(self, element: str, selector: str) -> dict:
+        return self.stats.setdefault(element, {}).setdefault(
+            selector, {"hits": 0, "misses": 0, "time_lost": 0.0}
+        )
+
+    def ordered(self, element: str, candidates: list) -> list:
+        """Past winners first (by hit count), then the original order."""
+        known = self.stats.get(element, {})
+        return sorted(
+            candidates,
+            key=lambda selector: -known.get(selector, {}).get("hits", 0),
+        )
+
+    def record(self, element: str, selector: str, hit: bool, elapsed: float):
+        entry = self._entry(element, selector)
+        if hit:
+            entry["hits"] += 1
+        else:
+            entry["misses"] += 1
+            entry["time_lost"] = round(entry["time_lost"] + elapsed, 3)
+
+    def find(self, driver, element: str, candidates: list, timeout: float,
+             require: str = PRESENT, params: dict = None):
+        """Probe candidates in learned order; return (web_element, selector) or (None, None).
+
+        Candidates may be templates such as "//div[{i}]"; statistics are kept per
+        template and ``params`` fills them in for the lookup.
+        """
+        ordered = self.ordered(element, candidates)
+        start = time.perf_counter()
+        index, found = probe(driver, ordered, require, timeout, params=params)
+        elapsed = time.perf_counter() - start
+        if found is None:
+            for selector in ordered:
+                self.record(element, selector, False, elapsed)
+            return None, None
+        # 앞선 후보가 없어서 걸린 시간: 대체 선택자로 찾은 경우 그 대기 시간을 놓친 후보에 부과
+        for selector in ordered[:index]:
+            self.record(element, selector, False, elapsed)
+        self.record(element, ordered[index], True, elapsed)
+        return found, ordered[index]
+
+    def report(self, prefix: str = "") -> str:
+        lines = [f"{'element':<24}{'hit rate':>10}{'hits':>7}{'lost(s)':>10}  selector"]
+        for element, selectors in sorted(self.stats.items()):
+            if not element.startswith(prefix):
+                continue
+            for selector, entry in sorted(selectors.items(), key=lambda item: -item[1]["hits"]):
+                tries = entry["hits"] + entry["misses"]
+                rate = entry["hits"] / tries * 100 if tries else 0.0
+                lines.append(
+                    f"{element:<24}{rate:>9.1f}%{entry['hits']:>7}{entry['time_lost']:>10.1f}  {selector}"
+                )
+        return "\n".join(lines)
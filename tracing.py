@@ -0,0 +1,164 @@
+import functools
+import json
+import math
+import os
+import time
+
+TRACE_DIR = "traces"
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_active = None  # 활성 Tracer (없으면 span() 은 아무것도 하지 않음)
+
+
+def span(name: str, **attrs):
+    """Time a phase under the active tracer; a shared no-op when tracing is off."""
+    if _active is None:
+        return _NULL_SPAN
+    return _Span(_active, name, attrs)
+
+
+def active():
+    return _active
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "attrs", "start")
+
+    def __init__(self, tracer, name: str, attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):  # 종료 전에 결과 값 등을 덧붙임
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        tracer = self.tracer
+        tracer._stack.append(self.name)
+        self.start = time.perf_counter()
+        if tracer._origin is None:  # 실행의 첫 span 시작 = 0초
+            tracer._origin = self.start
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        tracer = self.tracer
+        path = "/".join(tracer._stack)
+        tracer._stack.pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        tracer._record(self.name, path, self.start, duration, self.attrs)
+        return False
+
+
+def traced(name: str, *arg_names, run: bool = False, **attrs):
+    """Decorator form of span(); ``arg_names`` copies those call arguments into the span.
+
+    With ``run=True`` the trace file is finished when the outermost such call returns.
+    """
+    def decorate(func):
+        positions = {arg: func.__code__.co_varnames.index(arg) for arg in arg_names}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _active
+            if tracer is None:
+                return func(*args, **kwargs)
+            values = dict(attrs)
+            for arg, position in positions.items():
+                values[arg] = kwargs[arg] if arg in kwargs else args[position] if position < len(args) else None
+            try:
+                with _Span(tracer, name, values):
+                    return func(*args, **kwargs)
+            finally:
+                if run:
+                    tracer.finish_run()
+        return wrapper
+    return decorate
+
+
+def percentile(values: list, fraction: float) -> float:  # nearest-rank
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class Tracer:
+    """Nested timing spans (set → mode → card → step) written as one JSONL trace per run."""
+
+    def __init__(self, directory: str = TRACE_DIR):
+        self.directory = directory
+        self.path = None
+        self._file = None
+        self._stack = []
+        self._durations = {}  # {span 이름: [초, ...]}
+        self._origin = None
+
+    def install(self):
+        global _active
+        _active = self
+        return self
+
+    def uninstall(self):
+        global _active
+        if _active is self:
+            _active = None
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, time.strftime("run-%Y%m%d-%H%M%S.jsonl"))
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _record(self, name: str, path: str, start: float, duration: float, attrs: dict):
+        if self._file is None:
+            self._open()
+        self._durations.setdefault(name, []).append(duration)
+        entry = {
+            "span": name,
+            "path": path,
+            "depth": len(self._stack),
+            "start": round(start - self._origin, 6),
+            "duration": round(duration, 6),
+        }
+        if attrs:
+            entry.update(attrs)
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    def summary(self) -> str:
+        lines = [f"{'step':<16}{'count':>7}{'total(s)':>10}{'p50(ms)':>10}{'p95(ms)':>10}"]
+        for name, values in sorted(self._durations.items(), key=lambda item: -sum(item[1])):
+            lines.append(
+                f"{name:<16}{len(values):>7}{sum(values):>10.2f}"
+                f"{percentile(values, 0.5) * 1000:>10.1f}{percentile(values, 0.95) * 1000:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def finish_run(self):
+        """Close this run's trace (with a summary record) and print the p50/p95 table."""
+        if self._file is None or self._stack:  # 바깥 실행이 끝날 때 한 번만
+            return
+        self._file.write(json.dumps({
+            "summary": {
+                name: {"count": len(values), "total": round(sum(values), 6),
+                       "p50": round(percentile(values, 0.5), 6), "p95": round(percentile(values, 0.95), 6)}
+                for name, values in self._durations.items()
+            }
+        }, ensure_ascii=False) + "\n")
+        self._file.close()
+        print(f"[TRACE] {self.path}\n{self.summary()}")
+        self._file = None
+        self._durations = {}
+        self._origin = None
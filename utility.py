@@ -3,11 +3,256 @@ import os
 import time
 
 import requests
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import NavigableString, PreformattedString
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 
+from http_client import ClassCardClient
+from navigation import CLASS_LIST, CLASS_SETS
+from probe import CLICKABLE, probe
+
+
+# 세트 페이지의 모든 카드 앞/뒷면 텍스트를 한 번의 script 호출로 수집
+WORD_EXTRACT_SCRIPT = """
+function cardText(el) {
+    if (!el) return "";
+    var out = [];
+    (function walk(node) {
+        if (node.nodeType === 3) { out.push(node.nodeValue); return; }
+        if (node.nodeType !== 1) return;
+        var tag = node.tagName;
+        if (tag === "SCRIPT" || tag === "STYLE") return;
+        if (tag === "BR") { out.push("\\n"); return; }
+        var block = /^(DIV|P|LI|UL|OL|TR|TABLE)$/.test(tag);
+        if (block) out.push("\\n");
+        for (var c = node.firstChild; c; c = c.nextSibling) walk(c);
+        if (block) out.push("\\n");
+    })(el);
+    return out.join("").split("\\n").map(function (line) {
+        return line.replace(/\\s+/g, " ").trim();
+    }).filter(function (line) { return line; }).join("\\n");
+}
+function pick(card, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = card.querySelector(selectors[i]);
+        var text = cardText(el);
+        if (text) return text;
+    }
+    return "";
+}
+var cards = document.querySelectorAll("#tab_set_all > div:nth-of-type(2) > div");
+if (!cards.length) cards = document.querySelectorAll(".flip-body .flip-card");
+var words = [];
+for (var i = 0; i < cards.length; i++) {
+    words.push([
+        pick(cards[i], [
+            ":scope > div:nth-of-type(4) > div:nth-of-type(1) > div:nth-of-type(1) > div > div",
+            ".card-front .card-text"
+        ]),
+        pick(cards[i], [
+            ":scope > div:nth-of-type(4) > div:nth-of-type(2) > div:nth-of-type(1) > div > div",
+            ".card-back .card-text"
+        ])
+    ]);
+}
+return words;
+"""
+
+
+# 클래스 목록 / 세트 목록을 각각 한 번의 script 호출로 수집 (get_classes, get_sets)
+CLASS_LIST_SCRIPT = """
+var list = document.querySelector(arguments[0]) || document.querySelector("div.left-class-list");
+if (!list) return null;
+var links = list.querySelectorAll("a"), rows = [];
+for (var i = 0; i < links.length; i++) {
+    rows.push([(links[i].innerText || "").trim(), links[i].href || links[i].getAttribute("href") || ""]);
+}
+return rows;
+"""
+SET_LIST_SCRIPT = """
+var container = document.evaluate(arguments[0], document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!container) return null;
+var items = container.getElementsByClassName("set-items"), rows = [];
+for (var i = 0; i < items.length; i++) {
+    var link = items[i].querySelector("a");
+    if (!link) return null;
+    var count = link.querySelector("span");
+    rows.push([count ? (count.innerText || "").trim() : "", (link.innerText || "").trim(),
+               link.getAttribute("data-idx")]);
+}
+return rows;
+"""
+
+
+def classes_from_rows(rows: list) -> dict:  # [[이름, href], ...] -> get_classes 와 같은 dict
+    class_dict = {}
+    for i, (class_name, href) in enumerate(rows):
+        class_id = href.split("/")[-1]
+        if class_id == "joinClass":
+            break
+        class_dict[i] = {"class_name": class_name, "class_id": class_id}
+    return class_dict
+
+
+def sets_from_rows(rows: list) -> dict:  # [[카드 수, 링크 텍스트, set_id], ...] -> get_sets 와 같은 dict
+    return {
+        i: {"card_num": card_num, "title": text.replace(card_num, ""), "set_id": set_id}
+        for i, (card_num, text, set_id) in enumerate(rows)
+    }
+
+
+def class_list_script(driver: webdriver.Chrome):  # 한 번의 왕복으로 클래스 목록 추출
+    try:
+        rows = driver.execute_script(CLASS_LIST_SCRIPT, CLASS_LIST)
+    except Exception as e:
+        print(f"[WARNING] Script class extraction failed: {e}")
+        return None
+    return classes_from_rows(rows) if rows is not None else None
+
+
+def set_list_script(driver: webdriver.Chrome):  # 한 번의 왕복으로 세트 목록 추출
+    try:
+        rows = driver.execute_script(SET_LIST_SCRIPT, CLASS_SETS)
+    except Exception as e:
+        print(f"[WARNING] Script set extraction failed: {e}")
+        return None
+    return sets_from_rows(rows) if rows is not None else None
+
+
+def split_meaning(ko_text: str) -> tuple:  # 한글단어를 뜻과 예문으로 나눔
+    ko_d = ko_text.strip().split("\n")
+    if len(ko_d) != 1:  # 예문이 있으면
+        return ko_d[0], f"{ko_d[0]} {ko_d[1]}"  # 뜻, 뜻과 예문
+    return ko_d[0], ko_d[0]  # 뜻만 저장
+
+
+def words_from_cards(cards: list, num_d: int, source: str):  # [앞면, 뒷면] 목록 -> 단어 리스트
+    if not cards or len(cards) < num_d:
+        print(f"[WARNING] {source} word extraction found {len(cards or [])}/{num_d} cards")
+        return None
+    da_e, da_k, da_kyn = [], [], []
+    for i, (front, back) in enumerate(cards[:num_d]):
+        if not front or not back:
+            print(f"[WARNING] {source} word extraction missing text for index {i}")
+            return None
+        meaning, meaning_example = split_meaning(back)
+        da_e.append(front.strip())
+        da_k.append(meaning)
+        da_kyn.append(meaning_example)
+    return [da_e, da_k, da_kyn]
+
+
+def word_get_script(driver: webdriver.Chrome, num_d: int):  # 한 번의 왕복으로 단어 추출
+    try:
+        cards = driver.execute_script(WORD_EXTRACT_SCRIPT)
+    except Exception as e:
+        print(f"[WARNING] Script word extraction failed: {e}")
+        return None
+    return words_from_cards(cards, num_d, "Script")
+
+
+HTML_PARSERS = ("html.parser", "lxml")
+DEFAULT_HTML_PARSER = "html.parser"
+_BLOCK_TAGS = {"div", "p", "li", "ul", "ol", "tr", "table"}
+
+
+def make_soup(html: str, parser: str = None) -> BeautifulSoup:  # 파서 백엔드 선택 (lxml 없으면 html.parser)
+    parser = parser or DEFAULT_HTML_PARSER
+    try:
+        return BeautifulSoup(html, parser)
+    except FeatureNotFound:
+        print(f"[WARNING] HTML parser '{parser}' not installed, using {DEFAULT_HTML_PARSER}")
+        return BeautifulSoup(html, DEFAULT_HTML_PARSER)
+
+
+def card_text(element) -> str:  # WORD_EXTRACT_SCRIPT 의 cardText 와 동일한 규칙
+    if element is None:
+        return ""
+    out = []
+
+    def walk(node):
+        if isinstance(node, NavigableString):
+            if not isinstance(node, PreformattedString):  # 주석, CDATA 등 제외
+                out.append(str(node))
+            return
+        if node.name in ("script", "style"):
+            return
+        if node.name == "br":
+            out.append("\n")
+            return
+        block = node.name in _BLOCK_TAGS
+        if block:
+            out.append("\n")
+        for child in node.children:
+            walk(child)
+        if block:
+            out.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(out).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _child_div(element, path: tuple):  # XPath div[n]/div[m]/... 와 같은 위치 탐색 (1부터 시작)
+    for n in path:
+        if element is None:
+            return None
+        divs = element.find_all("div", recursive=False)
+        element = divs[n - 1] if len(divs) >= n else None
+    return element
+
+
+def _card_side_text(card, side: int) -> str:  # side 1 = 앞면(영어), 2 = 뒷면(한글)
+    text = card_text(_child_div(card, (4, side, 1, 1, 1)))
+    if not text:
+        css_class = "card-front" if side == 1 else "card-back"
+        side_ele = card.find("div", class_=css_class)
+        text = card_text(side_ele.find("div", class_="card-text") if side_ele else None)
+    return text
+
+
+def word_parse(html, num_d: int = None, parser: str = None):  # page_source 스냅샷에서 단어 추출
+    soup = html if isinstance(html, BeautifulSoup) else make_soup(html, parser)
+    cards = _child_div(soup.find(id="tab_set_all"), (2,))
+    cards = cards.find_all("div", recursive=False) if cards else []
+    if not cards:
+        cards_ele = soup.find("div", class_="flip-body")
+        cards = cards_ele.find_all("div", class_="flip-card") if cards_ele else []
+    if num_d is None:
+        num_d = len(cards)
+    pairs = [[_card_side_text(card, 1), _card_side_text(card, 2)] for card in cards[:num_d]]
+    return words_from_cards(pairs, num_d, "HTML")
+
+
+def parse_classes(html, parser: str = None) -> dict:  # 메인 화면 HTML -> get_classes 와 같은 dict
+    soup = html if isinstance(html, BeautifulSoup) else make_soup(html, parser)
+    class_list = soup.select_one(CLASS_LIST) or soup.find("div", class_="left-class-list")
+    links = class_list.find_all("a") if class_list else []
+    return classes_from_rows([[card_text(link), link.get("href") or ""] for link in links])
+
+
+def parse_sets(html, parser: str = None) -> dict:  # 클래스 화면 HTML -> get_sets 와 같은 dict
+    soup = html if isinstance(html, BeautifulSoup) else make_soup(html, parser)
+    sets_div = _child_div(soup.body, (1, 2, 1, 1, 2, 3, 1))  # navigation.CLASS_SETS 와 같은 위치
+    sets = sets_div.find_all("div", class_="set-items") if sets_div else soup.find_all("div", class_="set-items")
+    rows = []
+    for set_item in sets:
+        link = set_item.find("a")
+        rows.append([card_text(link.find("span")), card_text(link), link.get("data-idx")])
+    return sets_from_rows(rows)
+
 
 def word_get(driver: webdriver.Chrome, num_d: int) -> list:
+    word_d = word_get_script(driver, num_d)
+    if word_d is None:
+        print("[INFO] Falling back to per-card word extraction")
+        word_d = word_get_legacy(driver, num_d)
+    return word_d  # 영어단어, 한글단어, 뜻과 예문 (목록 출력은 호출하는 쪽에서)
+
+
+def word_get_legacy(driver: webdriver.Chrome, num_d: int) -> list:  # 카드별 XPath 조회 (fallback)
     da_e = ["" for _ in range(num_d)]
     da_k = ["" for _ in range(num_d)]
     da_kyn = ["" for _ in range(num_d)]
@@ -48,18 +293,12 @@ def word_get(driver: webdriver.Chrome, num_d: int) -> list:
                 "//div[@class='card-list-title']//a[1]"
             ]
             
-            korean_clicked = False
-            for selector in korean_selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR if selector.startswith("#") else By.XPATH, selector)
-                    if element.is_displayed() and element.is_enabled():
-                        element.click()
-                        print("[DEBUG] Korean toggle clicked")
-                        korean_clicked = True
-                        time.sleep(1)
-                        break
-                except:
-                    continue
+            _, element = probe(driver, korean_selectors, CLICKABLE)
+            korean_clicked = element is not None
+            if korean_clicked:
+                element.click()
+                print("[DEBUG] Korean toggle clicked")
+                time.sleep(1)
             
             if not korean_clicked:
                 print("[WARNING] Could not click Korean toggle button")
@@ -88,12 +327,7 @@ def word_get(driver: webdriver.Chrome, num_d: int) -> list:
                         continue
                 
                 if ko_d:
-                    ko_d = ko_d.split("\n")  # 한글단어를 뜻과 예문으로 나눔
-                    da_k[i] = f"{ko_d[0]}"  # 뜻만 저장
-                    if len(ko_d) != 1:  # 예문이 있으면
-                        da_kyn[i] = f"{ko_d[0]} {ko_d[1]}"  # 뜻과 예문 저장
-                    else:
-                        da_kyn[i] = f"{ko_d[0]}"  # 뜻만 저장
+                    da_k[i], da_kyn[i] = split_meaning(ko_d)
                 else:
                     print(f"[WARNING] Could not find Korean word for index {i}")
                     
@@ -103,9 +337,6 @@ def word_get(driver: webdriver.Chrome, num_d: int) -> list:
     except Exception as e:
         print(f"[ERROR] Error in word_get: {e}")
 
-    print("[DEBUG] 영어단어 리스트:", da_e)
-    print("[DEBUG] 한글단어 리스트:", da_k)
-    print("[DEBUG] 뜻+예문 리스트:", da_kyn)
     return [da_e, da_k, da_kyn]  # 영어단어, 한글단어, 뜻과 예문
 
 
@@ -193,22 +424,23 @@ def choice_class(class_dict: dict) -> int:  # 학습할 반 선택
     return ch_c - 1
 
 
-def check_id(id: str, pw: str) -> bool:
+def check_id(id: str, pw: str) -> bool:  # 네트워크/서버 오류는 requests.RequestException 으로 전달
     print("계정 정보를 확인하고 있습니다 잠시만 기다려주세요!")
-    headers = {"Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"}
-    data = {"login_id": id, "login_pwd": pw}
-    res = requests.post(
-        "https://www.classcard.net/LoginProc", headers=headers, data=data
-    )
-    status = res.json()
-    return status["result"] == "ok"
+    return ClassCardClient().authenticate(id, pw)  # 성공 시 쿠키가 저장되어 브라우저 로그인에 재사용됨
 
 
 def save_id() -> dict:
     while True:
         id = input("아이디를 입력하세요 : ")
         password = input("비밀번호를 입력하세요 : ")
-        if check_id(id, password):
+        while True:
+            try:
+                valid = check_id(id, password)
+                break
+            except requests.RequestException as e:
+                print(f"[ERROR] 서버에 연결할 수 없습니다: {e}")
+                input("네트워크 연결을 확인한 뒤 Enter 를 누르면 다시 시도합니다.")
+        if valid:
             data = {"id": id, "pw": password}
             with open("config.json", "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
@@ -0,0 +1,115 @@
+from selenium.common.exceptions import WebDriverException
+
+from tracing import span
+
+# 단계별 최대 대기 시간 (초) - 조건이 먼저 충족되면 즉시 반환
+TIMEOUTS = {
+    "card_advance": 5.0,  # 다음 카드가 활성화될 때까지
+    "click_settle": 2.0,  # 클릭 후 화면 변화 (피드백, 팝업 등)
+    "learn_ready": 10.0,  # 학습 화면 진입/시작 버튼 표시
+    "navigation": 10.0,  # 페이지 이동, 학습 종료 후 세트 화면 복귀
+}
+
+# 조건 목록 중 하나라도 충족되면 그 인덱스를, 시간 초과면 -1 을 반환.
+# 조건 검사는 MutationObserver 로 DOM 변경이 있을 때만 다시 수행한다.
+WAIT_SCRIPT = """
+var conditions = arguments[0], rootSelector = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var mutated = false;
+function resolve(selector) {
+    var first = selector.charAt(0);
+    if (first === "/" || first === "(") {
+        return document.evaluate(selector, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+function visible(el) {
+    if (!el || !el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.display !== "none";
+}
+function met(condition) {
+    var kind = condition[0], el = null;
+    if (kind === "mutation") return mutated;
+    if (kind === "all") {
+        for (var j = 1; j < condition.length; j++) { if (!met(condition[j])) return false; }
+        return true;
+    }
+    try { el = resolve(condition[1]); } catch (e) { return false; }
+    if (kind === "present") return !!el;
+    if (kind === "absent") return !el;
+    if (kind === "visible") return visible(el);
+    if (kind === "hidden") return !visible(el);
+    if (kind === "text_changed") return !el || (el.innerText || "").trim() !== condition[2];
+    return false;
+}
+function check() {
+    for (var i = 0; i < conditions.length; i++) {
+        if (met(conditions[i])) return i;
+    }
+    return -1;
+}
+var initial = check();
+if (initial >= 0) { done(initial); return; }
+var finished = false, observer = null, timer = null;
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+var root = (rootSelector && resolve(rootSelector)) || document.documentElement;
+observer = new MutationObserver(function () {
+    mutated = true;
+    var index = check();
+    if (index >= 0) finish(index);
+});
+observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+timer = setTimeout(function () { finish(check()); }, timeoutMs);
+"""
+
+
+def _listed(condition):
+    if condition[0] == "all":
+        return ["all"] + [_listed(part) for part in condition[1:]]
+    return list(condition)
+
+
+def wait_for(driver, conditions: list, step: str = "card_advance", timeout: float = None,
+             root: str = None) -> int:
+    """Wait until one of the conditions holds; return its index, or -1 on timeout.
+
+    Conditions are tuples such as ("visible", selector), ("absent", selector),
+    ("text_changed", selector, old_text), ("mutation",) or ("all", cond, ...).
+    Selectors are CSS or XPath (starting with "/" or "(").
+    """
+    timeout = TIMEOUTS[step] if timeout is None else timeout
+    try:
+        with span("wait", step=step):
+            if timeout > 25:  # 기본 script timeout(30초)보다 긴 대기만 조정
+                driver.set_script_timeout(timeout + 5)
+            index = driver.execute_async_script(
+                WAIT_SCRIPT, [_listed(condition) for condition in conditions], root, int(timeout * 1000)
+            )
+    except WebDriverException as e:
+        print(f"[DEBUG] Wait ({step}) failed: {e}")
+        return -1
+    if index is None or index < 0:
+        print(f"[DEBUG] Wait ({step}) timed out after {timeout:.1f}s: {conditions}")
+        return -1
+    return index
+
+
+def wait_visible(driver, selector: str, step: str = "card_advance", timeout: float = None) -> bool:
+    return wait_for(driver, [("visible", selector)], step, timeout) >= 0
+
+
+def wait_absent(driver, selector: str, step: str = "navigation", timeout: float = None) -> bool:
+    return wait_for(driver, [("absent", selector)], step, timeout) >= 0
+
+
+def wait_text_changed(driver, selector: str, old_text: str, step: str = "card_advance",
+                      timeout: float = None) -> bool:
+    return wait_for(driver, [("text_changed", selector, old_text)], step, timeout) >= 0
@@ -0,0 +1,220 @@
+import re
+import sys
+import unicodedata
+from collections import Counter
+from difflib import SequenceMatcher
+
+ENGLISH = "english"
+KOREAN = "korean"
+MIN_SCORE = 0.8  # 유사 매칭으로 인정하는 최소 유사도
+CHARS_PER_EDIT = 8  # 유사 매칭에서 허용하는 편집 1회당 필요한 글자 수 (짧은 단어는 정확히 일치해야 함: effect/affect)
+MARGIN = 0.05  # 1, 2위 후보의 유사도가 이보다 가까우면 애매한 것으로 보고 매칭하지 않음
+FUZZY_CANDIDATES = 5  # trigram 이 많이 겹치는 순으로 유사도를 계산할 후보 수
+_BRACKETS = re.compile(r"\([^)]*\)|\[[^\]]*\]|\{[^}]*\}|<[^>]*>")
+_DIGITS = re.compile(r"\d+")
+
+
+def normalize_key(text) -> str:  # 조회용 키 정규화 (공백 정리 + intern)
+    return sys.intern(" ".join(str(text).split()))
+
+
+def _strip_punctuation(text: str) -> str:
+    return " ".join("".join(" " if unicodedata.category(c)[0] in "PS" else c for c in text).split())
+
+
+def canonical(text) -> str:
+    """Canonical form for matching: NFKC, casefold, no accents, first line only, no bracketed notes or punctuation."""
+    text = unicodedata.normalize("NFKC", str(text)).strip().split("\n")[0].casefold()
+    if not text.isascii():  # 라틴 문자의 악센트 제거 (café → cafe), 한글은 NFC 로 다시 조합
+        text = unicodedata.normalize("NFC", "".join(
+            c for c in unicodedata.normalize("NFD", text) if not unicodedata.combining(c)))
+    return _strip_punctuation(_BRACKETS.sub(" ", text)) or _strip_punctuation(text)
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Edit similarity (0..1) of two canonical strings; 0 when their numbers differ ("step 1" vs "step 2")."""
+    if _DIGITS.findall(a) != _DIGITS.findall(b):
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def edit_count(a: str, b: str) -> int:
+    """Characters inserted, deleted or replaced to turn a into b (from SequenceMatcher opcodes)."""
+    return sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b).get_opcodes()
+               if tag != "equal")
+
+
+def allowed_edits(a: str, b: str) -> int:  # 짧은 쪽 길이 기준: 8자 미만 0회, 8~15자 1회, ...
+    return min(len(a), len(b)) // CHARS_PER_EDIT
+
+
+class WordEntry:
+    __slots__ = ("index", "english", "korean", "meaning_example")
+
+    def __init__(self, index: int, english: str, korean: str, meaning_example: str):
+        self.index = index
+        self.english = english
+        self.korean = korean
+        self.meaning_example = meaning_example
+
+    def __repr__(self) -> str:
+        return f"WordEntry({self.index}, {self.english!r}, {self.korean!r})"
+
+
+class WordBank:
+    """Indexed word list built once from word_get output (영어단어, 한글단어, 뜻과 예문)."""
+
+    __slots__ = ("entries", "_by_english", "_by_korean", "_canonical", "_grams")
+
+    def __init__(self, entries: list):
+        self.entries = entries
+        self._by_english = {}
+        self._by_korean = {}
+        self._canonical = {ENGLISH: {}, KOREAN: {}}  # 정규화 형태 → 항목
+        self._grams = None  # 유사 매칭용 trigram 색인 (처음 필요할 때 생성)
+        for entry in entries:
+            # 중복 단어는 list.index() 와 동일하게 첫 번째 항목을 유지
+            if entry.english:
+                self._by_english.setdefault(normalize_key(entry.english), entry)
+                self._canonical[ENGLISH].setdefault(canonical(entry.english), entry)
+            if entry.korean:
+                self._by_korean.setdefault(normalize_key(entry.korean), entry)
+                self._canonical[KOREAN].setdefault(canonical(entry.korean), entry)
+
+    @classmethod
+    def from_word_d(cls, word_d) -> "WordBank":
+        if isinstance(word_d, cls):
+            return word_d
+        da_e, da_k, da_kyn = word_d
+        entries = [
+            WordEntry(i, da_e[i], da_k[i], da_kyn[i] if i < len(da_kyn) else "")
+            for i in range(len(da_e))
+        ]
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):  # da_e, da_k, da_kyn = bank 형태의 기존 코드 호환
+        yield [entry.english for entry in self.entries]
+        yield [entry.korean for entry in self.entries]
+        yield [entry.meaning_example for entry in self.entries]
+
+    def by_english(self, text: str):
+        return self._by_english.get(normalize_key(text))
+
+    def by_korean(self, text: str):
+        return self._by_korean.get(normalize_key(text))
+
+    def korean_for(self, english: str):
+        entry = self.by_english(english)
+        return entry.korean if entry else None
+
+    def english_for(self, korean: str):
+        entry = self.by_korean(korean)
+        return entry.english if entry else None
+
+    def meaning_example_for(self, english: str):
+        entry = self.by_english(english)
+        return entry.meaning_example if entry else None
+
+    def _exact(self, side: str, text: str):
+        index = self._by_english if side == ENGLISH else self._by_korean
+        entry = index.get(normalize_key(text))
+        return entry if entry is not None else self._canonical[side].get(canonical(text))
+
+    def _lookup(self, text: str, sides) -> tuple:
+        key = normalize_key(text)
+        for side in sides:
+            entry = (self._by_english if side == ENGLISH else self._by_korean).get(key)
+            if entry is not None:
+                return entry, side, key
+        key = canonical(text)
+        for side in sides:
+            entry = self._canonical[side].get(key)
+            if entry is not None:
+                return entry, side, key
+        return None, None, key
+
+    def _build_grams(self):
+        grams = {}
+        for side, index in self._canonical.items():
+            for key, entry in index.items():
+                for gram in _trigrams(key):
+                    grams.setdefault(gram, []).append((entry, side, key))
+        self._grams = grams
+
+    def _fuzzy(self, key: str, sides) -> tuple:
+        if self._grams is None:
+            self._build_grams()
+        overlap = Counter()
+        for gram in _trigrams(key):
+            for candidate in self._grams.get(gram, ()):
+                if candidate[1] in sides:
+                    overlap[candidate] += 1
+        best, best_score, runner_up = None, 0.0, 0.0
+        for candidate, _ in overlap.most_common(FUZZY_CANDIDATES):
+            score = similarity(key, candidate[2])
+            if score > best_score:
+                best, best_score, runner_up = candidate, score, best_score
+            elif score > runner_up:
+                runner_up = score
+        if best is None or best_score < MIN_SCORE or best_score - runner_up < MARGIN:
+            return None, None, best_score
+        if edit_count(key, best[2]) > allowed_edits(key, best[2]):  # 한 글자 차이의 다른 단어 (먹다/먹이다)
+            return None, None, best_score
+        return best[0], best[1], best_score
+
+    def match(self, text: str, sides=(ENGLISH, KOREAN), fuzzy: bool = True) -> tuple:
+        """(entry, side, score) for card text: exact or canonical match scores 1.0, otherwise the
+        closest entry by trigram/edit similarity; (None, None, best score) below MIN_SCORE, when
+        ambiguous, when it is more edits away than its length allows, or with ``fuzzy`` off."""
+        entry, side, key = self._lookup(text, sides)
+        if entry is not None:
+            return entry, side, 1.0
+        if not key or not fuzzy:
+            return None, None, 0.0
+        return self._fuzzy(key, sides)
+
+    def answer_for(self, prompt: str, fuzzy: bool = True):
+        """Return the opposite side of the card for a prompt, or None if unknown."""
+        # 알파벳이 있으면 영어 문제로 우선 처리
+        sides = (ENGLISH, KOREAN) if prompt.upper() != prompt.lower() else (KOREAN,)
+        entry, side, score = self.match(prompt, sides, fuzzy)
+        if entry is None:
+            return None
+        if score < 1.0:
+            print(f"[DEBUG] 유사 단어로 매칭: {prompt!r} → {getattr(entry, side)!r} ({score:.2f})")
+        return entry.korean if side == ENGLISH else entry.english
+
+    def is_pair(self, prompt: str, choice: str) -> bool:
+        """True if choice is the counterpart of prompt (리콜학습 선택지 판정)."""
+        for choice_side, prompt_side in ((KOREAN, ENGLISH), (ENGLISH, KOREAN)):
+            entry = self._exact(choice_side, choice)
+            if entry is not None:
+                expected = getattr(entry, prompt_side)
+                return normalize_key(prompt) == normalize_key(expected) or canonical(prompt) == canonical(expected)
+        return False
+
+    def choose(self, prompt: str, choices: list):
+        """Index of the choice that answers prompt: exact/canonical pairs first, then the closest
+        choice to the prompt's fuzzy-matched counterpart; None if no choice is close enough."""
+        for i, choice in enumerate(choices):
+            if self.is_pair(prompt, choice):
+                return i
+        entry, side, score = self.match(prompt)
+        if entry is None or not choices:
+            return None
+        answer = canonical(entry.korean if side == ENGLISH else entry.english)
+        scores = sorted(((similarity(canonical(choice), answer), i) for i, choice in enumerate(choices)), reverse=True)
+        best_score, best = scores[0]
+        runner_up = scores[1][0] if len(scores) > 1 else 0.0
+        if best_score * score < MIN_SCORE or best_score - runner_up < MARGIN:
+            return None
+        print(f"[DEBUG] 유사 선택지로 매칭: {prompt!r} → {choices[best]!r} ({best_score * score:.2f})")
+        return best
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+from word_bank import WordBank
+
+CACHE_FILE = "word_cache.json"
+MAX_ENTRIES = 200
+
+
+def content_fingerprint(cards_ele) -> str:  # flip-body 텍스트 기반 세트 내용 지문
+    text = cards_ele.get_text("\x1f", strip=True) if cards_ele is not None else ""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class WordCache:
+    """Disk-backed LRU cache of parsed word lists keyed by (set_id, class_id)."""
+
+    def __init__(self, path: str = CACHE_FILE, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._dirty = False  # hit 으로 바뀐 last_used 가 아직 저장되지 않음
+        self._load()
+
+    @staticmethod
+    def _key(set_id, class_id) -> str:
+        return f"{set_id}/{class_id}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # 저장 순서 = 최근 사용 순서 (오래된 것 먼저)
+            for key, entry in sorted(data.items(), key=lambda item: item[1].get("last_used", 0)):
+                self._entries[key] = entry
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARNING] 단어 캐시 로드 실패, 새로 시작합니다: {e}")
+            self._entries.clear()
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[WARNING] 단어 캐시 저장 실패: {e}")
+
+    def get(self, set_id, class_id, card_num: int, fingerprint: str):
+        """Return the cached WordBank if card count and fingerprint still match.
+
+        A hit only updates the LRU order in memory; it reaches the file with the
+        next put/invalidate or flush().
+        """
+        key = self._key(set_id, class_id)
+        entry = self._entries.get(key)
+        if entry is None or entry["card_num"] != card_num or entry["fingerprint"] != fingerprint:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry["last_used"] = time.time()
+        self._entries.move_to_end(key)
+        self._dirty = True
+        return WordBank.from_word_d(entry["word_d"])
+
+    def put(self, set_id, class_id, card_num: int, fingerprint: str, word_d):
+        key = self._key(set_id, class_id)
+        self._entries[key] = {
+            "card_num": card_num,
+            "fingerprint": fingerprint,
+            "word_d": [list(words) for words in word_d],
+            "last_used": time.time(),
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._save()
+
+    def invalidate(self, set_id, class_id):
+        if self._entries.pop(self._key(set_id, class_id), None) is not None:
+            self._save()
+
+    def flush(self):
+        if self._dirty:
+            self._save()
+
+    def stats(self) -> str:
+        return f"단어 캐시 hit {self.hits} / miss {self.misses} (저장된 세트 {len(self._entries)}개)"